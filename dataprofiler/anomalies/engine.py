@@ -0,0 +1,128 @@
+import warnings
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+
+from dataprofiler.config import ANOMALY_BLOCK_ELEMENTS, IQR_FACTOR, ZSCORE_THRESHOLD
+
+METHODS = ("iqr", "zscore")
+_OUTPUTS = ("counts", "indices", "bitmap")
+
+Bounds = Dict[str, Tuple[np.ndarray, np.ndarray]]
+
+
+def _columns(df: pd.DataFrame, columns: Optional[List[str]]) -> List[str]:
+    return columns or df.select_dtypes(include=["number"]).columns.tolist()
+
+
+def _arrays(df: pd.DataFrame, cols: List[str]) -> List[np.ndarray]:
+    # Zero-copy for float64 columns; blocks are stacked from these.
+    return [df[c].to_numpy(dtype=np.float64, na_value=np.nan) for c in cols]
+
+
+def bounds_from_stats(numeric_stats: Dict[str, Dict[str, Any]], cols: List[str], methods: Sequence[str] = METHODS) -> Bounds:
+    """Reads the bounds ``compute_numeric`` already put in ``outlier_ranges``."""
+    out: Bounds = {}
+    for method in methods:
+        ranges = [numeric_stats[c]["outlier_ranges"][method] for c in cols]
+        lower = np.array([np.nan if r["lower"] is None else r["lower"] for r in ranges], dtype=np.float64)
+        upper = np.array([np.nan if r["upper"] is None else r["upper"] for r in ranges], dtype=np.float64)
+        out[method] = (lower, upper)
+    return out
+
+
+def column_moments(arrays: List[np.ndarray], ddof: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        mu = np.array([np.nanmean(a) if a.size else np.nan for a in arrays], dtype=np.float64)
+        sigma = np.array([np.nanstd(a, ddof=ddof) if a.size else np.nan for a in arrays], dtype=np.float64)
+    return mu, sigma
+
+
+def compute_bounds(
+    arrays: List[np.ndarray],
+    methods: Sequence[str] = METHODS,
+    factor: float = IQR_FACTOR,
+    threshold: float = ZSCORE_THRESHOLD,
+    ddof: int = 0,
+) -> Bounds:
+    k = len(arrays)
+    out: Bounds = {}
+    with warnings.catch_warnings():
+        # All-NaN columns give NaN bounds, which flag nothing.
+        warnings.simplefilter("ignore", RuntimeWarning)
+        if "iqr" in methods:
+            q = np.array([np.nanquantile(a, [0.25, 0.75]) if a.size else [np.nan, np.nan] for a in arrays]).reshape(k, 2)
+            iqr = q[:, 1] - q[:, 0]
+            out["iqr"] = (q[:, 0] - factor * iqr, q[:, 1] + factor * iqr)
+    if "zscore" in methods:
+        mu, sigma = column_moments(arrays, ddof)
+        out["zscore"] = zscore_bounds(mu, sigma, threshold)
+    return out
+
+
+def zscore_bounds(mu: np.ndarray, sigma: np.ndarray, threshold: float = ZSCORE_THRESHOLD) -> Tuple[np.ndarray, np.ndarray]:
+    # A constant column has no outliers.
+    sigma = np.where(sigma == 0, np.nan, sigma)
+    return mu - threshold * sigma, mu + threshold * sigma
+
+
+def _blocks(arrays: List[np.ndarray], n: int) -> Iterator[Tuple[int, np.ndarray]]:
+    # Row blocks are a multiple of 8 so packed bitmaps concatenate cleanly.
+    rows = max(8, (ANOMALY_BLOCK_ELEMENTS // max(len(arrays), 1)) // 8 * 8)
+    for start in range(0, n, rows):
+        yield start, np.column_stack([a[start:start + rows] for a in arrays])
+
+
+def outlier_masks(
+    df: pd.DataFrame,
+    columns: Optional[List[str]] = None,
+    bounds: Optional[Bounds] = None,
+    output: str = "counts",
+    methods: Sequence[str] = METHODS,
+    factor: float = IQR_FACTOR,
+    threshold: float = ZSCORE_THRESHOLD,
+    ddof: int = 0,
+) -> Dict[str, Any]:
+    """Evaluates every method over all columns as one 2-D comparison per row block.
+
+    Per method the result holds ``lower``/``upper``/``counts`` arrays aligned
+    with ``columns`` and ``rows_flagged`` (rows with any flagged column), plus
+    per-column row-position arrays for ``output="indices"`` or a
+    ``(columns, ceil(rows / 8))`` packbits array for ``output="bitmap"``.
+    """
+    if output not in _OUTPUTS:
+        raise ValueError(f"output must be one of {_OUTPUTS}")
+    cols = _columns(df, columns)
+    arrays = _arrays(df, cols)
+    bounds = bounds or compute_bounds(arrays, methods, factor, threshold, ddof)
+    n, k = len(df), len(cols)
+    acc = {m: {"counts": np.zeros(k, dtype=np.int64), "rows_flagged": 0, "parts": []} for m in methods}
+    for start, X in _blocks(arrays, n) if k else ():
+        for method in methods:
+            lower, upper = bounds[method]
+            # NaN compares False on both sides, so missing values never flag.
+            mask = (X < lower) | (X > upper)
+            a = acc[method]
+            a["counts"] += mask.sum(axis=0)
+            a["rows_flagged"] += int(mask.any(axis=1).sum())
+            if output == "indices":
+                c, r = np.nonzero(mask.T)
+                a["parts"].append((c, r + start))
+            elif output == "bitmap":
+                a["parts"].append(np.packbits(mask.T, axis=1))
+    out: Dict[str, Any] = {"columns": cols, "rows": n}
+    for method in methods:
+        a = acc[method]
+        lower, upper = bounds[method]
+        res = {"lower": lower, "upper": upper, "counts": a["counts"], "rows_flagged": a["rows_flagged"]}
+        if output == "indices":
+            c = np.concatenate([p[0] for p in a["parts"]]) if a["parts"] else np.empty(0, dtype=np.int64)
+            r = np.concatenate([p[1] for p in a["parts"]]) if a["parts"] else np.empty(0, dtype=np.int64)
+            # Stable on column keeps each column's rows in ascending order.
+            r = r[np.argsort(c, kind="stable")]
+            res["indices"] = np.split(r, np.cumsum(a["counts"])[:-1]) if k else []
+        elif output == "bitmap":
+            res["bitmap"] = np.concatenate(a["parts"], axis=1) if a["parts"] else np.zeros((k, 0), dtype=np.uint8)
+        out[method] = res
+    return out
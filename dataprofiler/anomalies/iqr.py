@@ -1,21 +1,17 @@
 from typing import Dict, List, Optional
 import pandas as pd
 
+from .engine import outlier_masks
+
 
 def detect_iqr(df: pd.DataFrame, columns: Optional[List[str]] = None, factor: float = 1.5) -> Dict[str, Dict]:
-    cols = columns or df.select_dtypes(include=["number"]).columns.tolist()
+    res = outlier_masks(df, columns, output="indices", methods=("iqr",), factor=factor)
+    iqr = res["iqr"]
     out: Dict[str, Dict] = {}
-    for col in cols:
-        s = df[col].dropna().astype(float)
-        if s.empty:
+    for j, col in enumerate(res["columns"]):
+        lower, upper = float(iqr["lower"][j]), float(iqr["upper"][j])
+        if pd.isna(lower):
             out[col] = {"lower": None, "upper": None, "indices": [], "count": 0}
             continue
-        q1 = float(s.quantile(0.25))
-        q3 = float(s.quantile(0.75))
-        iqr = q3 - q1
-        lower = q1 - factor * iqr
-        upper = q3 + factor * iqr
-        mask = (df[col] < lower) | (df[col] > upper)
-        idx = df.index[mask].tolist()
-        out[col] = {"lower": lower, "upper": upper, "indices": idx, "count": int(mask.sum())}
-    return out
\ No newline at end of file
+        out[col] = {"lower": lower, "upper": upper, "indices": df.index[iqr["indices"][j]].tolist(), "count": int(iqr["counts"][j])}
+    return out
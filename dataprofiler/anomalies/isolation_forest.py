@@ -1,20 +1,178 @@
-from typing import Dict, List, Optional
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional, Tuple, Union
+import numpy as np
 import pandas as pd
 
+from dataprofiler.config import IFOREST_SCORE_CHUNK_ROWS, IFOREST_TOP_K, IFOREST_TRAIN_ROWS, STREAMING_CHUNKSIZE
+from dataprofiler.utils import resolve_n_jobs
+from dataprofiler.utils.timer import stage
 
-def detect_isolation_forest(df: pd.DataFrame, columns: Optional[List[str]] = None, contamination: float = 0.01, random_state: Optional[int] = 42) -> Dict:
+_OUTPUTS = ("list", "array", "top_k")
+
+
+def _require_sklearn():
     try:
         from sklearn.ensemble import IsolationForest
     except Exception as e:
         raise ImportError("scikit-learn is required for isolation forest. Install with `pip install scikit-learn`") from e
-    cols = columns or df.select_dtypes(include=["number"]).columns.tolist()
-    X = df[cols].copy()
-    for c in cols:
-        med = X[c].median()
-        X[c] = X[c].fillna(med)
-    model = IsolationForest(n_estimators=100, contamination=contamination, random_state=random_state)
-    model.fit(X.values)
-    scores = model.decision_function(X.values)
-    labels = model.predict(X.values)
-    idx = df.index[labels == -1].tolist()
-    return {"scores": list(scores), "labels": list(map(int, labels)), "indices": idx, "count": int((labels == -1).sum())}
\ No newline at end of file
+    return IsolationForest
+
+
+def _numeric_columns(df: pd.DataFrame, columns: Optional[List[str]]) -> List[str]:
+    return columns or df.select_dtypes(include=["number"]).columns.tolist()
+
+
+def _matrix(df: pd.DataFrame, cols: List[str], fill: Optional[np.ndarray] = None) -> np.ndarray:
+    X = df[cols].to_numpy(dtype=np.float64, na_value=np.nan)
+    if fill is not None:
+        # np.where copies, so a view onto the caller's frame is never written.
+        missing = np.isnan(X)
+        if missing.any():
+            X = np.where(missing, fill, X)
+    return X
+
+
+def _fit(train: np.ndarray, contamination: Union[float, str], random_state: Optional[int], workers: int):
+    IsolationForest = _require_sklearn()
+    model = IsolationForest(n_estimators=100, contamination="auto", random_state=random_state, n_jobs=workers)
+    with stage("iforest.fit", rows=len(train)):
+        model.fit(train)
+        if contamination != "auto":
+            # What fit() does for a numeric contamination, without the model
+            # scoring its training rows a second time later on.
+            model.offset_ = float(np.percentile(model.score_samples(train), 100.0 * contamination))
+    # Scoring is parallelised over row chunks here, not over trees inside sklearn.
+    model.set_params(n_jobs=1)
+    return model
+
+
+def _score(model, X: np.ndarray, chunk_rows: int, pool: Optional[Executor]) -> np.ndarray:
+    # decision_function in one pass; predict() is just ``decision < 0``.
+    if len(X) == 0:
+        return np.empty(0, dtype=np.float64)
+    blocks = [X[i:i + chunk_rows] for i in range(0, len(X), chunk_rows)]
+    score = lambda block: model.score_samples(block) - model.offset_
+    parts = list(pool.map(score, blocks)) if pool is not None and len(blocks) > 1 else [score(b) for b in blocks]
+    return np.concatenate(parts)
+
+
+def _keep_lowest(best: Tuple[np.ndarray, np.ndarray], scores: np.ndarray, rows: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    scores = np.concatenate([best[0], scores])
+    rows = np.concatenate([best[1], rows])
+    if scores.size > k:
+        keep = np.argpartition(scores, k - 1)[:k]
+        scores, rows = scores[keep], rows[keep]
+    return scores, rows
+
+
+def _top_k_result(best: Tuple[np.ndarray, np.ndarray], count: int, rows: int, offset: float) -> Dict[str, Any]:
+    order = np.argsort(best[0], kind="stable")
+    return {"scores": best[0][order], "rows": best[1][order], "count": count, "total_rows": rows, "offset": offset}
+
+
+def _pool(workers: int):
+    return ThreadPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()
+
+
+def detect_isolation_forest(
+    df: pd.DataFrame,
+    columns: Optional[List[str]] = None,
+    contamination: float = 0.01,
+    random_state: Optional[int] = 42,
+    train_rows: Optional[int] = None,
+    n_jobs: Optional[int] = None,
+    chunk_rows: int = IFOREST_SCORE_CHUNK_ROWS,
+    output: str = "list",
+    top_k: int = IFOREST_TOP_K,
+) -> Dict:
+    """``train_rows`` bounds the fit to a uniform row sample (missing values
+    take the sample's medians); ``output`` is "list" (the historical shape),
+    "array" (NumPy scores/labels/indices) or "top_k" (only the ``top_k``
+    lowest-scoring rows, scored chunk by chunk)."""
+    if output not in _OUTPUTS:
+        raise ValueError(f"output must be one of {_OUTPUTS}")
+    cols = _numeric_columns(df, columns)
+    workers = resolve_n_jobs(n_jobs)
+    n = len(df)
+    if train_rows is not None and n > train_rows:
+        pick = np.sort(np.random.default_rng(random_state).choice(n, train_rows, replace=False))
+        sample = df.iloc[pick]
+    else:
+        sample = df
+    fill = np.nanmedian(_matrix(sample, cols), axis=0)
+    train = _matrix(sample, cols, fill)
+    model = _fit(train, contamination, random_state, workers)
+    del train
+
+    with _pool(workers) as pool, stage("iforest.score", rows=n):
+        if output == "top_k":
+            best = (np.empty(0, dtype=np.float64), np.empty(0, dtype=np.int64))
+            count = 0
+            # Rows are pulled out a chunk at a time, so only K scores outlive each step.
+            step = chunk_rows * workers
+            for start in range(0, n, step):
+                scores = _score(model, _matrix(df.iloc[start:start + step], cols, fill), chunk_rows, pool)
+                count += int((scores < 0).sum())
+                best = _keep_lowest(best, scores, np.arange(start, start + scores.size), top_k)
+            result = _top_k_result(best, count, n, model.offset_)
+            result["indices"] = df.index[result["rows"]].to_numpy()
+            return result
+        scores = _score(model, _matrix(df, cols, fill), chunk_rows, pool)
+    outliers = scores < 0
+    labels = np.where(outliers, -1, 1).astype(np.int8)
+    idx = df.index[outliers]
+    if output == "array":
+        return {"scores": scores, "labels": labels, "indices": idx.to_numpy(), "count": int(outliers.sum())}
+    return {"scores": list(scores), "labels": list(map(int, labels)), "indices": idx.tolist(), "count": int(outliers.sum())}
+
+
+def _frames(source: Any, chunksize: int) -> Any:
+    if isinstance(source, str):
+        from dataprofiler.ingestion import load_data
+        return load_data(source, chunksize=chunksize)
+    return source
+
+
+def detect_isolation_forest_stream(
+    source: Any,
+    columns: Optional[List[str]] = None,
+    contamination: float = 0.01,
+    random_state: Optional[int] = 42,
+    train_rows: int = IFOREST_TRAIN_ROWS,
+    n_jobs: Optional[int] = None,
+    chunksize: int = STREAMING_CHUNKSIZE,
+    chunk_rows: int = IFOREST_SCORE_CHUNK_ROWS,
+    top_k: int = IFOREST_TOP_K,
+) -> Dict:
+    """Two passes over a file path (or anything with ``iter_frames()``): a
+    bottom-k row sample to train on, then chunked scoring that keeps only the
+    ``top_k`` most anomalous rows. ``rows`` are 0-based positions in the stream."""
+    from dataprofiler.profiling.sampling import BottomKSampler
+
+    ingest = _frames(source, chunksize)
+    sampler = BottomKSampler(int(train_rows), seed=random_state)
+    cols = columns
+    for frame in ingest.iter_frames():
+        cols = cols or _numeric_columns(frame, None)
+        sampler.update(frame[cols])
+    kept = sampler.sample()
+    if kept.empty:
+        return _top_k_result((np.empty(0), np.empty(0, dtype=np.int64)), 0, 0, float("nan"))
+    fill = np.nanmedian(_matrix(kept, cols), axis=0)
+    train = _matrix(kept, cols, fill)
+    workers = resolve_n_jobs(n_jobs)
+    model = _fit(train, contamination, random_state, workers)
+    del train, kept, sampler
+
+    best = (np.empty(0, dtype=np.float64), np.empty(0, dtype=np.int64))
+    count = 0
+    n = 0
+    with _pool(workers) as pool:
+        for frame in ingest.iter_frames():
+            with stage("iforest.score", rows=len(frame)):
+                scores = _score(model, _matrix(frame, cols, fill), chunk_rows, pool)
+            count += int((scores < 0).sum())
+            best = _keep_lowest(best, scores, np.arange(n, n + scores.size), top_k)
+            n += scores.size
+    return _top_k_result(best, count, n, model.offset_)
@@ -0,0 +1,197 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+
+from dataprofiler.config import (
+    STREAM_EWM_ALPHA, STREAM_MAD_THRESHOLD, STREAM_WARMUP, STREAM_WINDOW, STREAMING_CHUNKSIZE, ZSCORE_THRESHOLD,
+)
+from dataprofiler.profiling.datetime_profile import compute_datetime
+from dataprofiler.profiling.sketches import KLLSketch
+
+# Phi^-1(0.75): the modified z-score is 0.6745 * (x - median) / MAD.
+_MAD_SCALE = 0.6744897501960817
+
+
+class StreamingDetector(ABC):
+    """Scores each value against state built from the rows before it, one
+    ingestion chunk at a time.
+
+    ``time_column="auto"`` keys the stream by the first column
+    ``compute_datetime`` picks up: each chunk is ordered by it and flagged
+    values report their timestamps. Chunks are assumed to arrive in time
+    order. ``update`` returns, per column, the flagged stream positions with
+    their scores, values and (when keyed) times.
+    """
+
+    def __init__(
+        self,
+        columns: Optional[List[str]] = None,
+        time_column: Optional[str] = "auto",
+        threshold: float = ZSCORE_THRESHOLD,
+        warmup: int = STREAM_WARMUP,
+    ):
+        self.columns = columns
+        self.time_column = time_column
+        self.threshold = float(threshold)
+        self.warmup = int(warmup)
+        self.rows = 0
+        self.counts: Dict[str, int] = {}
+        self._states: Dict[str, Any] = {}
+
+    def _resolve(self, frame: pd.DataFrame) -> None:
+        if self.time_column == "auto":
+            self.time_column = next(iter(compute_datetime(frame.iloc[:1])), None)
+        if self.columns is None:
+            self.columns = [c for c in frame.select_dtypes(include=["number"]).columns if c != self.time_column]
+
+    @abstractmethod
+    def _score(self, col: str, x: np.ndarray) -> np.ndarray:
+        ...
+
+    def update(self, frame: pd.DataFrame) -> Dict[str, Dict[str, np.ndarray]]:
+        if self.columns is None or self.time_column == "auto":
+            self._resolve(frame)
+        positions = np.arange(self.rows, self.rows + len(frame), dtype=np.int64)
+        times = None
+        if self.time_column is not None:
+            times = frame[self.time_column].to_numpy(dtype="datetime64[ns]")
+            order = np.argsort(times, kind="stable")
+            frame, positions, times = frame.iloc[order], positions[order], times[order]
+        out: Dict[str, Dict[str, np.ndarray]] = {}
+        for col in self.columns:
+            x = frame[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            present = ~np.isnan(x)
+            scores = np.full(x.size, np.nan)
+            scores[present] = self._score(col, x[present])
+            with np.errstate(invalid="ignore"):
+                flagged = np.abs(scores) > self.threshold
+            res = {"rows": positions[flagged], "scores": scores[flagged], "values": x[flagged]}
+            if times is not None:
+                res["times"] = times[flagged]
+            out[col] = res
+            self.counts[col] = self.counts.get(col, 0) + int(flagged.sum())
+        self.rows += len(frame)
+        return out
+
+
+def _ewm(values: np.ndarray, alpha: float) -> np.ndarray:
+    # y[0] = values[0]; y[t] = (1 - alpha) * y[t - 1] + alpha * values[t]
+    return pd.Series(values).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+
+
+class EWMDetector(StreamingDetector):
+    """Z-score against an exponentially weighted mean and variance; three
+    numbers of state per column."""
+
+    def __init__(self, alpha: float = STREAM_EWM_ALPHA, **kwargs):
+        super().__init__(**kwargs)
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = float(alpha)
+
+    def _score(self, col: str, x: np.ndarray) -> np.ndarray:
+        n, mean, var = self._states.get(col, (0, 0.0, 0.0))
+        scores = np.full(x.size, np.nan)
+        if x.size == 0:
+            return scores
+        start = 0
+        if n == 0:
+            n, mean, var, start = 1, float(x[0]), 0.0, 1
+        rest = x[start:]
+        if rest.size:
+            a = self.alpha
+            # Incremental EW mean/variance (Finch 2009), both linear recurrences:
+            # m_t = (1-a) m_{t-1} + a x_t,  v_t = (1-a) v_{t-1} + a (1-a) (x_t - m_{t-1})^2
+            means = _ewm(np.concatenate(([mean], rest)), a)
+            diff = rest - means[:-1]
+            variances = _ewm(np.concatenate(([var], (1.0 - a) * diff * diff)), a)
+            prior = variances[:-1]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                z = np.where(prior > 0, diff / np.sqrt(prior), np.nan)
+            seen = n + np.arange(rest.size)
+            z[seen < self.warmup] = np.nan
+            scores[start:] = z
+            n, mean, var = n + rest.size, float(means[-1]), float(variances[-1])
+        self._states[col] = (n, mean, var)
+        return scores
+
+
+class RollingDetector(StreamingDetector):
+    """Z-score against the mean and standard deviation of the previous
+    ``window`` values; keeps that many values per column."""
+
+    def __init__(self, window: int = STREAM_WINDOW, **kwargs):
+        super().__init__(**kwargs)
+        if window < 2:
+            raise ValueError("window must be at least 2")
+        self.window = int(window)
+
+    def _score(self, col: str, x: np.ndarray) -> np.ndarray:
+        tail = self._states.get(col, np.empty(0, dtype=np.float64))
+        y = pd.Series(np.concatenate((tail, x)))
+        rolling = y.rolling(self.window, min_periods=max(min(self.warmup, self.window), 2))
+        # Shifted by one so a value never contributes to its own baseline.
+        mean = rolling.mean().shift(1).to_numpy()[tail.size:]
+        std = rolling.std(ddof=0).shift(1).to_numpy()[tail.size:]
+        self._states[col] = y.to_numpy()[-self.window:].copy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(std > 0, (x - mean) / std, np.nan)
+
+
+class MADDetector(StreamingDetector):
+    """Modified z-score 0.6745 * (x - median) / MAD, with median and MAD read
+    from a KLL sketch per column. Sketches merge, so detectors fed disjoint
+    parts of a stream can be combined with ``merge``."""
+
+    def __init__(self, k: int = 200, threshold: float = STREAM_MAD_THRESHOLD, **kwargs):
+        super().__init__(threshold=threshold, **kwargs)
+        self.k = int(k)
+
+    def _score(self, col: str, x: np.ndarray) -> np.ndarray:
+        sketch = self._states.get(col)
+        if sketch is None:
+            sketch = self._states[col] = KLLSketch(self.k)
+        # Until warm, a chunk is scored against a sketch that includes it.
+        warm = sketch.n >= self.warmup
+        if not warm:
+            sketch.update(x)
+            if sketch.n < self.warmup:
+                return np.full(x.size, np.nan)
+        median = sketch.quantiles([0.5])[0]
+        mad = sketch.median_abs_deviation(median)
+        if warm:
+            sketch.update(x)
+        if not mad:
+            return np.full(x.size, np.nan)
+        return _MAD_SCALE * (x - median) / mad
+
+    def merge(self, other: "MADDetector") -> "MADDetector":
+        for col, sketch in other._states.items():
+            if col in self._states:
+                self._states[col].merge(sketch)
+            else:
+                self._states[col] = sketch
+        for col, count in other.counts.items():
+            self.counts[col] = self.counts.get(col, 0) + count
+        self.rows += other.rows
+        return self
+
+
+STREAM_DETECTORS = {"ewm": EWMDetector, "rolling": RollingDetector, "mad": MADDetector}
+
+
+def detect_stream(
+    source: Any,
+    method: Union[str, StreamingDetector] = "ewm",
+    chunksize: int = STREAMING_CHUNKSIZE,
+    **kwargs,
+) -> Iterator[Tuple[StreamingDetector, Dict[str, Dict[str, np.ndarray]]]]:
+    """Runs a detector over a path (read in chunks) or any iterable of frames,
+    yielding the detector and each chunk's flagged values as they arrive."""
+    detector = STREAM_DETECTORS[method](**kwargs) if isinstance(method, str) else method
+    if isinstance(source, str):
+        from dataprofiler.ingestion import load_data
+        source = load_data(source, chunksize=chunksize).iter_frames()
+    for frame in source:
+        yield detector, detector.update(frame)
@@ -1,20 +1,21 @@
 from typing import Dict, List, Optional
 import pandas as pd
-import numpy as np
+
+from .engine import _arrays, _columns, column_moments, outlier_masks, zscore_bounds
 
 
 def detect_zscore(df: pd.DataFrame, columns: Optional[List[str]] = None, threshold: float = 3.0, ddof: int = 0) -> Dict[str, Dict]:
-    cols = columns or df.select_dtypes(include=["number"]).columns.tolist()
+    cols = _columns(df, columns)
+    mu, sigma = column_moments(_arrays(df, cols), ddof)
+    res = outlier_masks(df, cols, bounds={"zscore": zscore_bounds(mu, sigma, threshold)}, output="indices", methods=("zscore",))
+    z = res["zscore"]
     out: Dict[str, Dict] = {}
-    for col in cols:
-        s = df[col].astype(float)
-        mu = float(s.mean())
-        sigma = float(s.std(ddof=ddof))
-        if sigma == 0 or s.dropna().empty:
-            out[col] = {"mean": mu, "std": sigma, "threshold": float(threshold), "indices": [], "count": 0}
-            continue
-        z = (s - mu) / sigma
-        mask = z.abs() > threshold
-        idx = df.index[mask.fillna(False)].tolist()
-        out[col] = {"mean": mu, "std": sigma, "threshold": float(threshold), "indices": idx, "count": int(mask.sum())}
-    return out
\ No newline at end of file
+    for j, col in enumerate(cols):
+        out[col] = {
+            "mean": float(mu[j]),
+            "std": float(sigma[j]),
+            "threshold": float(threshold),
+            "indices": df.index[z["indices"][j]].tolist(),
+            "count": int(z["counts"][j]),
+        }
+    return out
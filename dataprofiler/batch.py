@@ -0,0 +1,276 @@
+import csv
+import json
+import os
+import signal
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from glob import glob
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .cache import profile_path
+from .config import BATCH_MAX_ATTEMPTS, BATCH_PROGRESS_EVERY, BATCH_TIMEOUT_GRACE_SECONDS, BATCH_TIMEOUT_SECONDS
+from .ingestion.validators import ARROW_EXTENSIONS, TEXT_EXTENSIONS
+from .reports import export_json, write_report
+from .utils import resolve_n_jobs
+from .utils.logger import Logger
+
+INDEX_JOURNAL = "index.jsonl"
+INDEX_CSV = "index.csv"
+FAILURES_JSON = "failures.json"
+PROFILES_DIR = "profiles"
+INDEX_FIELDS = [
+    "path", "status", "rows", "columns", "missing_pct", "duplicate_pct", "schema",
+    "size_bytes", "seconds", "json", "report", "error",
+]
+
+# (path, json_path, report_path)
+_Task = Tuple[str, str, Optional[str]]
+
+
+class BatchTimeout(BaseException):
+    # BaseException so broad ``except Exception`` fallbacks in the readers
+    # cannot swallow it and carry on past the deadline.
+    pass
+
+
+def _alarm(signum, frame):
+    raise BatchTimeout()
+
+
+@contextmanager
+def _deadline(seconds: Optional[float]) -> Iterator[None]:
+    if not seconds or not hasattr(signal, "setitimer"):
+        yield
+        return
+    previous = signal.signal(signal.SIGALRM, _alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _supported(path: str) -> bool:
+    return os.path.splitext(path)[1].lower().lstrip(".") in TEXT_EXTENSIONS | ARROW_EXTENSIONS
+
+
+def discover_files(target: str, recursive: bool = True, exclude: Optional[str] = None) -> List[str]:
+    """Expands a directory or glob into the profileable files under it, sorted."""
+    if os.path.isdir(target):
+        found = []
+        for root, dirs, names in os.walk(target):
+            if not recursive:
+                dirs[:] = []
+            found.extend(os.path.join(root, n) for n in names)
+    elif any(c in target for c in "*?["):
+        found = glob(target, recursive=recursive)
+    else:
+        found = [target]
+    exclude = os.path.join(os.path.abspath(exclude), "") if exclude else None
+    files = []
+    for path in found:
+        full = os.path.abspath(path)
+        if exclude and full.startswith(exclude):
+            continue
+        if os.path.isfile(full) and _supported(full):
+            files.append(full)
+    return sorted(files)
+
+
+def _root(target: str, files: List[str]) -> str:
+    if os.path.isdir(target):
+        return os.path.abspath(target)
+    dirs = {os.path.dirname(p) for p in files}
+    return os.path.commonpath(sorted(dirs)) if dirs else os.getcwd()
+
+
+def _profile_file(
+    path: str, json_path: str, report_path: Optional[str], options: Dict[str, Any], timeout: Optional[float]
+) -> Dict[str, Any]:
+    start = time.perf_counter()
+    try:
+        with _deadline(timeout):
+            prof = profile_path(path, **options)
+            export_json(prof, json_path)
+            if report_path:
+                write_report(prof, report_path, title=os.path.basename(path))
+    except BatchTimeout:
+        raise TimeoutError(f"timed out after {timeout:g}s") from None
+    ds = prof.dataset_stats
+    return {
+        "rows": ds.rows,
+        "columns": ds.columns,
+        "missing_pct": prof.overall_missingness.total_missing_pct,
+        "duplicate_pct": prof.duplicates.duplicate_rows_percentage,
+        "schema": ds.column_types,
+        "seconds": round(time.perf_counter() - start, 4),
+    }
+
+
+def _kill(pool: ProcessPoolExecutor) -> None:
+    # A worker stuck in C code never sees its alarm; nothing public can stop it.
+    for proc in list((pool._processes or {}).values()):
+        proc.terminate()
+
+
+def _run_pool(
+    tasks: List[_Task], workers: int, options: Dict[str, Any], timeout: Optional[float]
+) -> Iterator[Tuple[_Task, Optional[Dict[str, Any]], Optional[str]]]:
+    queue = deque((task, 1) for task in tasks)
+    hard_limit = timeout + BATCH_TIMEOUT_GRACE_SECONDS if timeout else None
+    while queue:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        # Only as many tasks as workers are in flight, so submission time is
+        # close enough to start time for the hard deadline.
+        running: Dict[Any, Tuple[_Task, int, float]] = {}
+        broken = False
+        try:
+            while (queue or running) and not broken:
+                while queue and len(running) < workers:
+                    task, attempt = queue.popleft()
+                    running[pool.submit(_profile_file, *task, options, timeout)] = (task, attempt, time.monotonic())
+                wait_s = None
+                if hard_limit:
+                    wait_s = max(0.1, min(s for _, _, s in running.values()) + hard_limit - time.monotonic())
+                finished, _ = wait(running, timeout=wait_s, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    task, attempt, _ = running.pop(fut)
+                    try:
+                        yield task, fut.result(), None
+                    except BrokenProcessPool:
+                        broken = True
+                        if attempt < BATCH_MAX_ATTEMPTS:
+                            queue.append((task, attempt + 1))
+                        else:
+                            yield task, None, "worker process died"
+                    except Exception as e:
+                        yield task, None, f"{type(e).__name__}: {e}"
+                if hard_limit and not broken:
+                    now = time.monotonic()
+                    hung = [f for f, (_, _, s) in running.items() if now - s > hard_limit]
+                    if hung:
+                        _kill(pool)
+                        broken = True
+                        for fut in hung:
+                            task, _, _ = running.pop(fut)
+                            yield task, None, f"TimeoutError: killed after {hard_limit:g}s"
+            # Whatever was still running on a broken pool is retried on a new one.
+            for task, attempt, _ in running.values():
+                queue.appendleft((task, attempt))
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def load_index(out_dir: str) -> Dict[str, Dict[str, Any]]:
+    """Latest journal entry per file; a torn last line from an interrupted run is ignored."""
+    entries: Dict[str, Dict[str, Any]] = {}
+    try:
+        with open(os.path.join(out_dir, INDEX_JOURNAL), encoding="utf-8") as f:
+            for line in f:
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    continue
+                entries[row["path"]] = row
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+def _is_current(row: Optional[Dict[str, Any]], st: os.stat_result) -> bool:
+    return bool(
+        row and row.get("status") == "ok"
+        and row.get("size_bytes") == st.st_size and row.get("mtime_ns") == st.st_mtime_ns
+        and os.path.isfile(row.get("json") or "")
+    )
+
+
+def write_index(out_dir: str, paths: Optional[List[str]] = None) -> Tuple[str, str]:
+    entries = load_index(out_dir)
+    keys = sorted(entries) if paths is None else [p for p in paths if p in entries]
+    index_path = os.path.join(out_dir, INDEX_CSV)
+    failures = []
+    with open(index_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=INDEX_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        for key in keys:
+            row = dict(entries[key])
+            if row.get("schema") is not None:
+                row["schema"] = json.dumps(row["schema"], ensure_ascii=False)
+            writer.writerow(row)
+            if row["status"] != "ok":
+                failures.append({"path": key, "error": row.get("error")})
+    failures_path = os.path.join(out_dir, FAILURES_JSON)
+    with open(failures_path, "w", encoding="utf-8") as f:
+        json.dump(failures, f, indent=2, ensure_ascii=False)
+    return index_path, failures_path
+
+
+def run_batch(
+    target: str,
+    out_dir: str,
+    n_jobs: Optional[int] = None,
+    timeout: Optional[float] = BATCH_TIMEOUT_SECONDS,
+    report: bool = True,
+    resume: bool = True,
+    recursive: bool = True,
+    logger: Optional[Logger] = None,
+    **options: Any,
+) -> Dict[str, int]:
+    """Profiles every file under ``target`` into ``out_dir``.
+
+    Each finished file is appended to ``index.jsonl`` straight away, so an
+    interrupted run picks up where it stopped; files whose size and mtime
+    match an ``ok`` entry are skipped. ``options`` go to ``profile_path``.
+    """
+    logger = logger or Logger()
+    out_dir = os.path.abspath(out_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    files = discover_files(target, recursive, exclude=out_dir)
+    root = _root(target, files)
+    journal_path = os.path.join(out_dir, INDEX_JOURNAL)
+    if not resume and os.path.exists(journal_path):
+        os.remove(journal_path)
+    previous = load_index(out_dir)
+
+    tasks: List[_Task] = []
+    stats: Dict[str, Tuple[int, int]] = {}
+    for path in files:
+        st = os.stat(path)
+        if _is_current(previous.get(path), st):
+            continue
+        stats[path] = (st.st_size, st.st_mtime_ns)
+        base = os.path.join(out_dir, PROFILES_DIR, os.path.relpath(path, root))
+        tasks.append((path, base + ".json", base + ".html" if report else None))
+    counts = {"files": len(files), "skipped": len(files) - len(tasks), "ok": 0, "failed": 0}
+    workers = min(resolve_n_jobs(n_jobs), max(len(tasks), 1))
+    logger.info(f"batch: {len(files)} files, {counts['skipped']} up to date, {len(tasks)} to profile on {workers} workers")
+
+    with open(journal_path, "a+", encoding="utf-8") as journal:
+        if journal.tell():
+            journal.seek(journal.tell() - 1)
+            if journal.read(1) != "\n":
+                # Terminate a line torn by an interrupted run before appending.
+                journal.write("\n")
+        for (path, json_path, report_path), result, error in _run_pool(tasks, workers, options, timeout):
+            size, mtime_ns = stats[path]
+            row = {"path": path, "status": "ok" if error is None else "failed", "size_bytes": size, "mtime_ns": mtime_ns}
+            if error is None:
+                row.update(result, json=json_path, report=report_path)
+                counts["ok"] += 1
+            else:
+                row["error"] = error
+                counts["failed"] += 1
+                logger.warn(f"batch: {path}: {error}")
+            journal.write(json.dumps(row, ensure_ascii=False) + "\n")
+            journal.flush()
+            done = counts["ok"] + counts["failed"]
+            if done % BATCH_PROGRESS_EVERY == 0:
+                logger.info(f"batch: {done}/{len(tasks)} profiled")
+    write_index(out_dir, files)
+    logger.info(f"batch: {counts['ok']} ok, {counts['failed']} failed, {counts['skipped']} skipped")
+    return counts
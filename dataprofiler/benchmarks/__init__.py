@@ -0,0 +1,20 @@
+from dataprofiler._lazy import lazy_exports
+
+_EXPORTS = {
+    "DatasetSpec": ".generators",
+    "generate_frame": ".generators",
+    "write_csv": ".generators",
+    "STAGES": ".runner",
+    "measure": ".runner",
+    "run_benchmarks": ".runner",
+    "HEAVY_MODULES": ".startup",
+    "measure_import": ".startup",
+    "check_startup": ".startup",
+    "compare": ".history",
+    "load_history": ".history",
+    "make_run": ".history",
+    "record_run": ".history",
+    "save_history": ".history",
+}
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,78 @@
+import argparse
+import sys
+
+from dataprofiler.config import BENCH_HISTORY_PATH, BENCH_REGRESSION_THRESHOLD, BENCH_STARTUP_BUDGET_SECONDS
+from .generators import DatasetSpec
+from .history import compare, load_history, make_run, record_run, save_history
+from .runner import STAGES, run_benchmarks
+from .startup import check_startup
+
+
+def _format(results, regressions) -> str:
+    flagged = {(r["stage"], r["metric"]) for r in regressions}
+    lines = [f"{'stage':<26}{'wall s':>10}{'rows/s':>14}{'traced MiB':>12}"]
+    for stage, r in results.items():
+        mark = " REGRESSED" if any((stage, m) in flagged for m in ("wall_s", "peak_traced_bytes")) else ""
+        rate = f"{r['rows_per_s']:,.0f}" if r.get("rows_per_s") else "-"
+        mem = f"{r['peak_traced_bytes'] / (1 << 20):.1f}" if r.get("peak_traced_bytes") is not None else "-"
+        lines.append(f"{stage:<26}{r['wall_s']:>10.4f}{rate:>14}{mem:>12}{mark}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    defaults = DatasetSpec()
+    p = argparse.ArgumentParser(prog="python -m dataprofiler.benchmarks")
+    p.add_argument("--rows", type=int, default=defaults.rows)
+    p.add_argument("--numeric", type=int, default=defaults.numeric)
+    p.add_argument("--categorical", type=int, default=defaults.categorical)
+    p.add_argument("--datetime", type=int, default=defaults.datetime)
+    p.add_argument("--boolean", type=int, default=defaults.boolean)
+    p.add_argument("--missing-rate", dest="missing_rate", type=float, default=defaults.missing_rate)
+    p.add_argument("--cardinality", type=int, default=defaults.cardinality)
+    p.add_argument("--duplicate-rate", dest="duplicate_rate", type=float, default=defaults.duplicate_rate)
+    p.add_argument("--encoding", default=defaults.encoding)
+    p.add_argument("--delimiter", default=defaults.delimiter)
+    p.add_argument("--seed", type=int, default=defaults.seed)
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--stages", default=None, help=f"comma list from: {', '.join(STAGES)}")
+    p.add_argument("--history", default=BENCH_HISTORY_PATH)
+    p.add_argument("--threshold", type=float, default=BENCH_REGRESSION_THRESHOLD)
+    p.add_argument("--startup-budget", dest="startup_budget", type=float, default=BENCH_STARTUP_BUDGET_SECONDS)
+    p.add_argument("--set-baseline", dest="set_baseline", action="store_true")
+    p.add_argument("--no-record", dest="record", action="store_false")
+    args = p.parse_args(argv)
+    delimiter = "\t" if args.delimiter in ("\\t", "tab") else args.delimiter
+    spec = DatasetSpec(
+        rows=args.rows, numeric=args.numeric, categorical=args.categorical, datetime=args.datetime,
+        boolean=args.boolean, missing_rate=args.missing_rate, cardinality=args.cardinality,
+        duplicate_rate=args.duplicate_rate, encoding=args.encoding, delimiter=delimiter, seed=args.seed,
+    )
+    only = [s.strip() for s in args.stages.split(",")] if args.stages else None
+    if only:
+        unknown = sorted(set(only) - set(STAGES))
+        if unknown:
+            p.error(f"unknown stages: {', '.join(unknown)}")
+
+    history = load_history(args.history)
+    results = run_benchmarks(spec, repeat=args.repeat, only=only)
+    baseline = history["baselines"].get(spec.key())
+    regressions = [] if baseline is None or args.set_baseline else compare(results, baseline["results"], args.threshold)
+    print(spec.label())
+    print(_format(results, regressions))
+    if args.record:
+        record_run(history, make_run(spec, results), set_baseline=args.set_baseline)
+        save_history(args.history, history)
+    for r in regressions:
+        print(
+            f"regression: {r['stage']} {r['metric']} {r['baseline']:.4g} -> {r['current']:.4g} "
+            f"({r['ratio']:.2f}x, threshold {1 + args.threshold:.2f}x)",
+            file=sys.stderr,
+        )
+    startup = check_startup(results["cli_import"], args.startup_budget) if "cli_import" in results else []
+    for problem in startup:
+        print(f"startup: {problem}", file=sys.stderr)
+    return 1 if regressions or startup else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
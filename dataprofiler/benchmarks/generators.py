@@ -0,0 +1,78 @@
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from typing import Dict
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class DatasetSpec:
+    rows: int = 100_000
+    numeric: int = 6
+    categorical: int = 4
+    datetime: int = 2
+    boolean: int = 1
+    missing_rate: float = 0.05
+    cardinality: int = 50
+    duplicate_rate: float = 0.01
+    encoding: str = "utf-8"
+    delimiter: str = ","
+    seed: int = 0
+
+    def key(self) -> str:
+        # Stable id so history entries are only compared against the same shape.
+        blob = json.dumps(asdict(self), sort_keys=True).encode("utf-8")
+        return hashlib.blake2b(blob, digest_size=8).hexdigest()
+
+    def label(self) -> str:
+        return (
+            f"{self.rows}r n{self.numeric} c{self.categorical} d{self.datetime} b{self.boolean} "
+            f"miss={self.missing_rate} card={self.cardinality} dup={self.duplicate_rate} "
+            f"{self.encoding} {self.delimiter!r}"
+        )
+
+
+def _category_pool(n: int, encoding: str) -> np.ndarray:
+    # Non-ASCII values exercise encoding detection wherever the codec allows.
+    accent = "é" if encoding.lower().replace("_", "-") not in ("ascii", "us-ascii") else "e"
+    return np.array([f"cat{accent}_{i:05d}" for i in range(max(n, 1))], dtype=object)
+
+
+def generate_frame(spec: DatasetSpec) -> pd.DataFrame:
+    rng = np.random.default_rng(spec.seed)
+    n = spec.rows
+    cols: Dict[str, np.ndarray] = {}
+    for i in range(spec.numeric):
+        if i % 3 == 0:
+            cols[f"num_{i}"] = rng.normal(100.0, 15.0, n).round(4)
+        elif i % 3 == 1:
+            cols[f"num_{i}"] = rng.exponential(10.0, n).round(4)
+        else:
+            cols[f"num_{i}"] = rng.integers(0, 10_000, n).astype(np.float64)
+    pool = _category_pool(spec.cardinality, spec.encoding)
+    # Zipf-like weights give realistic heavy hitters and a long tail.
+    weights = 1.0 / np.arange(1, pool.size + 1)
+    weights /= weights.sum()
+    for i in range(spec.categorical):
+        cols[f"cat_{i}"] = pool[rng.choice(pool.size, n, p=weights)]
+    base = np.datetime64("2020-01-01")
+    for i in range(spec.datetime):
+        days = rng.integers(0, 3 * 365, n)
+        cols[f"date_{i}"] = np.datetime_as_string(base + days.astype("timedelta64[D]"), unit="D").astype(object)
+    for i in range(spec.boolean):
+        cols[f"flag_{i}"] = np.where(rng.random(n) < 0.5, "true", "false").astype(object)
+    df = pd.DataFrame(cols)
+    if spec.missing_rate > 0 and df.shape[1]:
+        mask = rng.random(df.shape) < spec.missing_rate
+        df = df.mask(mask)
+    dups = int(n * spec.duplicate_rate)
+    if dups > 0 and n > dups:
+        src = rng.integers(0, n - dups, dups)
+        df.iloc[n - dups:] = df.iloc[src].to_numpy()
+    return df
+
+
+def write_csv(spec: DatasetSpec, path: str) -> str:
+    generate_frame(spec).to_csv(path, index=False, sep=spec.delimiter, encoding=spec.encoding)
+    return path
@@ -0,0 +1,106 @@
+import json
+import os
+import platform
+import subprocess
+import tempfile
+from dataclasses import asdict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from dataprofiler import __version__
+from dataprofiler.config import BENCH_MIN_DELTA_BYTES, BENCH_MIN_DELTA_SECONDS, BENCH_REGRESSION_THRESHOLD
+from .generators import DatasetSpec
+
+_HISTORY_VERSION = 1
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def environment() -> Dict[str, Any]:
+    return {
+        "dataprofiler": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "commit": _git_commit(),
+    }
+
+
+def make_run(spec: DatasetSpec, results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "spec_key": spec.key(),
+        "spec": asdict(spec),
+        "environment": environment(),
+        "results": results,
+    }
+
+
+def load_history(path: str) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        return {"version": _HISTORY_VERSION, "baselines": {}, "runs": []}
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != _HISTORY_VERSION:
+        raise ValueError(f"Unsupported benchmark history version in {path}: {data.get('version')}")
+    return data
+
+
+def save_history(path: str, history: Dict[str, Any]) -> str:
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(history, f, indent=2)
+    os.replace(tmp, path)
+    return path
+
+
+def record_run(history: Dict[str, Any], run: Dict[str, Any], set_baseline: bool = False) -> None:
+    history["runs"].append(run)
+    if set_baseline or run["spec_key"] not in history["baselines"]:
+        history["baselines"][run["spec_key"]] = run
+
+
+def compare(
+    current: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float = BENCH_REGRESSION_THRESHOLD,
+    min_seconds: float = BENCH_MIN_DELTA_SECONDS,
+    min_bytes: int = BENCH_MIN_DELTA_BYTES,
+) -> List[Dict[str, Any]]:
+    # Absolute floors keep millisecond-scale stages from tripping on noise.
+    regressions = []
+    for stage, now in current.items():
+        then = baseline.get(stage)
+        if then is None:
+            continue
+        for metric, floor in (("wall_s", min_seconds), ("peak_traced_bytes", min_bytes)):
+            old, new = then.get(metric), now.get(metric)
+            if old is None or new is None:
+                continue
+            if new > old * (1.0 + threshold) and new - old > floor:
+                regressions.append({
+                    "stage": stage,
+                    "metric": metric,
+                    "baseline": old,
+                    "current": new,
+                    "ratio": new / old if old else float("inf"),
+                })
+    return regressions
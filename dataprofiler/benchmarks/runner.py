@@ -0,0 +1,109 @@
+import os
+import statistics
+import tempfile
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from dataprofiler.anomalies.engine import outlier_masks
+from dataprofiler.anomalies.iqr import detect_iqr
+from dataprofiler.anomalies.isolation_forest import detect_isolation_forest
+from dataprofiler.anomalies.zscore import detect_zscore
+from dataprofiler.ingestion import load_data
+from dataprofiler.profiling import profile_data
+from dataprofiler.profiling.categories import compute_categorical
+from dataprofiler.profiling.correlations import compute_correlations
+from dataprofiler.profiling.datetime_profile import compute_datetime
+from dataprofiler.profiling.duplicates import compute_duplicates
+from dataprofiler.profiling.missing import compute_missing
+from dataprofiler.profiling.statistics import compute_numeric
+from dataprofiler.reports import build_report
+from dataprofiler.config import IFOREST_TRAIN_ROWS
+from dataprofiler.utils.timer import Timer
+from .generators import DatasetSpec, write_csv
+from .startup import measure_import
+
+
+def measure(fn: Callable[[], Any], rows: int, repeat: int = 3) -> Tuple[Dict[str, Any], Any]:
+    walls: List[float] = []
+    cpus: List[float] = []
+    result = None
+    for _ in range(max(repeat, 1)):
+        with Timer() as timer:
+            result = fn()
+        walls.append(timer.elapsed())
+        cpus.append(timer.cpu())
+    # One extra traced run for memory; tracemalloc would skew the timings.
+    tracemalloc.start()
+    try:
+        with Timer() as traced:
+            fn()
+    finally:
+        tracemalloc.stop()
+    best = min(walls)
+    return {
+        "wall_s": best,
+        "wall_median_s": statistics.median(walls),
+        "cpu_s": min(cpus),
+        "rows_per_s": rows / best if best > 0 else None,
+        "peak_traced_bytes": traced.traced_delta(),
+        "peak_rss_delta": traced.rss_delta(),
+        "repeat": len(walls),
+    }, result
+
+
+# Stages timed against the loaded frame, in run order.
+FRAME_STAGES: List[Tuple[str, Callable[[Any], Any]]] = [
+    ("compute_numeric", compute_numeric),
+    ("compute_categorical", compute_categorical),
+    ("compute_datetime", compute_datetime),
+    ("compute_missing", compute_missing),
+    ("compute_duplicates", compute_duplicates),
+    ("compute_correlations", compute_correlations),
+    ("detect_iqr", detect_iqr),
+    ("detect_zscore", detect_zscore),
+    ("outlier_masks", lambda df: outlier_masks(df, output="indices")),
+    ("detect_isolation_forest", detect_isolation_forest),
+    ("isolation_forest_top_k", lambda df: detect_isolation_forest(df, train_rows=IFOREST_TRAIN_ROWS, output="top_k")),
+    ("profile_data", profile_data),
+]
+STAGES = ["cli_import", "load_data"] + [name for name, _ in FRAME_STAGES] + ["build_report"]
+
+
+def run_benchmarks(
+    spec: DatasetSpec,
+    repeat: int = 3,
+    workdir: Optional[str] = None,
+    only: Optional[List[str]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    results: Dict[str, Dict[str, Any]] = {}
+    wanted = set(STAGES if only is None else only)
+    if "cli_import" in wanted:
+        results["cli_import"] = measure_import(repeat=max(repeat, 5))
+    if not wanted - {"cli_import"}:
+        return results
+    if "build_report" in wanted:
+        wanted_frame = wanted | {"profile_data"}
+    else:
+        wanted_frame = wanted
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        path = write_csv(spec, os.path.join(tmp, "bench.csv"))
+        stats, df = measure(lambda: load_data(path, as_frame=True).frame, spec.rows, repeat)
+        stats["file_bytes"] = os.path.getsize(path)
+        if "load_data" in wanted:
+            results["load_data"] = stats
+        profile = None
+        for name, fn in FRAME_STAGES:
+            if name not in wanted_frame:
+                continue
+            try:
+                stats, out = measure(lambda: fn(df), spec.rows, repeat)
+            except ImportError:
+                # Optional dependency missing; the stage is simply not tracked.
+                continue
+            if name == "profile_data":
+                profile = out
+            if name in wanted:
+                results[name] = stats
+        if "build_report" in wanted and profile is not None:
+            results["build_report"], _ = measure(lambda: build_report(profile), spec.rows, repeat)
+    return results
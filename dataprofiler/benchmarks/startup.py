@@ -0,0 +1,48 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Sequence
+
+# Modules whose presence after importing the CLI means something went eager again.
+HEAVY_MODULES = ("numpy", "pandas", "sklearn", "pyarrow", "weasyprint")
+
+_PROBE = (
+    "import json, sys, time\n"
+    "t = time.perf_counter()\n"
+    "import {module}\n"
+    "wall = time.perf_counter() - t\n"
+    "print(json.dumps({{'wall_s': wall, 'loaded': [m for m in {heavy!r} if m in sys.modules]}}))\n"
+)
+
+
+def measure_import(module: str = "dataprofiler.cli", repeat: int = 5, heavy: Sequence[str] = HEAVY_MODULES) -> Dict[str, Any]:
+    """Import time of ``module`` in fresh interpreters; interpreter startup itself is excluded."""
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")]))}
+    script = _PROBE.format(module=module, heavy=tuple(heavy))
+    walls: List[float] = []
+    loaded: List[str] = []
+    # The first run also writes bytecode caches; it is not counted.
+    for i in range(max(repeat, 1) + 1):
+        out = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True)
+        probe = json.loads(out.stdout.strip().splitlines()[-1])
+        if i:
+            walls.append(probe["wall_s"])
+        loaded = probe["loaded"]
+    return {
+        "wall_s": min(walls),
+        "wall_median_s": statistics.median(walls),
+        "repeat": len(walls),
+        "heavy_modules": loaded,
+    }
+
+
+def check_startup(stats: Dict[str, Any], budget_s: float) -> List[str]:
+    problems = []
+    if stats["wall_median_s"] > budget_s:
+        problems.append(f"import took {stats['wall_median_s'] * 1000:.1f} ms, budget {budget_s * 1000:.0f} ms")
+    if stats["heavy_modules"]:
+        problems.append(f"import loaded {', '.join(stats['heavy_modules'])}")
+    return problems
@@ -0,0 +1,208 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from dataclasses import replace
+from typing import Any, Dict, List, Optional, Union
+
+from .config import PROFILE_CACHE_DIR, PROFILE_CACHE_MAX_BYTES, PROFILE_CACHE_MAX_ENTRIES, STREAMING_CHUNKSIZE
+from .ingestion import load_data, file_fingerprint, ChunkedIngestion
+from .ingestion.reader import is_appended, is_ascii_compatible
+from .model import ProfileResult
+from .profiling import profile_data, ProfileState, SampledProfileState
+from .utils.timer import active_recorder, stage
+
+_CACHE_VERSION = 6
+
+
+class ProfileCache:
+    """On-disk store of profiles keyed by file path, evicted least-recently-used first."""
+
+    def __init__(
+        self,
+        directory: str = PROFILE_CACHE_DIR,
+        max_bytes: int = PROFILE_CACHE_MAX_BYTES,
+        max_entries: int = PROFILE_CACHE_MAX_ENTRIES,
+    ):
+        self.directory = os.path.expanduser(directory)
+        self.max_bytes = int(max_bytes)
+        self.max_entries = int(max_entries)
+
+    def _entry_path(self, path: str, kind: str) -> str:
+        key = hashlib.blake2b(f"{kind}:{os.path.abspath(path)}".encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.directory, key + ".pkl")
+
+    def load(self, path: str, kind: str) -> Optional[Dict[str, Any]]:
+        entry_path = self._entry_path(path, kind)
+        try:
+            with open(entry_path, "rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            self._remove(entry_path)
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != _CACHE_VERSION:
+            self._remove(entry_path)
+            return None
+        os.utime(entry_path)
+        return entry
+
+    def store(self, path: str, kind: str, entry: Dict[str, Any]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        entry = {**entry, "version": _CACHE_VERSION}
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._entry_path(path, kind))
+        except BaseException:
+            self._remove(tmp)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        try:
+            names = [n for n in os.listdir(self.directory) if n.endswith(".pkl")]
+        except FileNotFoundError:
+            return
+        entries = []
+        for name in names:
+            full = os.path.join(self.directory, name)
+            try:
+                st = os.stat(full)
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, full))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        while entries and (total > self.max_bytes or len(entries) > self.max_entries):
+            _, size, full = entries.pop(0)
+            self._remove(full)
+            total -= size
+
+    def clear(self) -> None:
+        for name in os.listdir(self.directory) if os.path.isdir(self.directory) else []:
+            if name.endswith(".pkl"):
+                self._remove(os.path.join(self.directory, name))
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _kind(
+    kind: str,
+    usecols: Optional[List[str]],
+    sample: Optional[Union[int, float]] = None,
+    stratify: Optional[str] = None,
+) -> str:
+    if usecols is not None:
+        kind = f"{kind}:{','.join(usecols)}"
+    if sample is not None:
+        kind = f"{kind}:sample={sample!r}:{stratify or ''}"
+    return kind
+
+
+def _new_state(sample: Optional[Union[int, float]], stratify: Optional[str]) -> ProfileState:
+    return ProfileState() if sample is None else SampledProfileState(sample, stratify)
+
+
+def _profile_state(
+    path: str,
+    chunksize: int,
+    cache: Optional[ProfileCache],
+    usecols: Optional[List[str]],
+    sample: Optional[Union[int, float]] = None,
+    stratify: Optional[str] = None,
+) -> ProfileResult:
+    fp = file_fingerprint(path)
+    kind = _kind("state", usecols, sample, stratify)
+    with stage("cache_lookup"):
+        entry = cache.load(path, kind) if cache else None
+    if entry and entry["fingerprint"] == fp:
+        with stage("finalize"):
+            return entry["state"].finalize()
+
+    with stage("load"):
+        ingest = load_data(path, chunksize=chunksize, usecols=usecols)
+    meta = ingest.metadata
+    state = _new_state(sample, stratify)
+    text = isinstance(ingest, ChunkedIngestion)
+    if text and entry and entry["format"] == (meta.encoding, meta.delimiter, meta.has_header) \
+            and is_ascii_compatible(meta.encoding) and is_appended(entry["fingerprint"], path):
+        # Only the bytes appended since the cached profile need reading.
+        state = entry["state"]
+        start = entry["fingerprint"].size_bytes
+        ingest = ChunkedIngestion(
+            path, meta.encoding, meta.delimiter, meta.has_header, chunksize,
+            start=start, dtypes=entry["dtypes"], formats=entry["formats"], usecols=usecols,
+        )
+    if text:
+        ingest.end = fp.size_bytes
+    with stage("stream"):
+        for frame in ingest.iter_frames():
+            with stage("update", rows=len(frame)):
+                state.update(frame)
+    if cache:
+        with stage("cache_store"):
+            cache.store(path, kind, {
+                "fingerprint": fp,
+                "format": (meta.encoding, meta.delimiter, meta.has_header),
+                "dtypes": ingest.dtypes,
+                "formats": ingest.formats,
+                "state": state,
+            })
+    with stage("finalize"):
+        return state.finalize()
+
+
+def profile_path(
+    path: str,
+    chunksize: Optional[int] = None,
+    n_jobs: Optional[int] = None,
+    streaming: bool = False,
+    cache: Optional[ProfileCache] = None,
+    usecols: Optional[List[str]] = None,
+    sample: Optional[Union[int, float]] = None,
+    stratify: Optional[str] = None,
+) -> ProfileResult:
+    if streaming:
+        result = _profile_state(path, chunksize or STREAMING_CHUNKSIZE, cache, usecols, sample, stratify)
+    else:
+        result = _profile_frame(path, chunksize, n_jobs, cache, usecols, sample, stratify)
+    recorder = active_recorder()
+    if recorder is not None:
+        result = replace(result, timings=recorder.timings())
+    return result
+
+
+def _profile_frame(
+    path: str,
+    chunksize: Optional[int],
+    n_jobs: Optional[int],
+    cache: Optional[ProfileCache],
+    usecols: Optional[List[str]],
+    sample: Optional[Union[int, float]],
+    stratify: Optional[str],
+) -> ProfileResult:
+    fp = file_fingerprint(path)
+    kind = _kind("result", usecols, sample, stratify)
+    with stage("cache_lookup"):
+        entry = cache.load(path, kind) if cache else None
+    if entry and entry["fingerprint"] == fp:
+        return entry["result"]
+    with stage("load"):
+        if chunksize:
+            df = load_data(path, chunksize=chunksize, usecols=usecols).to_frame()
+        else:
+            df = load_data(path, as_frame=True, n_jobs=n_jobs, usecols=usecols).frame
+    result = profile_data(df, n_jobs=n_jobs, sample=sample, stratify=stratify)
+    if cache:
+        with stage("cache_store"):
+            # Timings describe one run, not the cached profile.
+            cache.store(path, kind, {"fingerprint": fp, "result": replace(result, timings=[])})
+    return result
@@ -1,26 +1,111 @@
 import argparse
-import pandas as pd
-from .ingestion import load_data
-from .profiling import profile_data
-from .reports import build_report, export_html, export_json
+import json
+import os
+import sys
+from contextlib import nullcontext
+from typing import List, Optional, Union
+from . import __version__
+from .config import BATCH_TIMEOUT_SECONDS, PROFILE_CACHE_DIR
 
+# Everything that pulls in pandas is imported inside the command that needs
+# it, so --help, --version and --schema return without paying for it.
 
-def main():
-    p = argparse.ArgumentParser(prog="dataprofiler")
+
+def _sample_arg(value: str) -> Union[int, float]:
+    # "0.1" is a fraction of the rows, "50000" a row count.
+    try:
+        n = int(value)
+    except ValueError:
+        try:
+            n = float(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid sample size: {value!r}")
+    if n <= 0 or (isinstance(n, float) and n > 1.0):
+        raise argparse.ArgumentTypeError("sample must be a row count or a fraction in (0, 1]")
+    return n
+
+
+def batch_main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(prog="dataprofiler batch")
+    p.add_argument("target", help="directory or glob of files to profile")
+    p.add_argument("--out", dest="out", required=True)
+    p.add_argument("--jobs", dest="n_jobs", type=int, default=-1)
+    p.add_argument("--timeout", dest="timeout", type=float, default=BATCH_TIMEOUT_SECONDS)
+    p.add_argument("--no-report", dest="report", action="store_false")
+    p.add_argument("--no-resume", dest="resume", action="store_false")
+    p.add_argument("--no-recursive", dest="recursive", action="store_false")
+    p.add_argument("--chunksize", dest="chunksize", type=int, default=None)
+    p.add_argument("--streaming", dest="streaming", action="store_true")
+    p.add_argument("--sample", dest="sample", type=_sample_arg, default=None)
+    p.add_argument("--stratify", dest="stratify", default=None)
+    args = p.parse_args(argv)
+    if args.stratify and args.sample is None:
+        p.error("--stratify requires --sample")
+    from .batch import run_batch
+    counts = run_batch(
+        args.target, args.out, n_jobs=args.n_jobs, timeout=args.timeout or None, report=args.report,
+        resume=args.resume, recursive=args.recursive, chunksize=args.chunksize, streaming=args.streaming,
+        sample=args.sample, stratify=args.stratify,
+    )
+    return 1 if counts["failed"] else 0
+
+
+def main(argv: Optional[List[str]] = None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "batch":
+        sys.exit(batch_main(argv[1:]))
+    p = argparse.ArgumentParser(prog="dataprofiler", epilog="dataprofiler batch <dir|glob> --out DIR profiles many files")
     p.add_argument("path")
+    p.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    p.add_argument("--schema", dest="schema", action="store_true", help="print the inferred column types and exit")
     p.add_argument("--out", dest="out", default=None)
     p.add_argument("--title", dest="title", default="Data Profile")
     p.add_argument("--json", dest="json_path", default=None)
-    args = p.parse_args()
-    ing = load_data(args.path)
-    df = pd.DataFrame(ing.rows)
-    prof = profile_data(df)
-    html = build_report(prof, output_dir=args.out, title=args.title)
-    if args.out:
-        export_html(html, args.out + "/report.html")
+    p.add_argument("--parquet", dest="parquet_path", default=None)
+    p.add_argument("--msgpack", dest="msgpack_path", default=None)
+    p.add_argument("--columns", dest="columns", default=None)
+    p.add_argument("--chunksize", dest="chunksize", type=int, default=None)
+    p.add_argument("--jobs", dest="n_jobs", type=int, default=None)
+    p.add_argument("--streaming", dest="streaming", action="store_true")
+    p.add_argument("--no-cache", dest="use_cache", action="store_false")
+    p.add_argument("--cache-dir", dest="cache_dir", default=PROFILE_CACHE_DIR)
+    p.add_argument("--sample", dest="sample", type=_sample_arg, default=None)
+    p.add_argument("--stratify", dest="stratify", default=None)
+    p.add_argument("--profile-stages", dest="profile_stages", action="store_true")
+    p.add_argument("--trace-memory", dest="trace_memory", action="store_true")
+    args = p.parse_args(argv)
+    usecols = [c.strip() for c in args.columns.split(",")] if args.columns else None
+    if args.stratify and args.sample is None:
+        p.error("--stratify requires --sample")
+    if args.schema:
+        from .ingestion.schema import read_schema
+        print(json.dumps(read_schema(args.path, usecols=usecols), indent=2, ensure_ascii=False))
+        return
+
+    from .cache import ProfileCache, profile_path
+    from .reports import write_report, export_json, export_msgpack, export_parquet, format_timings
+    from .utils.timer import record_stages
+
+    cache = ProfileCache(args.cache_dir) if args.use_cache else None
+    recording = record_stages(args.trace_memory) if args.profile_stages else nullcontext()
+    with recording as recorder:
+        prof = profile_path(
+            args.path, chunksize=args.chunksize, n_jobs=args.n_jobs, streaming=args.streaming, cache=cache,
+            usecols=usecols, sample=args.sample, stratify=args.stratify,
+        )
+        if args.out:
+            write_report(prof, os.path.join(args.out, "report.html"), title=args.title, n_jobs=args.n_jobs)
+        if recorder is not None:
+            prof.timings = recorder.timings()
     if args.json_path:
         export_json(prof, args.json_path)
+    if args.parquet_path:
+        export_parquet(prof, args.parquet_path)
+    if args.msgpack_path:
+        export_msgpack(prof, args.msgpack_path)
+    if recorder is not None:
+        print(format_timings(prof.timings))
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
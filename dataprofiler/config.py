@@ -1,3 +1,42 @@
 IQR_FACTOR = 1.5
 ZSCORE_THRESHOLD = 3.0
-IFOREST_CONTAMINATION = 0.01
\ No newline at end of file
+IFOREST_CONTAMINATION = 0.01
+MISSING_TOP_PATTERNS = 5
+CRAMER_MAX_CATEGORIES = 1000
+PROFILE_CACHE_DIR = "~/.cache/dataprofiler"
+PROFILE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+PROFILE_CACHE_MAX_ENTRIES = 256
+STREAMING_CHUNKSIZE = 100_000
+INFER_SAMPLE_ROWS = 500
+INFER_SAMPLE = "reservoir"
+PARALLEL_READ_MIN_BYTES = 32 * 1024 * 1024
+ARROW_BATCH_ROWS = 65536
+SAMPLE_CONFIDENCE = 0.95
+BENCH_HISTORY_PATH = "benchmark_history.json"
+BENCH_REGRESSION_THRESHOLD = 0.25
+BENCH_MIN_DELTA_SECONDS = 0.05
+BENCH_MIN_DELTA_BYTES = 4 * 1024 * 1024
+REPORT_MAX_FREQUENCIES = 20
+REPORT_HEATMAP_BLOCK = 50
+REPORT_HEATMAP_MAX_COLUMNS = 200
+REPORT_PARALLEL_MIN_COLUMNS = 500
+BATCH_TIMEOUT_SECONDS = 300.0
+BATCH_TIMEOUT_GRACE_SECONDS = 30.0
+BATCH_MAX_ATTEMPTS = 2
+BATCH_PROGRESS_EVERY = 500
+BENCH_STARTUP_BUDGET_SECONDS = 0.1
+IFOREST_TRAIN_ROWS = 65_536
+IFOREST_SCORE_CHUNK_ROWS = 65_536
+IFOREST_TOP_K = 100
+ANOMALY_BLOCK_ELEMENTS = 1 << 20
+STREAM_EWM_ALPHA = 0.05
+STREAM_WINDOW = 500
+STREAM_WARMUP = 30
+STREAM_MAD_THRESHOLD = 3.5
+CORR_BLOCK_ELEMENTS = 1 << 22
+CORR_SAMPLE_ROWS = None
+CORR_DTYPE = "float64"
+CORR_TOP_K = 10
+CORR_DENSE_MAX_COLUMNS = 500
+CORR_PAIRS_BLOCK_COLUMNS = 256
+REPORT_TOP_PAIRS = 50
@@ -1,4 +1,16 @@
-from .loader import load_data
-from .metadata import FileMetadata, IngestionStats, IngestionResult
+from dataprofiler._lazy import lazy_exports
 
-__all__ = ["load_data", "FileMetadata", "IngestionStats", "IngestionResult"]
\ No newline at end of file
+_EXPORTS = {
+    "load_data": ".loader",
+    "read_schema": ".schema",
+    "FileMetadata": ".metadata",
+    "IngestionStats": ".metadata",
+    "IngestionResult": ".metadata",
+    "IngestionChunk": ".metadata",
+    "FileFingerprint": ".metadata",
+    "ChunkedIngestion": ".streaming",
+    "ArrowIngestion": ".arrow_reader",
+    "file_fingerprint": ".reader",
+}
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
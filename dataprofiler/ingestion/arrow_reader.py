@@ -0,0 +1,124 @@
+import os
+from typing import Dict, Iterator, List, Optional
+import numpy as np
+import pandas as pd
+
+from .metadata import FileMetadata, IngestionStats
+from .reader import build_metadata
+from .validators import is_arrow_path
+from dataprofiler.config import ARROW_BATCH_ROWS
+from dataprofiler.utils.timer import stage
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+        import pyarrow.ipc
+    except Exception as e:
+        raise ImportError("pyarrow is required for Parquet/Feather/Arrow input. Install with `pip install pyarrow`.") from e
+    return pyarrow
+
+
+def _pandas_types(pa) -> Dict:
+    # Nullable pandas dtypes, matching what CSV coercion produces.
+    mapping = {t: pd.Int64Dtype() for t in (pa.int8(), pa.int16(), pa.int32(), pa.int64(), pa.uint8(), pa.uint16(), pa.uint32())}
+    mapping[pa.bool_()] = pd.BooleanDtype()
+    return mapping
+
+
+def _dtype_name(pa, t) -> str:
+    if pa.types.is_boolean(t):
+        return "bool"
+    if pa.types.is_integer(t):
+        return "int"
+    if pa.types.is_floating(t) or pa.types.is_decimal(t):
+        return "float"
+    if pa.types.is_timestamp(t) or pa.types.is_date(t):
+        return "datetime"
+    if pa.types.is_dictionary(t):
+        return "category"
+    return "string"
+
+
+class ArrowIngestion:
+    def __init__(self, path: str, columns: Optional[List[str]] = None, batch_size: int = ARROW_BATCH_ROWS):
+        self._pa = _require_pyarrow()
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+        self.path = path
+        self.batch_size = int(batch_size)
+        self.is_parquet = os.path.splitext(path)[1].lower() in (".parquet", ".pq")
+        schema = self._schema()
+        if columns is not None:
+            missing = [c for c in columns if c not in schema.names]
+            if missing:
+                raise KeyError(f"Columns not found in {path}: {missing}")
+        self.columns = list(columns) if columns is not None else list(schema.names)
+        self.dtypes: Dict[str, str] = {c: _dtype_name(self._pa, schema.field(c).type) for c in self.columns}
+        self.formats: Dict[str, str] = {}
+        self.metadata: FileMetadata = build_metadata(path, "binary", "", True, self.columns)
+        self.stats = IngestionStats(rows_read=0, bad_rows=0)
+
+    def _schema(self):
+        if self.is_parquet:
+            return self._pa.parquet.ParquetFile(self.path).schema_arrow
+        with self._pa.memory_map(self.path) as source:
+            return self._open_ipc(source).schema
+
+    def _open_ipc(self, source):
+        try:
+            return self._pa.ipc.open_file(source)
+        except self._pa.ArrowInvalid:
+            source.seek(0)
+            return self._pa.ipc.open_stream(source)
+
+    def iter_batches(self) -> Iterator:
+        if self.is_parquet:
+            # Row groups are decoded one batch at a time, projected columns only.
+            yield from self._pa.parquet.ParquetFile(self.path).iter_batches(batch_size=self.batch_size, columns=self.columns)
+            return
+        with self._pa.memory_map(self.path) as source:
+            reader = self._open_ipc(source)
+            if hasattr(reader, "num_record_batches"):
+                batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+            else:
+                batches = iter(reader)
+            for batch in batches:
+                yield batch.select(self.columns)
+
+    def _to_pandas(self, data) -> pd.DataFrame:
+        df = data.to_pandas(types_mapper=_pandas_types(self._pa).get, date_as_object=False)
+        # Text stays object dtype, as it does for CSV input; decimals arrive as
+        # object columns of Decimal and become float64 like the schema says.
+        for col, dtype in self.dtypes.items():
+            if dtype == "string" and df[col].dtype != object:
+                df[col] = df[col].astype(object)
+            elif dtype == "float" and df[col].dtype == object:
+                df[col] = df[col].astype(np.float64)
+        return df
+
+    def iter_frames(self) -> Iterator[pd.DataFrame]:
+        self.stats = IngestionStats(rows_read=0, bad_rows=0)
+        batches = self.iter_batches()
+        while True:
+            with stage("read_arrow") as t:
+                batch = next(batches, None)
+                if batch is None:
+                    break
+                frame = self._to_pandas(batch)
+                if t:
+                    t.rows = batch.num_rows
+            self.stats.rows_read += batch.num_rows
+            yield frame
+
+    def to_frame(self) -> pd.DataFrame:
+        if self.is_parquet:
+            table = self._pa.parquet.read_table(self.path, columns=self.columns)
+            df = self._to_pandas(table)
+        else:
+            with self._pa.memory_map(self.path) as source:
+                table = self._open_ipc(source).read_all().select(self.columns)
+                df = self._to_pandas(table)
+        self.stats = IngestionStats(rows_read=table.num_rows, bad_rows=0)
+        return df
@@ -0,0 +1,194 @@
+from itertools import product
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+
+from .sanitizer import _MISSING, _DATE_FORMATS, _normalize_missing, _to_int, _to_float, _to_datetime
+
+
+def _case_variants(words) -> List[str]:
+    return sorted({"".join(p) for w in words for p in product(*({c.lower(), c.upper()} for c in w))})
+
+
+_MISSING_TOKENS = _case_variants(_MISSING)
+_TRUE_VALUES = _case_variants(["true", "yes", "1"])
+_FALSE_VALUES = _case_variants(["false", "no", "0"])
+_TYPED = {"bool", "int", "float", "datetime"}
+_MAX_TOKEN_LEN = 64
+# Longer digit runs may not fit int64 and go through _to_int as exact Python ints.
+_MAX_INT64_DIGITS = 18
+_NS_MIN = np.datetime64("1677-09-22", "D")
+_NS_MAX = np.datetime64("2262-04-11", "D")
+
+
+def resolve_datetime_format(values: np.ndarray, max_values: int = 500) -> Optional[str]:
+    sample = values[:max_values]
+    if sample.size == 0:
+        return None
+    best, best_hits = None, 0
+    for fmt in _DATE_FORMATS:
+        hits = int(pd.to_datetime(sample, format=fmt, errors="coerce").notna().sum())
+        if hits > best_hits:
+            best, best_hits = fmt, hits
+            if hits == sample.size:
+                break
+    return best
+
+
+def _tokens(values: Sequence[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    values = list(values)
+    lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+    oversized = lengths > _MAX_TOKEN_LEN
+    for i in np.flatnonzero(oversized):
+        s = values[i].strip()
+        oversized[i] = len(s) > _MAX_TOKEN_LEN
+        values[i] = "" if oversized[i] else s
+    stripped = np.char.strip(np.asarray(values, dtype=str))
+    missing = np.isin(stripped, _MISSING_TOKENS) & ~oversized
+    return stripped, missing, oversized
+
+
+def _rescue(raw: Sequence[str], failed: np.ndarray, convert) -> Tuple[np.ndarray, List[Any]]:
+    idx = np.flatnonzero(failed)
+    rescued = [convert(str(raw[i]).strip()) for i in idx]
+    ok = np.array([v is not None for v in rescued], dtype=bool)
+    failed[idx[ok]] = False
+    return idx[ok], [v for v in rescued if v is not None]
+
+
+def _coerce_int(raw: Sequence[str], stripped: np.ndarray, pending: np.ndarray, oversized: np.ndarray) -> Tuple[Any, np.ndarray]:
+    signs = np.char.count(stripped, "+") + np.char.count(stripped, "-")
+    digits = np.char.lstrip(stripped, "+-")
+    plain = pending & (signs <= 1) & np.char.isdigit(digits) & (np.char.str_len(digits) <= _MAX_INT64_DIGITS)
+    parsed = np.full(len(stripped), np.nan, dtype=object)
+    if plain.any():
+        parsed[plain] = pd.to_numeric(stripped[plain], errors="coerce")
+    failed = (pending & pd.isna(parsed)) | oversized
+    idx, rescued = _rescue(raw, failed, _to_int)
+    parsed[idx] = rescued
+    try:
+        return pd.array(parsed, dtype="Int64"), failed
+    except (TypeError, ValueError, OverflowError):
+        return parsed, failed
+
+
+def _parse_floats(tokens: np.ndarray) -> np.ndarray:
+    try:
+        return tokens.astype(np.float64)
+    except ValueError:
+        out = pd.to_numeric(tokens, errors="coerce").astype(np.float64)
+        ok = ~np.isnan(out)
+        try:
+            out[ok] = tokens[ok].astype(np.float64)
+        except ValueError:
+            out[ok] = np.nan
+        return out
+
+
+def _coerce_float(raw: Sequence[str], stripped: np.ndarray, pending: np.ndarray, oversized: np.ndarray) -> Tuple[Any, np.ndarray]:
+    out = np.full(len(stripped), np.nan, dtype=np.float64)
+    if pending.any():
+        out[pending] = _parse_floats(stripped[pending])
+    failed = (pending & np.isnan(out)) | oversized
+    idx, rescued = _rescue(raw, failed, _to_float)
+    out[idx] = rescued
+    return out, failed
+
+
+def _coerce_bool(raw: Sequence[str], stripped: np.ndarray, pending: np.ndarray, oversized: np.ndarray) -> Tuple[Any, np.ndarray]:
+    truthy = np.isin(stripped, _TRUE_VALUES) & pending
+    falsy = np.isin(stripped, _FALSE_VALUES) & pending
+    arr = pd.array(truthy, dtype="boolean")
+    arr[~(truthy | falsy)] = pd.NA
+    return arr, (pending & ~(truthy | falsy)) | oversized
+
+
+def _to_ns(vals: np.ndarray) -> np.ndarray:
+    if vals.dtype == np.dtype("datetime64[ns]"):
+        return vals
+    inside = (vals >= _NS_MIN) & (vals < _NS_MAX)
+    out = np.full(len(vals), np.datetime64("NaT"), dtype="datetime64[ns]")
+    out[inside] = vals[inside].astype("datetime64[ns]")
+    return out
+
+
+def _coerce_datetime(raw: Sequence[str], stripped: np.ndarray, pending: np.ndarray, oversized: np.ndarray, fmt: Optional[str]) -> Tuple[Any, np.ndarray]:
+    fmt = fmt or resolve_datetime_format(stripped[pending])
+    out = np.full(len(stripped), np.datetime64("NaT"), dtype="datetime64[ns]")
+    todo = pending.copy()
+    for f in ([fmt] if fmt else []) + [f for f in _DATE_FORMATS if f != fmt]:
+        if not todo.any():
+            break
+        idx = np.flatnonzero(todo)
+        vals = _to_ns(np.asarray(pd.to_datetime(stripped[idx], format=f, errors="coerce")))
+        # Dates outside the datetime64[ns] range stay pending and end up counted as failures.
+        hit = ~np.isnat(vals)
+        out[idx[hit]] = vals[hit]
+        todo[idx[hit]] = False
+    failed = todo | oversized
+    for i, v in zip(*_rescue(raw, failed, _to_datetime)):
+        try:
+            out[i] = pd.Timestamp(v).as_unit("ns").to_datetime64()
+        except (OverflowError, ValueError):
+            failed[i] = True
+    return out, failed
+
+
+def coerce_column(values: Sequence[str], dtype: str, fmt: Optional[str] = None) -> Tuple[Any, np.ndarray]:
+    if dtype not in _TYPED:
+        out = np.empty(len(values), dtype=object)
+        out[:] = [_normalize_missing(str(v)) for v in values]
+        return out, np.zeros(len(values), dtype=bool)
+    stripped, missing, oversized = _tokens(values)
+    pending = ~missing & ~oversized
+    if dtype == "bool":
+        return _coerce_bool(values, stripped, pending, oversized)
+    if dtype == "int":
+        return _coerce_int(values, stripped, pending, oversized)
+    if dtype == "float":
+        return _coerce_float(values, stripped, pending, oversized)
+    return _coerce_datetime(values, stripped, pending, oversized, fmt)
+
+
+def coerce_columns(columns: Dict[str, Sequence[str]], dtypes: Dict[str, str], formats: Optional[Dict[str, str]] = None) -> Tuple[Dict[str, Any], int]:
+    formats = formats or {}
+    out: Dict[str, Any] = {}
+    bad: Optional[np.ndarray] = None
+    for col, dtype in dtypes.items():
+        arr, failed = coerce_column(columns.get(col, []), dtype, formats.get(col))
+        out[col] = arr
+        if dtype in _TYPED:
+            bad = failed if bad is None else (bad | failed)
+    return out, int(bad.sum()) if bad is not None else 0
+
+
+def concat_columns(parts: List[Dict[str, Any]], dtypes: Dict[str, str]) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    for col in dtypes:
+        arrays = [p[col] for p in parts]
+        kinds = {type(a) for a in arrays}
+        if len(kinds) == 1 and not issubclass(kinds.pop(), np.ndarray):
+            out[col] = type(arrays[0])._concat_same_type(arrays)
+        elif all(isinstance(a, np.ndarray) for a in arrays):
+            out[col] = np.concatenate(arrays)
+        else:
+            out[col] = np.concatenate([np.asarray(a, dtype=object) for a in arrays])
+    return out
+
+
+def build_frame(columns: Dict[str, Any], dtypes: Dict[str, str]) -> pd.DataFrame:
+    data: Dict[str, Any] = {}
+    for col, dtype in dtypes.items():
+        arr = columns[col]
+        if dtype == "category":
+            arr = pd.Categorical(arr)
+        elif dtype not in _TYPED:
+            arr = pd.Series(arr, dtype=object, copy=False)
+        data[col] = arr
+    return pd.DataFrame(data, columns=list(dtypes), copy=False)
+
+
+def column_values(arr: Any) -> List[Any]:
+    if isinstance(arr, np.ndarray) and arr.dtype.kind == "M":
+        return [None if v is None else v for v in arr.astype("datetime64[us]").astype(object)]
+    return [None if v is pd.NA or (isinstance(v, float) and np.isnan(v)) else v for v in np.asarray(arr, dtype=object)]
@@ -1,17 +1,20 @@
+import codecs
+
+_BOMS = [
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+
 def detect_encoding(sample: bytes) -> str:
-    candidates = [
-        "utf-8",
-        "utf-8-sig",
-        "utf-16",
-        "utf-16le",
-        "utf-16be",
-        "latin-1",
-        "ascii",
-    ]
-    for enc in candidates:
-        try:
-            sample.decode(enc)
+    for bom, enc in _BOMS:
+        if sample.startswith(bom):
             return enc
-        except Exception:
-            continue
-    return "utf-8"
\ No newline at end of file
+    # Without a BOM almost any even-length sample decodes as UTF-16, so only
+    # UTF-8 is tried; the sample may end mid-character.
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "latin-1"
@@ -1,10 +1,18 @@
+import math
+import random
 import re
-from typing import Dict, List, Iterable
-from datetime import datetime
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
+import numpy as np
 
+from dataprofiler.config import INFER_SAMPLE, INFER_SAMPLE_ROWS
 
-_INT_RE = re.compile(r"^[+-]?\d+$")
-_FLOAT_RE = re.compile(r"^[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?$")
+
+_INT_RE = re.compile(r"[+-]?\d+")
+_FLOAT_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+# Superset of everything the formats below accept; cheap to test before
+# running the real parsers.
+_DATE_LIKE_RE = re.compile(r"\d{1,4}[-/](?:\d{1,2}|[A-Za-z]{3})[-/]\d{1,4}(?:\s+\d{1,2}:\d{1,2}:\d{1,2})?")
 _BOOL_VALUES = {"true", "false", "yes", "no", "0", "1"}
 _DATE_FORMATS = [
     "%Y-%m-%d",
@@ -14,58 +22,139 @@ _DATE_FORMATS = [
     "%d-%b-%Y",
     "%Y/%m/%d",
 ]
+_BLOCK = 64
 
+T = TypeVar("T")
 
-def _is_int(s: str) -> bool:
-    return bool(_INT_RE.match(s))
 
+def _uniform(rng: random.Random) -> float:
+    u = rng.random()
+    while u == 0.0:
+        u = rng.random()
+    return u
 
-def _is_float(s: str) -> bool:
-    return bool(_FLOAT_RE.match(s))
 
+def reservoir_sample(items: Iterable[T], k: int = INFER_SAMPLE_ROWS, seed: int = 0) -> List[T]:
+    # Algorithm L (Li 1994): skips ahead geometrically instead of drawing
+    # a random number per item.
+    it = iter(items)
+    sample = list(islice(it, k))
+    if len(sample) < k or k <= 0:
+        return sample
+    rng = random.Random(seed)
+    w = math.exp(math.log(_uniform(rng)) / k)
+    missing = object()
+    while True:
+        skip = int(math.log(_uniform(rng)) / math.log1p(-w)) if w < 1.0 else 0
+        item = next(islice(it, skip, None), missing)
+        if item is missing:
+            return sample
+        sample[rng.randrange(k)] = item
+        w *= math.exp(math.log(_uniform(rng)) / k)
 
-def _is_bool(s: str) -> bool:
-    return s.lower() in _BOOL_VALUES
 
+def check_infer_sample(infer_sample: str) -> str:
+    if infer_sample not in ("head", "reservoir"):
+        raise ValueError("infer_sample must be 'head' or 'reservoir'")
+    return infer_sample
 
-def _is_datetime(s: str) -> bool:
-    for fmt in _DATE_FORMATS:
-        try:
-            datetime.strptime(s, fmt)
+
+def inference_sample(records: Iterable[T], infer_sample: str = INFER_SAMPLE) -> List[T]:
+    # Every read path draws its sample here, so a file infers the same
+    # dtypes however it is read.
+    if check_infer_sample(infer_sample) == "head":
+        return list(islice(records, INFER_SAMPLE_ROWS))
+    return reservoir_sample(records)
+
+
+def _fullmatch(pattern: "re.Pattern") -> Callable[[np.ndarray], np.ndarray]:
+    match = pattern.fullmatch
+    return lambda block: np.fromiter((match(v) is not None for v in block.tolist()), dtype=bool, count=block.size)
+
+
+def _is_bool(block: np.ndarray) -> np.ndarray:
+    return np.isin(np.char.lower(block.astype(str)), list(_BOOL_VALUES))
+
+
+def _reaches(values: np.ndarray, score: Callable[[np.ndarray], np.ndarray], threshold: float, best: int = 1) -> bool:
+    # Scores blocks until the threshold is either met or out of reach.
+    n = values.size
+    need = threshold * n
+    got = 0
+    for start in range(0, n, _BLOCK):
+        got += int(score(values[start:start + _BLOCK]).sum())
+        if got > need:
             return True
-        except Exception:
-            continue
-    return False
+        if got + best * max(n - start - _BLOCK, 0) <= need:
+            return False
+    return got > need
+
 
+def _datetime_format(values: np.ndarray, threshold: float) -> Optional[str]:
+    if not _reaches(values, _fullmatch(_DATE_LIKE_RE), threshold):
+        return None
+    import pandas as pd
+    parsed = np.zeros(values.size, dtype=bool)
+    best, best_hits = None, 0
+    for fmt in _DATE_FORMATS:
+        hits = pd.to_datetime(pd.Series(values, dtype=object), format=fmt, errors="coerce").notna().to_numpy()
+        parsed |= hits
+        if hits.sum() > best_hits:
+            best, best_hits = fmt, int(hits.sum())
+            if best_hits == values.size:
+                break
+    return best if parsed.sum() / values.size > threshold else None
+
+
+def _int_or_float(block: np.ndarray) -> np.ndarray:
+    # Integers match both patterns and count twice, as they always have.
+    return _fullmatch(_FLOAT_RE)(block).astype(np.int64) + _fullmatch(_INT_RE)(block)
+
+
+def _infer_column(values: np.ndarray) -> Tuple[str, Optional[str]]:
+    values = np.char.strip(values.astype(str))
+    values = values[values != ""]
+    if values.size == 0:
+        return "string", None
+    fmt = _datetime_format(values, 0.8)
+    if fmt is not None:
+        return "datetime", fmt
+    if _reaches(values, _is_bool, 0.9):
+        return "bool", None
+    if _reaches(values, _fullmatch(_INT_RE), 0.9):
+        return "int", None
+    if _reaches(values, _int_or_float, 0.9, best=2):
+        return "float", None
+    unique = np.unique(values).size
+    if unique <= 20 and unique / values.size <= 0.1:
+        return "category", None
+    return "string", None
 
-def infer_dtypes(rows: List[Dict[str, str]], columns: List[str], max_rows: int = 500) -> Dict[str, str]:
-    sample = rows[:max_rows]
+
+def infer_schema(rows: Sequence[Sequence[str]], columns: List[str]) -> Tuple[Dict[str, str], Dict[str, str]]:
     dtypes: Dict[str, str] = {}
-    for col in columns:
-        values: Iterable[str] = (str(r.get(col, "")).strip() for r in sample)
-        non_empty = [v for v in values if v != ""]
-        if not non_empty:
-            dtypes[col] = "string"
-            continue
-        checks = {
-            "bool": sum(_is_bool(v) for v in non_empty),
-            "int": sum(_is_int(v) for v in non_empty),
-            "float": sum(_is_float(v) for v in non_empty),
-            "datetime": sum(_is_datetime(v) for v in non_empty),
-        }
-        n = len(non_empty)
-        if checks["datetime"] / n > 0.8:
-            dtypes[col] = "datetime"
-        elif checks["bool"] / n > 0.9:
-            dtypes[col] = "bool"
-        elif checks["int"] / n > 0.9:
-            dtypes[col] = "int"
-        elif (checks["float"] + checks["int"]) / n > 0.9:
-            dtypes[col] = "float"
-        else:
-            unique = len(set(non_empty))
-            if unique <= 20 and unique / max(1, n) <= 0.1:
-                dtypes[col] = "category"
-            else:
-                dtypes[col] = "string"
-    return dtypes
\ No newline at end of file
+    formats: Dict[str, str] = {}
+    sample = [list(r) + [""] * (len(columns) - len(r)) for r in rows]
+    transposed = list(zip(*sample)) if sample else [() for _ in columns]
+    for col, values in zip(columns, transposed):
+        dtype, fmt = _infer_column(np.asarray(values, dtype=object))
+        dtypes[col] = dtype
+        if fmt is not None:
+            formats[col] = fmt
+    return dtypes, formats
+
+
+def infer_dtypes(rows: List[Dict[str, str]], columns: List[str], max_rows: int = INFER_SAMPLE_ROWS) -> Dict[str, str]:
+    sample = [[str(r.get(col, "")) for col in columns] for r in rows[:max_rows]]
+    return infer_schema(sample, columns)[0]
+
+
+def project_schema(
+    dtypes: Dict[str, str], formats: Dict[str, str], usecols: Optional[Sequence[str]]
+) -> Tuple[Dict[str, str], Dict[str, str]]:
+    if usecols is None:
+        return dtypes, formats
+    missing = [c for c in usecols if c not in dtypes]
+    if missing:
+        raise KeyError(f"Columns not found: {missing}")
+    return {c: dtypes[c] for c in usecols}, {c: f for c, f in formats.items() if c in usecols}
@@ -1,57 +1,91 @@
-import csv
 import os
-from typing import List, Dict, Any
-from datetime import datetime
+from typing import List, Dict, Optional, Union
 
-from .validators import ensure_path_exists, ensure_extension_allowed, sample_file, is_probably_text
-from .detect_encoding import detect_encoding
-from .detect_delimiter import detect_delimiter_and_header
-from .infer_dtypes import infer_dtypes
-from .sanitizer import sanitize_rows
-from .metadata import FileMetadata, IngestionStats, IngestionResult
+from .reader import detect_format, open_records, build_metadata, is_ascii_compatible
+from .parallel_reader import read_parallel
+from .infer_dtypes import check_infer_sample, infer_schema, inference_sample, project_schema
+from .arrow_reader import ArrowIngestion
+from .validators import ensure_path_exists, is_arrow_path
+from .coercion import coerce_columns, column_values, build_frame
+from .metadata import IngestionStats, IngestionResult
+from .streaming import ChunkedIngestion
+from dataprofiler.config import INFER_SAMPLE, PARALLEL_READ_MIN_BYTES, ARROW_BATCH_ROWS
+from dataprofiler.utils import resolve_n_jobs
+from dataprofiler.utils.timer import stage
 
 
-def load_data(path: str, sample_size: int = 8192) -> IngestionResult:
+def _load_arrow(
+    path: str, chunksize: Optional[int], as_frame: bool, usecols: Optional[List[str]]
+) -> Union[IngestionResult, ArrowIngestion]:
+    ingest = ArrowIngestion(path, columns=usecols, batch_size=chunksize or ARROW_BATCH_ROWS)
+    if chunksize is not None:
+        return ingest
+    with stage("read_arrow") as t:
+        frame = ingest.to_frame()
+        if t:
+            t.rows = len(frame)
+    if as_frame:
+        return IngestionResult(rows=[], metadata=ingest.metadata, stats=ingest.stats, dtypes=ingest.dtypes, frame=frame)
+    rows: List[Dict] = frame.astype(object).where(frame.notna(), None).to_dict("records")
+    return IngestionResult(rows=rows, metadata=ingest.metadata, stats=ingest.stats, dtypes=ingest.dtypes)
+
+
+def load_data(
+    path: str,
+    sample_size: int = 8192,
+    chunksize: Optional[int] = None,
+    as_frame: bool = False,
+    infer_sample: str = INFER_SAMPLE,
+    n_jobs: Optional[int] = None,
+    usecols: Optional[List[str]] = None,
+) -> Union[IngestionResult, ChunkedIngestion, ArrowIngestion]:
     ensure_path_exists(path)
-    ensure_extension_allowed(path)
-
-    sample = sample_file(path, sample_size)
-    if not is_probably_text(sample):
-        raise ValueError("File does not appear to be a text-based delimited file")
-
-    encoding = detect_encoding(sample)
-    sample_text = sample.decode(encoding, errors="replace")
-    delimiter, has_header = detect_delimiter_and_header(sample_text)
-
-    rows: List[Dict[str, str]] = []
-    columns: List[str] = []
-    with open(path, "r", encoding=encoding, newline="") as f:
-        reader = csv.reader(f, delimiter=delimiter)
-        if has_header:
-            try:
-                columns = next(reader)
-            except StopIteration:
-                columns = []
-        for i, row in enumerate(reader):
-            if not columns:
-                columns = [f"col_{j+1}" for j in range(len(row))]
-            record = {columns[j]: (row[j] if j < len(row) else "") for j in range(len(columns))}
-            rows.append(record)
-
-    dtypes = infer_dtypes(rows, columns)
-    typed_rows, bad_rows = sanitize_rows(rows, dtypes)
-
-    size_bytes = os.path.getsize(path)
-    modified_at = datetime.fromtimestamp(os.path.getmtime(path))
-
-    meta = FileMetadata(
-        path=path,
-        size_bytes=size_bytes,
-        modified_at=modified_at,
-        encoding=encoding,
-        delimiter=delimiter,
-        has_header=has_header,
-        columns=columns,
-    )
-    stats = IngestionStats(rows_read=len(rows), bad_rows=bad_rows)
-    return IngestionResult(rows=typed_rows, metadata=meta, stats=stats, dtypes=dtypes)
\ No newline at end of file
+    check_infer_sample(infer_sample)
+    if is_arrow_path(path):
+        return _load_arrow(path, chunksize, as_frame, usecols)
+    with stage("detect_format"):
+        encoding, delimiter, has_header = detect_format(path, sample_size)
+    if chunksize is not None:
+        return ChunkedIngestion(
+            path, encoding, delimiter, has_header, chunksize, infer_sample=infer_sample, usecols=usecols
+        )
+    # Parallel range parsing only pays off on large files, and needs byte
+    # offsets that land on character boundaries.
+    workers = resolve_n_jobs(n_jobs)
+    if workers > 1 and not (is_ascii_compatible(encoding) and os.path.getsize(path) >= PARALLEL_READ_MIN_BYTES):
+        workers = 1
+
+    with stage("read") as t, open(path, "r", encoding=encoding, newline="") as f:
+        columns, records = open_records(f, delimiter, has_header)
+        raw: List[List[str]] = [] if workers > 1 else list(records)
+        if t:
+            t.rows = len(raw)
+
+    if workers > 1:
+        with stage("parallel_read") as t:
+            dtypes, formats, typed, rows_read, bad_rows = read_parallel(
+                path, encoding, delimiter, columns, has_header, workers, usecols, infer_sample
+            )
+            if t:
+                t.rows = rows_read
+    else:
+        with stage("infer_schema"):
+            sample = inference_sample(raw, infer_sample)
+            dtypes, formats = project_schema(*infer_schema(sample, columns), usecols)
+            del sample
+        raw_columns = dict(zip(columns, zip(*raw))) if raw else {c: () for c in columns}
+        rows_read = len(raw)
+        del raw
+        with stage("coerce", rows=rows_read):
+            typed, bad_rows = coerce_columns(raw_columns, dtypes, formats)
+        del raw_columns
+
+    meta = build_metadata(path, encoding, delimiter, has_header, columns)
+    stats = IngestionStats(rows_read=rows_read, bad_rows=bad_rows)
+    if as_frame:
+        with stage("build_frame", rows=rows_read):
+            frame = build_frame(typed, dtypes)
+        return IngestionResult(rows=[], metadata=meta, stats=stats, dtypes=dtypes, frame=frame)
+    values = [column_values(typed[c]) for c in dtypes]
+    rows: List[Dict] = [dict(zip(dtypes, r)) for r in zip(*values)]
+    return IngestionResult(rows=rows, metadata=meta, stats=stats, dtypes=dtypes)
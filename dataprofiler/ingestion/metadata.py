@@ -1,7 +1,10 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 from datetime import datetime
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 @dataclass
 class FileMetadata:
@@ -25,4 +28,22 @@ class IngestionResult:
     rows: List[Dict[str, Any]]
     metadata: FileMetadata
     stats: IngestionStats
-    dtypes: Dict[str, str]
\ No newline at end of file
+    dtypes: Dict[str, str]
+    frame: Optional["pd.DataFrame"] = None
+
+
+@dataclass
+class IngestionChunk:
+    columns: Dict[str, Any]
+    start: int
+    rows: int
+    bad_rows: int
+
+@dataclass
+class FileFingerprint:
+    path: str
+    size_bytes: int
+    modified_at: datetime
+    head_digest: str
+    tail_digest: str
+    ends_with_newline: bool
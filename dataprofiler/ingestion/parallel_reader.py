@@ -0,0 +1,113 @@
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+from .reader import open_records, open_text_range
+from .infer_dtypes import infer_schema, inference_sample, project_schema
+from .coercion import coerce_columns, concat_columns
+from dataprofiler.config import INFER_SAMPLE
+
+_QUOTE = ord('"')
+_NEWLINE = ord("\n")
+_SCAN_WINDOW = 1 << 20
+
+
+def _quote_parity(buf: np.ndarray, start: int, end: int) -> int:
+    parity = 0
+    for a in range(start, end, 64 * _SCAN_WINDOW):
+        parity ^= int(np.count_nonzero(buf[a:min(end, a + 64 * _SCAN_WINDOW)] == _QUOTE)) & 1
+    return parity
+
+
+def _record_boundary(buf: np.ndarray, pos: int, parity: int) -> int:
+    # First offset at or after ``pos`` that starts a record: just past a
+    # newline with an even number of quotes since the last known boundary.
+    while pos < buf.size:
+        window = buf[pos:pos + _SCAN_WINDOW]
+        inside = (np.cumsum(window == _QUOTE) + parity) & 1
+        hits = np.flatnonzero((window == _NEWLINE) & (inside == 0))
+        if hits.size:
+            return pos + int(hits[0]) + 1
+        parity = int(inside[-1])
+        pos += window.size
+    return int(buf.size)
+
+
+def split_ranges(path: str, parts: int, has_header: bool) -> List[Tuple[int, int]]:
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            buf = np.frombuffer(mm, dtype=np.uint8)
+            try:
+                start = _record_boundary(buf, 0, 0) if has_header else 0
+                bounds = [start]
+                step = max((size - start) // max(parts, 1), 1)
+                for i in range(1, parts):
+                    target = max(start + i * step, bounds[-1])
+                    boundary = _record_boundary(buf, target, _quote_parity(buf, bounds[-1], target))
+                    if boundary >= size:
+                        break
+                    if boundary > bounds[-1]:
+                        bounds.append(boundary)
+            finally:
+                del buf
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+def _read_range(path: str, encoding: str, delimiter: str, columns: List[str], start: int, end: int) -> List[List[str]]:
+    with open_text_range(path, encoding, start, end) as f:
+        _, records = open_records(f, delimiter, False, columns=columns)
+        return list(records)
+
+
+def _parse_range(
+    path: str,
+    encoding: str,
+    delimiter: str,
+    columns: List[str],
+    dtypes: Dict[str, str],
+    formats: Dict[str, str],
+    start: int,
+    end: int,
+) -> Tuple[int, int, Dict[str, Any]]:
+    raw = _read_range(path, encoding, delimiter, columns, start, end)
+    n = len(raw)
+    raw_columns: Dict[str, Sequence[str]] = dict(zip(columns, zip(*raw))) if raw else {c: () for c in columns}
+    del raw
+    typed, bad_rows = coerce_columns(raw_columns, dtypes, formats)
+    return n, bad_rows, typed
+
+
+def read_parallel(
+    path: str,
+    encoding: str,
+    delimiter: str,
+    columns: List[str],
+    has_header: bool,
+    workers: int,
+    usecols: Optional[Sequence[str]] = None,
+    infer_sample: str = INFER_SAMPLE,
+) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, Any], int, int]:
+    # Sampled over the whole file in row order, exactly as the eager path
+    # samples its rows; the reservoir costs one extra sequential pass.
+    with open(path, "r", encoding=encoding, newline="") as f:
+        _, records = open_records(f, delimiter, has_header)
+        sample = inference_sample(records, infer_sample)
+    ranges = split_ranges(path, workers, has_header)
+    dtypes, formats = project_schema(*infer_schema(sample, columns), usecols)
+    del sample
+    if not ranges:
+        typed, _ = coerce_columns({c: () for c in columns}, dtypes, formats)
+        return dtypes, formats, typed, 0, 0
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+        futures = [
+            pool.submit(_parse_range, path, encoding, delimiter, columns, dtypes, formats, a, b) for a, b in ranges
+        ]
+        results = [fut.result() for fut in futures]
+    typed = concat_columns([r[2] for r in results], dtypes)
+    return dtypes, formats, typed, sum(r[0] for r in results), sum(r[1] for r in results)
@@ -0,0 +1,138 @@
+import codecs
+import csv
+import hashlib
+import io
+import os
+from typing import BinaryIO, Iterator, List, Optional, Tuple, TextIO
+from datetime import datetime
+
+from .validators import ensure_path_exists, ensure_extension_allowed, sample_file, is_probably_text, TEXT_EXTENSIONS
+from .detect_encoding import detect_encoding
+from .detect_delimiter import detect_delimiter_and_header
+from .metadata import FileMetadata, FileFingerprint
+
+_FINGERPRINT_WINDOW = 64 * 1024
+
+
+def detect_format(path: str, sample_size: int = 8192) -> Tuple[str, str, bool]:
+    ensure_path_exists(path)
+    ensure_extension_allowed(path, TEXT_EXTENSIONS)
+
+    sample = sample_file(path, sample_size)
+    if not is_probably_text(sample):
+        raise ValueError("File does not appear to be a text-based delimited file")
+
+    encoding = detect_encoding(sample)
+    sample_text = sample.decode(encoding, errors="replace")
+    delimiter, has_header = detect_delimiter_and_header(sample_text)
+    return encoding, delimiter, has_header
+
+
+def is_ascii_compatible(encoding: str) -> bool:
+    probe = "\n\r\t\",;|:0123456789abcXYZ"
+    try:
+        encoded = probe.encode(encoding)
+    except (LookupError, UnicodeError):
+        return False
+    return encoded[len(codecs.BOM_UTF8):] == probe.encode("ascii") if encoded.startswith(codecs.BOM_UTF8) else encoded == probe.encode("ascii")
+
+
+class _ByteRange(io.RawIOBase):
+    def __init__(self, f: BinaryIO, length: Optional[int]):
+        self._f = f
+        self._remaining = length
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buf) -> int:
+        view = memoryview(buf)
+        if self._remaining is not None:
+            view = view[: self._remaining]
+        n = self._f.readinto(view) or 0
+        if self._remaining is not None:
+            self._remaining -= n
+        return n
+
+    def close(self) -> None:
+        self._f.close()
+        super().close()
+
+
+def open_text_range(path: str, encoding: str, start: int = 0, end: Optional[int] = None) -> TextIO:
+    if start and not is_ascii_compatible(encoding):
+        raise ValueError(f"Cannot read {encoding} text from a byte offset")
+    raw = open(path, "rb")
+    raw.seek(start)
+    length = None if end is None else max(0, end - start)
+    return io.TextIOWrapper(io.BufferedReader(_ByteRange(raw, length)), encoding=encoding, newline="")
+
+
+def _digest(f: BinaryIO, start: int, length: int) -> str:
+    f.seek(start)
+    return hashlib.blake2b(f.read(length), digest_size=16).hexdigest()
+
+
+def file_fingerprint(path: str, size_bytes: Optional[int] = None) -> FileFingerprint:
+    st = os.stat(path)
+    size = st.st_size if size_bytes is None else min(int(size_bytes), st.st_size)
+    window = min(_FINGERPRINT_WINDOW, size)
+    with open(path, "rb") as f:
+        head = _digest(f, 0, window)
+        tail = _digest(f, size - window, window)
+        f.seek(max(size - 1, 0))
+        last = f.read(1) if size else b""
+    return FileFingerprint(
+        path=os.path.abspath(path),
+        size_bytes=size,
+        modified_at=datetime.fromtimestamp(st.st_mtime),
+        head_digest=head,
+        tail_digest=tail,
+        ends_with_newline=last == b"\n",
+    )
+
+
+def is_appended(old: FileFingerprint, path: str) -> bool:
+    if not old.ends_with_newline or os.path.getsize(path) <= old.size_bytes:
+        return False
+    prefix = file_fingerprint(path, old.size_bytes)
+    return prefix.head_digest == old.head_digest and prefix.tail_digest == old.tail_digest
+
+
+def open_records(
+    f: TextIO, delimiter: str, has_header: bool, columns: Optional[List[str]] = None
+) -> Tuple[List[str], Iterator[List[str]]]:
+    reader = csv.reader(f, delimiter=delimiter)
+    if columns is not None:
+        columns = list(columns)
+    elif has_header:
+        columns = next(reader, [])
+    else:
+        columns = []
+    first = None
+    if not columns:
+        first = next(reader, None)
+        columns = [f"col_{j+1}" for j in range(len(first))] if first is not None else []
+    width = len(columns)
+
+    def records() -> Iterator[List[str]]:
+        if first is not None:
+            yield first
+        for row in reader:
+            if len(row) != width:
+                row = (row + [""] * (width - len(row)))[:width]
+            yield row
+
+    return columns, records()
+
+
+def build_metadata(path: str, encoding: str, delimiter: str, has_header: bool, columns: List[str]) -> FileMetadata:
+    return FileMetadata(
+        path=path,
+        size_bytes=os.path.getsize(path),
+        modified_at=datetime.fromtimestamp(os.path.getmtime(path)),
+        encoding=encoding,
+        delimiter=delimiter,
+        has_header=has_header,
+        columns=columns,
+    )
@@ -43,8 +43,8 @@ _DATE_FORMATS = [
 ]
 
 
-def _to_datetime(s: str) -> Optional[datetime]:
-    for fmt in _DATE_FORMATS:
+def _to_datetime(s: str, preferred: Optional[str] = None) -> Optional[datetime]:
+    for fmt in ([preferred] if preferred else []) + _DATE_FORMATS:
         try:
             return datetime.strptime(s, fmt)
         except Exception:
@@ -52,7 +52,10 @@ def _to_datetime(s: str) -> Optional[datetime]:
     return None
 
 
-def sanitize_rows(rows: List[Dict[str, str]], dtypes: Dict[str, str]) -> Tuple[List[Dict[str, Any]], int]:
+def sanitize_rows(
+    rows: List[Dict[str, str]], dtypes: Dict[str, str], formats: Optional[Dict[str, str]] = None
+) -> Tuple[List[Dict[str, Any]], int]:
+    formats = formats or {}
     out: List[Dict[str, Any]] = []
     bad_rows = 0
     for r in rows:
@@ -71,7 +74,7 @@ def sanitize_rows(rows: List[Dict[str, str]], dtypes: Dict[str, str]) -> Tuple[L
             elif dtype == "float":
                 val = _to_float(norm)
             elif dtype == "datetime":
-                val = _to_datetime(norm)
+                val = _to_datetime(norm, formats.get(col))
             else:
                 val = norm
             if val is None and dtype in {"bool", "int", "float", "datetime"}:
@@ -0,0 +1,20 @@
+from itertools import islice
+from typing import Dict, List, Optional
+
+from .infer_dtypes import infer_schema, project_schema
+from .reader import detect_format, open_records
+from .validators import ensure_path_exists, is_arrow_path
+from dataprofiler.config import INFER_SAMPLE_ROWS
+
+
+def read_schema(path: str, sample_rows: int = INFER_SAMPLE_ROWS, usecols: Optional[List[str]] = None) -> Dict[str, str]:
+    """Column types from the file head alone; nothing is coerced or profiled."""
+    ensure_path_exists(path)
+    if is_arrow_path(path):
+        from .arrow_reader import ArrowIngestion
+        return ArrowIngestion(path, columns=usecols).dtypes
+    encoding, delimiter, has_header = detect_format(path)
+    with open(path, "r", encoding=encoding, newline="") as f:
+        columns, records = open_records(f, delimiter, has_header)
+        sample = list(islice(records, sample_rows))
+    return project_schema(*infer_schema(sample, columns), usecols)[0]
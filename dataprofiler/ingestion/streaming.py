@@ -0,0 +1,107 @@
+from itertools import chain, islice
+from typing import Dict, Iterator, List, Optional
+import pandas as pd
+
+from .reader import open_records, open_text_range, build_metadata
+from .infer_dtypes import check_infer_sample, infer_schema, inference_sample, project_schema
+from dataprofiler.config import INFER_SAMPLE
+from .coercion import coerce_columns, build_frame
+from .metadata import IngestionStats, IngestionChunk
+from dataprofiler.utils.timer import stage
+
+
+class ChunkedIngestion:
+    def __init__(
+        self,
+        path: str,
+        encoding: str,
+        delimiter: str,
+        has_header: bool,
+        chunksize: int,
+        start: int = 0,
+        end: Optional[int] = None,
+        dtypes: Optional[Dict[str, str]] = None,
+        formats: Optional[Dict[str, str]] = None,
+        infer_sample: str = INFER_SAMPLE,
+        usecols: Optional[List[str]] = None,
+    ):
+        check_infer_sample(infer_sample)
+        if chunksize <= 0:
+            raise ValueError("chunksize must be a positive integer")
+        self.path = path
+        self.chunksize = int(chunksize)
+        self.start = int(start)
+        self.end = end
+        with open(path, "r", encoding=encoding, newline="") as f:
+            columns, _ = open_records(f, delimiter, has_header)
+        self.metadata = build_metadata(path, encoding, delimiter, has_header, columns)
+        self.stats = IngestionStats(rows_read=0, bad_rows=0)
+        self.infer_sample = infer_sample
+        self.usecols = usecols
+        self.dtypes: Dict[str, str] = dict(dtypes) if dtypes else {}
+        self.formats: Dict[str, str] = dict(formats) if formats else {}
+
+    def _records(self):
+        # A range that starts past the header is read as headerless rows
+        # of the already known columns.
+        meta = self.metadata
+        known = meta.columns if self.start else None
+        f = open_text_range(self.path, meta.encoding, self.start, self.end)
+        return f, open_records(f, meta.delimiter, meta.has_header, columns=known)
+
+    def _infer_from_file(self) -> None:
+        # Reservoir sampling needs its own pass so the sample spans the whole file.
+        f, (columns, records) = self._records()
+        with f, stage("infer_schema"):
+            self.dtypes, self.formats = project_schema(
+                *infer_schema(inference_sample(records, self.infer_sample), columns), self.usecols
+            )
+
+    def __iter__(self) -> Iterator[IngestionChunk]:
+        self.stats = IngestionStats(rows_read=0, bad_rows=0)
+        if not self.dtypes and self.infer_sample == "reservoir":
+            self._infer_from_file()
+        f, (columns, records) = self._records()
+        with f:
+            if not self.dtypes:
+                # The head sample spans chunks when chunksize is below it.
+                with stage("infer_schema"):
+                    head = inference_sample(records, "head")
+                    self.dtypes, self.formats = project_schema(*infer_schema(head, columns), self.usecols)
+                records = chain(head, records)
+            while True:
+                # Timed per chunk, never across the yield.
+                with stage("read") as t:
+                    raw = list(islice(records, self.chunksize))
+                    if t:
+                        t.rows = len(raw)
+                if not raw:
+                    break
+                raw_columns = dict(zip(columns, zip(*raw)))
+                n = len(raw)
+                del raw
+                with stage("coerce", rows=n):
+                    batch, bad_rows = coerce_columns(raw_columns, self.dtypes, self.formats)
+                del raw_columns
+                chunk = IngestionChunk(columns=batch, start=self.stats.rows_read, rows=n, bad_rows=bad_rows)
+                self.stats.rows_read += chunk.rows
+                self.stats.bad_rows += bad_rows
+                yield chunk
+
+    def iter_frames(self, categorize: bool = True) -> Iterator[pd.DataFrame]:
+        for chunk in self:
+            dtypes = self.dtypes if categorize else {c: ("string" if d == "category" else d) for c, d in self.dtypes.items()}
+            with stage("build_frame", rows=chunk.rows):
+                frame = build_frame(chunk.columns, dtypes)
+            yield frame
+
+    def to_frame(self) -> pd.DataFrame:
+        frames = list(self.iter_frames(categorize=False))
+        if not frames:
+            return pd.DataFrame(columns=self.metadata.columns)
+        df = pd.concat(frames, ignore_index=True)
+        del frames
+        for col, dtype in self.dtypes.items():
+            if dtype == "category":
+                df[col] = df[col].astype("category")
+        return df
@@ -1,6 +1,14 @@
+import codecs
 import os
 from typing import Optional
 
+TEXT_EXTENSIONS = {"csv", "tsv", "txt"}
+ARROW_EXTENSIONS = {"parquet", "pq", "feather", "arrow", "ipc"}
+
+
+def is_arrow_path(path: str) -> bool:
+    return os.path.splitext(path)[1].lower().lstrip(".") in ARROW_EXTENSIONS
+
 
 def ensure_path_exists(path: str) -> None:
     if not os.path.isfile(path):
@@ -8,7 +16,7 @@ def ensure_path_exists(path: str) -> None:
 
 
 def ensure_extension_allowed(path: str, allowed: Optional[set] = None) -> None:
-    allowed = allowed or {"csv", "tsv", "txt"}
+    allowed = allowed or (TEXT_EXTENSIONS | ARROW_EXTENSIONS)
     ext = os.path.splitext(path)[1].lower().lstrip(".")
     if ext not in allowed:
         raise ValueError(f"Unsupported file extension: .{ext}")
@@ -20,6 +28,8 @@ def sample_file(path: str, max_bytes: int = 8192) -> bytes:
 
 
 def is_probably_text(sample: bytes) -> bool:
+    if sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return True
     if b"\x00" in sample:
         return False
     return True
\ No newline at end of file
@@ -1,9 +1,14 @@
-from .profile_result import DatasetStats, Correlations, DuplicatesSummary, OverallMissingness, ProfileResult
+from .profile_result import DatasetStats, CorrelationMatrix, CorrelationPairs, Correlations, DuplicatesSummary, OverallMissingness, AnomalySummary, SamplingSummary, StageTiming, ProfileResult
 
 __all__ = [
     "DatasetStats",
+    "CorrelationMatrix",
+    "CorrelationPairs",
     "Correlations",
     "DuplicatesSummary",
     "OverallMissingness",
+    "AnomalySummary",
+    "SamplingSummary",
+    "StageTiming",
     "ProfileResult",
 ]
\ No newline at end of file
@@ -1,5 +1,7 @@
-from dataclasses import dataclass
-from typing import Dict, List, Any
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, Iterator, List, Any, Optional, Tuple, Union
+import numpy as np
 
 
 @dataclass
@@ -10,11 +12,106 @@ class DatasetStats:
     column_types: Dict[str, str]
 
 
+@dataclass(eq=False)
+class CorrelationMatrix(Mapping):
+    """Square array of pairwise scores labelled by ``columns``. Still reads
+    like the nested dict it replaced: ``m[a][b]``, ``m.items()``."""
+
+    columns: List[Hashable]
+    values: np.ndarray
+
+    def __post_init__(self):
+        self._index = {c: i for i, c in enumerate(self.columns)}
+
+    @classmethod
+    def empty(cls) -> "CorrelationMatrix":
+        return cls([], np.zeros((0, 0)))
+
+    @classmethod
+    def from_dict(cls, nested: Dict[Hashable, Dict[Hashable, float]]) -> "CorrelationMatrix":
+        cols = list(nested)
+        return cls(cols, np.array([[nested[c][r] for r in cols] for c in cols], dtype=np.float64).reshape(len(cols), len(cols)))
+
+    def __getitem__(self, column: Hashable) -> Dict[Hashable, float]:
+        return dict(zip(self.columns, self.values[self._index[column]].tolist()))
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.columns)
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def __contains__(self, column: object) -> bool:
+        return column in self._index
+
+    def value(self, a: Hashable, b: Hashable) -> float:
+        return float(self.values[self._index[a], self._index[b]])
+
+    def block(self, rows: List[Hashable], columns: List[Hashable]) -> np.ndarray:
+        ri = np.array([self._index[c] for c in rows], dtype=np.int64)
+        ci = np.array([self._index[c] for c in columns], dtype=np.int64)
+        return self.values[np.ix_(ri, ci)]
+
+    def take(self, columns: List[Hashable]) -> "CorrelationMatrix":
+        return CorrelationMatrix(list(columns), self.block(columns, columns))
+
+    def to_dict(self) -> Dict[Hashable, Dict[Hashable, float]]:
+        return {c: dict(zip(self.columns, row)) for c, row in zip(self.columns, self.values.tolist())}
+
+
+@dataclass(eq=False)
+class CorrelationPairs(Mapping):
+    """The strongest pairs of a correlation matrix, each unordered pair once
+    and strongest first: ``columns[left[i]]`` x ``columns[right[i]]`` scores
+    ``values[i]``. Every column keeps at least its ``top_k`` strongest
+    partners (those of at least ``threshold`` when set). ``m[a]`` maps a
+    column to its kept partners."""
+
+    columns: List[Hashable]
+    left: np.ndarray
+    right: np.ndarray
+    values: np.ndarray
+    top_k: Optional[int] = None
+    threshold: Optional[float] = None
+
+    def __post_init__(self):
+        self._index = {c: i for i, c in enumerate(self.columns)}
+
+    def __getitem__(self, column: Hashable) -> Dict[Hashable, float]:
+        i = self._index[column]
+        hit = (self.left == i) | (self.right == i)
+        other = np.where(self.left[hit] == i, self.right[hit], self.left[hit])
+        return {self.columns[j]: v for j, v in zip(other.tolist(), self.values[hit].tolist())}
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.columns)
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def __contains__(self, column: object) -> bool:
+        return column in self._index
+
+    def strongest(self, limit: Optional[int] = None) -> List[Tuple[Hashable, Hashable, float]]:
+        stop = len(self.values) if limit is None else limit
+        cols = self.columns
+        return [(cols[a], cols[b], v) for a, b, v in zip(self.left[:stop].tolist(), self.right[:stop].tolist(), self.values[:stop].tolist())]
+
+    def to_dict(self) -> Dict[Hashable, Dict[Hashable, float]]:
+        out: Dict[Hashable, Dict[Hashable, float]] = {c: {} for c in self.columns}
+        for a, b, v in self.strongest():
+            out[a][b] = out[b][a] = v
+        return out
+
+
 @dataclass
 class Correlations:
-    pearson_matrix: Dict[str, Dict[str, float]]
-    spearman_matrix: Dict[str, Dict[str, float]]
-    cramer_v_matrix: Dict[str, Dict[str, float]]
+    # CorrelationPairs instead of a dense matrix in top-K mode.
+    pearson_matrix: Union[CorrelationMatrix, CorrelationPairs]
+    spearman_matrix: Union[CorrelationMatrix, CorrelationPairs]
+    cramer_v_matrix: Union[CorrelationMatrix, CorrelationPairs]
+    # matrix name -> {"lower": ..., "upper": ...}, shaped like the matrix.
+    intervals: Dict[str, Dict[str, Union[CorrelationMatrix, CorrelationPairs]]] = field(default_factory=dict)
 
 
 @dataclass
@@ -27,6 +124,37 @@ class DuplicatesSummary:
 @dataclass
 class OverallMissingness:
     total_missing_pct: float
+    patterns: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class AnomalySummary:
+    # method -> column -> flagged values, and rows with any flagged column.
+    counts: Dict[str, Dict[str, int]]
+    rows_flagged: Dict[str, int]
+
+
+@dataclass
+class SamplingSummary:
+    method: str
+    sample_rows: int
+    population_rows: int
+    confidence: float
+    stratify: Optional[str] = None
+
+
+@dataclass
+class StageTiming:
+    stage: str
+    column: Optional[str]
+    wall_s: float
+    cpu_s: float
+    rows: Optional[int] = None
+    rows_per_s: Optional[float] = None
+    peak_rss_delta: Optional[int] = None
+    peak_rss: Optional[int] = None
+    traced_peak_delta: Optional[int] = None
+    calls: int = 1
 
 
 @dataclass
@@ -37,4 +165,7 @@ class ProfileResult:
     datetime_columns: Dict[str, Dict[str, Any]]
     correlations: Correlations
     duplicates: DuplicatesSummary
-    overall_missingness: OverallMissingness
\ No newline at end of file
+    overall_missingness: OverallMissingness
+    sampling: Optional[SamplingSummary] = None
+    anomalies: Optional[AnomalySummary] = None
+    timings: List[StageTiming] = field(default_factory=list)
\ No newline at end of file
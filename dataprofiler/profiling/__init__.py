@@ -1,3 +1,12 @@
-from .summary import profile_data, ProfileResult
+from dataprofiler._lazy import lazy_exports
 
-__all__ = ["profile_data", "ProfileResult"]
\ No newline at end of file
+_EXPORTS = {
+    "profile_data": ".summary",
+    "ProfileResult": ".summary",
+    "ProfileState": ".state",
+    "profile_frames": ".state",
+    "SampledProfileState": ".sampling",
+    "draw_sample": ".sampling",
+}
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,6 +1,6 @@
 from typing import Dict, List
 import pandas as pd
-from .helpers import entropy_from_counts
+from dataprofiler.utils import entropy_from_counts
 
 
 def compute_categorical(df: pd.DataFrame) -> Dict[str, Dict]:
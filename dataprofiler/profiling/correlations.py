@@ -1,30 +1,260 @@
-from typing import Dict
+import warnings
+from typing import Any, Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
-from .helpers import cramer_v
+from dataprofiler.model import CorrelationMatrix, CorrelationPairs
+from dataprofiler.utils import cramer_v_from_table
+from dataprofiler.utils.timer import stage
+from dataprofiler.config import (
+    CORR_BLOCK_ELEMENTS, CORR_DENSE_MAX_COLUMNS, CORR_DTYPE, CORR_PAIRS_BLOCK_COLUMNS, CORR_SAMPLE_ROWS, CORR_TOP_K,
+    CRAMER_MAX_CATEGORIES,
+)
 
 
-def compute_correlations(df: pd.DataFrame) -> Dict:
+def _category_codes(s: pd.Series, max_categories: Optional[int]) -> Tuple[np.ndarray, int]:
+    codes, uniques = pd.factorize(s, use_na_sentinel=True)
+    k = len(uniques)
+    if max_categories and k > max_categories:
+        # Keep the most frequent values and bucket the tail together so
+        # ID-like columns cannot blow up the contingency tables.
+        counts = np.bincount(codes[codes >= 0], minlength=k)
+        keep = np.argsort(-counts, kind="stable")[: max_categories - 1]
+        remap = np.full(k, max_categories - 1, dtype=np.int64)
+        remap[keep] = np.arange(keep.size)
+        codes = np.where(codes >= 0, remap[np.maximum(codes, 0)], -1)
+        k = max_categories
+    return codes.astype(np.int64, copy=False), k
+
+
+def compute_cramer_v(df: pd.DataFrame, max_categories: Optional[int] = CRAMER_MAX_CATEGORIES) -> CorrelationMatrix:
+    cols = list(df.columns)
+    encoded: List[Tuple[np.ndarray, int]] = [_category_codes(df[c], max_categories) for c in cols]
+    valid = [codes >= 0 for codes, _ in encoded]
+    cv = np.zeros((len(cols), len(cols)))
+    for i in range(len(cols)):
+        a, ka = encoded[i]
+        for j in range(i, len(cols)):
+            b, kb = encoded[j]
+            both = valid[i] & valid[j]
+            table = np.bincount(a[both] * kb + b[both], minlength=ka * kb).reshape(ka, kb)
+            cv[i, j] = cv[j, i] = cramer_v_from_table(table)
+    return CorrelationMatrix(cols, cv)
+
+
+def _block_rows(k: int) -> int:
+    return max(1, CORR_BLOCK_ELEMENTS // max(k, 1))
+
+
+def pearson_from_moments(
+    n: np.ndarray, sx: np.ndarray, sxx: np.ndarray, sxy: np.ndarray,
+    sy: Optional[np.ndarray] = None, syy: Optional[np.ndarray] = None, offset: int = 0,
+) -> np.ndarray:
+    """Pairwise-complete Pearson r from pair counts and (shifted) sums, where
+    ``sx[i, j]`` sums column i over the rows column j is also present in.
+    For a block of target columns starting at ``offset``, ``sy``/``syy`` are
+    the targets' own sums (``sx.T``/``sxx.T`` when the block is square)."""
+    sy = sx.T if sy is None else sy
+    syy = sxx.T if syy is None else syy
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = sxy - sx * sy / n
+        r = cov / np.sqrt((sxx - sx ** 2 / n) * (syy - sy ** 2 / n))
+    r = np.nan_to_num(np.clip(r, -1.0, 1.0), nan=0.0)
+    _unit_diagonal(r, offset)
+    return r
+
+
+def _unit_diagonal(r: np.ndarray, offset: int) -> None:
+    # Columns with any variance correlate 1 with themselves, the rest 0.
+    j = np.arange(r.shape[1])
+    r[j + offset, j] = np.where(r[j + offset, j] != 0, 1.0, 0.0)
+
+
+def _column_moments(arrays: List[np.ndarray]) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    # Means, and standard deviations only when nothing is missing.
+    k = len(arrays)
+    n = arrays[0].size if k else 0
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        mu = np.array([np.nanmean(a) for a in arrays]) if n else np.zeros(k)
+    if any(np.isnan(a).any() for a in arrays):
+        return mu, None
+    return mu, np.array([a.std() for a in arrays]) if n else np.zeros(k)
+
+
+def _correlation_block(
+    arrays: List[np.ndarray], mu: np.ndarray, sigma: Optional[np.ndarray], targets: slice, dtype: Any
+) -> np.ndarray:
+    k = len(arrays)
+    n = arrays[0].size if k else 0
+    step = _block_rows(k)
+    width = targets.stop - targets.start
+    if sigma is not None:
+        scale = np.where(sigma > 0, sigma, 1.0)
+        acc = np.zeros((k, width))
+        for start in range(0, n, step):
+            Z = ((np.column_stack([a[start:start + step] for a in arrays]) - mu) / scale).astype(dtype, copy=False)
+            acc += Z.T @ Z[:, targets]
+        r = np.clip(acc / max(n, 1), -1.0, 1.0)
+        # Constant columns have no correlation, diagonal included (pandas gives NaN).
+        r[sigma == 0, :] = 0.0
+        r[:, sigma[targets] == 0] = 0.0
+        _unit_diagonal(r, targets.start)
+        return r
+    square = width == k
+    pairs, sx, sxx, sxy = (np.zeros((k, width)) for _ in range(4))
+    sy, syy = (None, None) if square else (np.zeros((k, width)), np.zeros((k, width)))
+    for start in range(0, n, step):
+        X = np.column_stack([a[start:start + step] for a in arrays]) - mu
+        present = ~np.isnan(X)
+        x0 = np.where(present, X, 0.0).astype(dtype, copy=False)
+        p = present.astype(dtype)
+        xt, pt = x0[:, targets], p[:, targets]
+        pairs += p.T @ pt
+        sx += x0.T @ pt
+        sxx += (x0 * x0).T @ pt
+        sxy += x0.T @ xt
+        if not square:
+            sy += p.T @ xt
+            syy += p.T @ (xt * xt)
+    return pearson_from_moments(pairs, sx, sxx, sxy, sy, syy, targets.start)
+
+
+def correlation_matrix(arrays: List[np.ndarray], dtype: Any = np.float64) -> np.ndarray:
+    """Pearson r between equal-length float64 columns (NaN = missing), one
+    row block at a time so only a block and the k x k result are held.
+
+    Without missing values each block is standardised and the matrix is a
+    single ``Z.T @ Z`` per block. Otherwise pair counts and centred sums are
+    accumulated with the same products over presence masks, which matches
+    pandas' pairwise-complete ``corr``. ``dtype=np.float32`` halves the block
+    and runs the products in single precision; sums stay float64.
+    """
+    mu, sigma = _column_moments(arrays)
+    return _correlation_block(arrays, mu, sigma, slice(0, len(arrays)), dtype)
+
+
+def _select(r: np.ndarray, offset: int, top_k: Optional[int], threshold: Optional[float]) -> Tuple[np.ndarray, ...]:
+    # Per target column, the top_k partners by |r| (at least ``threshold``);
+    # self-pairs and zero correlations never qualify.
+    k, width = r.shape
+    targets = np.arange(offset, offset + width)
+    strength = np.abs(r)
+    strength[targets, np.arange(width)] = 0.0
+    if threshold is not None:
+        strength[strength < threshold] = 0.0
+    if top_k is not None and top_k < k:
+        rows = np.argpartition(-strength, top_k - 1, axis=0)[:top_k]
+    else:
+        rows = np.broadcast_to(np.arange(k)[:, None], (k, width))
+    cols = np.broadcast_to(np.arange(width), rows.shape)
+    keep = strength[rows, cols] > 0
+    return rows[keep], targets[cols[keep]], r[rows, cols][keep]
+
+
+def _pairs(
+    cols: List, left: np.ndarray, right: np.ndarray, values: np.ndarray, top_k: Optional[int], threshold: Optional[float]
+) -> CorrelationPairs:
+    # A pair kept from both ends appears twice; keep it once, strongest first.
+    a, b = np.minimum(left, right), np.maximum(left, right)
+    _, first = np.unique(a * max(len(cols), 1) + b, return_index=True)
+    order = first[np.argsort(-np.abs(values[first]), kind="stable")]
+    return CorrelationPairs(cols, a[order], b[order], values[order], top_k, threshold)
+
+
+def correlated_pairs(
+    arrays: List[np.ndarray],
+    cols: List,
+    top_k: Optional[int] = CORR_TOP_K,
+    threshold: Optional[float] = None,
+    dtype: Any = np.float64,
+    block_columns: int = CORR_PAIRS_BLOCK_COLUMNS,
+) -> CorrelationPairs:
+    """Like ``correlation_matrix`` but keeps only the strongest pairs: the
+    matrix is built ``block_columns`` columns at a time and each block is cut
+    down to its columns' ``top_k`` partners (or all above ``threshold``)
+    before the next, so memory is O(k * block_columns + k * top_k)."""
+    if top_k is None and threshold is None:
+        raise ValueError("top_k or threshold is required")
+    mu, sigma = _column_moments(arrays)
+    k = len(arrays)
+    parts = []
+    for start in range(0, k, block_columns):
+        targets = slice(start, min(start + block_columns, k))
+        parts.append(_select(_correlation_block(arrays, mu, sigma, targets, dtype), start, top_k, threshold))
+    if not parts:
+        none = np.empty(0, dtype=np.int64)
+        return _pairs(cols, none, none, np.empty(0), top_k, threshold)
+    left, right, values = (np.concatenate(p) for p in zip(*parts))
+    return _pairs(cols, left, right, values, top_k, threshold)
+
+
+def matrix_pairs(matrix: CorrelationMatrix, top_k: Optional[int] = CORR_TOP_K, threshold: Optional[float] = None) -> CorrelationPairs:
+    """The same selection applied to a matrix already in memory."""
+    left, right, values = _select(matrix.values, 0, top_k, threshold)
+    return _pairs(list(matrix.columns), left, right, values, top_k, threshold)
+
+
+def _finite(a: np.ndarray) -> np.ndarray:
+    # pandas' corr skips +-inf like a missing value; copies only when there is one.
+    return a if np.isfinite(a[~np.isnan(a)]).all() else np.where(np.isfinite(a), a, np.nan)
+
+
+def _columns(frame: pd.DataFrame) -> List[np.ndarray]:
+    # Zero-copy for finite float64 columns; row blocks are stacked from these.
+    return [_finite(frame.iloc[:, i].to_numpy(dtype=np.float64, na_value=np.nan)) for i in range(frame.shape[1])]
+
+
+def compute_correlations(
+    df: pd.DataFrame,
+    sample_rows: Optional[int] = CORR_SAMPLE_ROWS,
+    dtype: Any = CORR_DTYPE,
+    seed: Optional[int] = 0,
+    top_k: Optional[int] = None,
+    threshold: Optional[float] = None,
+    max_dense_columns: Optional[int] = CORR_DENSE_MAX_COLUMNS,
+) -> Dict:
+    """Pearson and Spearman on the numeric columns, Cramér's V on the
+    categorical ones, each as a ``CorrelationMatrix``.
+
+    Spearman is Pearson on average ranks, ranked once for the whole frame;
+    with missing values each column is ranked over its own non-null rows
+    rather than re-ranked per pair as pandas does. ``sample_rows`` computes
+    both numeric matrices on a uniform row sample of that size instead.
+
+    With ``top_k`` or ``threshold`` every matrix is a ``CorrelationPairs``
+    holding only the strongest pairs; tables wider than ``max_dense_columns``
+    switch to that with ``top_k=CORR_TOP_K``.
+    """
     out = {
-        "pearson_matrix": {},
-        "spearman_matrix": {},
-        "cramer_v_matrix": {},
+        "pearson_matrix": CorrelationMatrix.empty(),
+        "spearman_matrix": CorrelationMatrix.empty(),
+        "cramer_v_matrix": CorrelationMatrix.empty(),
     }
-    num_cols = df.select_dtypes(include=["number"]).columns
-    if len(num_cols) > 0:
-        pear = df[num_cols].corr(method="pearson").fillna(0.0)
-        spear = df[num_cols].corr(method="spearman").fillna(0.0)
-        out["pearson_matrix"] = {c: {r: float(pear.loc[r, c]) for r in pear.index} for c in pear.columns}
-        out["spearman_matrix"] = {c: {r: float(spear.loc[r, c]) for r in spear.index} for c in spear.columns}
+    num = df.select_dtypes(include=["number"])
     cat_cols = df.select_dtypes(include=["object", "category", "bool"]).columns
-    cv: Dict[str, Dict[str, float]] = {}
-    for i, c1 in enumerate(cat_cols):
-        cv.setdefault(c1, {})
-        for c2 in cat_cols:
-            if c2 in cv and c1 in cv[c2]:
-                cv[c1][c2] = cv[c2][c1]
-                continue
-            v = cramer_v(df[c1], df[c2])
-            cv[c1][c2] = float(v)
-    out["cramer_v_matrix"] = cv
-    return out
\ No newline at end of file
+    sparse = top_k is not None or threshold is not None
+    if not sparse and max_dense_columns is not None and max(num.shape[1], len(cat_cols)) > max_dense_columns:
+        sparse, top_k = True, CORR_TOP_K
+
+    def _matrix(arrays: List[np.ndarray], cols: List) -> Any:
+        if sparse:
+            return correlated_pairs(arrays, cols, top_k, threshold, dtype)
+        return CorrelationMatrix(cols, correlation_matrix(arrays, dtype))
+
+    if num.shape[1] > 0:
+        if sample_rows is not None and len(num) > sample_rows:
+            pick = np.sort(np.random.default_rng(seed).choice(len(num), int(sample_rows), replace=False))
+            num = num.iloc[pick]
+        cols = list(num.columns)
+        arrays = _columns(num)
+        with stage("pearson", rows=len(num)):
+            out["pearson_matrix"] = _matrix(arrays, cols)
+        with stage("spearman", rows=len(num)):
+            # Ranked after +-inf became NaN, so those values are skipped here too.
+            ranks = pd.DataFrame(dict(enumerate(arrays)), copy=False).rank(method="average")
+            out["spearman_matrix"] = _matrix(_columns(ranks), cols)
+    with stage("cramer_v", rows=len(df)):
+        cv = compute_cramer_v(df[cat_cols])
+        # Cramér's V comes from per-pair contingency tables, so it is cut down afterwards.
+        out["cramer_v_matrix"] = matrix_pairs(cv, top_k, threshold) if sparse else cv
+    return out
@@ -1,19 +1,101 @@
+import hashlib
 from typing import Dict, List
+import numpy as np
 import pandas as pd
 
+_NA_TOKEN = "<NA>"
+_ROW_MULT = np.uint64(0x100000001B3)
+
+
+def _element_hashes(s: pd.Series) -> np.ndarray:
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return pd.util.hash_array(pd.DatetimeIndex(s).asi8)
+    if pd.api.types.is_numeric_dtype(s) or pd.api.types.is_bool_dtype(s):
+        # Hashes only pick candidates, so values that compare equal must hash
+        # equal: -0.0 becomes 0.0 and every NaN the same NaN.
+        x = s.to_numpy(dtype=np.float64, na_value=np.nan) + 0.0
+        return pd.util.hash_array(np.where(np.isnan(x), np.nan, x))
+    vals = s.to_numpy(dtype=object, na_value=_NA_TOKEN)
+    return pd.util.hash_array(vals)
+
+
+def _as_floats(s: pd.Series) -> np.ndarray:
+    return s.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _same_column(a: pd.Series, b: pd.Series) -> bool:
+    na_a = a.isna().to_numpy()
+    if not np.array_equal(na_a, b.isna().to_numpy()):
+        return False
+    numeric = [pd.api.types.is_numeric_dtype(x) and not pd.api.types.is_datetime64_any_dtype(x) for x in (a, b)]
+    if all(numeric):
+        if a.dtype == b.dtype:
+            return bool(np.array_equal(a.to_numpy()[~na_a], b.to_numpy()[~na_a]))
+        if all(pd.api.types.is_integer_dtype(x) for x in (a, b)):
+            # Python ints, so int64 and uint64 beyond 2**53 still compare exactly.
+            return bool(np.array_equal(a.to_numpy(dtype=object)[~na_a], b.to_numpy(dtype=object)[~na_a]))
+        return bool(np.array_equal(_as_floats(a)[~na_a], _as_floats(b)[~na_a]))
+    va = a.to_numpy(dtype=object)[~na_a]
+    vb = b.to_numpy(dtype=object)[~na_a]
+    return bool(all(x == y for x, y in zip(va, vb)))
+
+
+def _duplicate_column_groups(df: pd.DataFrame, hashes: List[np.ndarray]) -> List[List[str]]:
+    buckets: Dict[bytes, List[int]] = {}
+    for j, h in enumerate(hashes):
+        digest = hashlib.blake2b(h.tobytes(), digest_size=16).digest()
+        buckets.setdefault(digest, []).append(j)
+    groups: List[List[str]] = []
+    for members in buckets.values():
+        while len(members) > 1:
+            head = df.iloc[:, members[0]]
+            same = [members[0]] + [j for j in members[1:] if _same_column(head, df.iloc[:, j])]
+            if len(same) > 1:
+                groups.append([df.columns[j] for j in same])
+            members = [j for j in members if j not in same]
+    return groups
+
+
+def fold_row_hashes(hashes: List[np.ndarray], rows: int) -> np.ndarray:
+    acc = np.zeros(rows, dtype=np.uint64)
+    for h in hashes:
+        acc = (acc * _ROW_MULT) ^ h
+    return acc
+
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    return fold_row_hashes([_element_hashes(df.iloc[:, j]) for j in range(df.shape[1])], len(df))
+
+
+def _duplicate_rows(df: pd.DataFrame, hashes: List[np.ndarray]) -> int:
+    if not hashes:
+        return int(df.duplicated(keep="first").sum())
+    acc = fold_row_hashes(hashes, len(df))
+    candidates = pd.Series(acc).duplicated(keep=False).to_numpy()
+    if not candidates.any():
+        return 0
+    return int(df.iloc[np.flatnonzero(candidates)].duplicated(keep="first").sum())
+
 
 def compute_duplicates(df: pd.DataFrame) -> Dict:
-    dup_rows_count = int(df.duplicated(keep="first").sum())
     total_rows = int(len(df))
+    try:
+        hashes = [_element_hashes(df.iloc[:, j]) for j in range(df.shape[1])]
+    except TypeError:
+        hashes = None
+    if hashes is None:
+        dup_rows_count = int(df.duplicated(keep="first").sum())
+        fingerprints = {}
+        for col in df.columns:
+            fp = hash(tuple(df[col].astype(object).fillna(_NA_TOKEN).tolist()))
+            fingerprints.setdefault(fp, []).append(col)
+        dup_cols: List[List[str]] = [cols for cols in fingerprints.values() if len(cols) > 1]
+    else:
+        dup_rows_count = _duplicate_rows(df, hashes)
+        dup_cols = _duplicate_column_groups(df, hashes)
     dup_rows_pct = float((dup_rows_count / total_rows) * 100.0) if total_rows > 0 else 0.0
-    fingerprints = {}
-    for col in df.columns:
-        s = df[col]
-        fp = hash(tuple(s.fillna("<NA>").tolist()))
-        fingerprints.setdefault(fp, []).append(col)
-    dup_cols: List[List[str]] = [cols for cols in fingerprints.values() if len(cols) > 1]
     return {
         "duplicate_rows_count": dup_rows_count,
         "duplicate_rows_percentage": dup_rows_pct,
         "duplicate_columns": dup_cols,
-    }
\ No newline at end of file
+    }
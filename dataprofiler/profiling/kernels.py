@@ -0,0 +1,193 @@
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+import numpy as np
+
+from dataprofiler.config import IQR_FACTOR, ZSCORE_THRESHOLD
+
+_BLOCK = 1 << 16
+_FPERR = 1e-14
+
+
+@dataclass
+class Moments:
+    n: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    m3: float = 0.0
+    m4: float = 0.0
+    min: float = float("inf")
+    max: float = float("-inf")
+
+    @classmethod
+    def from_block(cls, x: np.ndarray) -> "Moments":
+        if x.size == 0:
+            return cls()
+        mean = float(x.mean())
+        d = x - mean
+        d2 = d * d
+        return cls(
+            n=int(x.size),
+            mean=mean,
+            m2=float(d2.sum()),
+            m3=float((d2 * d).sum()),
+            m4=float((d2 * d2).sum()),
+            min=float(x.min()),
+            max=float(x.max()),
+        )
+
+    @classmethod
+    def from_array(cls, x: np.ndarray, block: int = _BLOCK) -> "Moments":
+        acc = cls()
+        for start in range(0, x.size, block):
+            acc = acc.merge(cls.from_block(x[start:start + block]))
+        return acc
+
+    def merge(self, other: "Moments") -> "Moments":
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            return other
+        na, nb = float(self.n), float(other.n)
+        n = na + nb
+        delta = other.mean - self.mean
+        d_n = delta / n
+        mean = self.mean + d_n * nb
+        m2 = self.m2 + other.m2 + delta * d_n * na * nb
+        m3 = (
+            self.m3 + other.m3
+            + delta * d_n * d_n * na * nb * (na - nb)
+            + 3.0 * d_n * (na * other.m2 - nb * self.m2)
+        )
+        m4 = (
+            self.m4 + other.m4
+            + delta * d_n ** 3 * na * nb * (na * na - na * nb + nb * nb)
+            + 6.0 * d_n * d_n * (na * na * other.m2 + nb * nb * self.m2)
+            + 4.0 * d_n * (na * other.m3 - nb * self.m3)
+        )
+        return Moments(int(n), mean, m2, m3, m4, min(self.min, other.min), max(self.max, other.max))
+
+    def variance(self, ddof: int = 1) -> float:
+        if self.n - ddof <= 0:
+            return float("nan")
+        return float(max(self.m2, 0.0) / (self.n - ddof))
+
+    def std(self, ddof: int = 1) -> float:
+        return float(np.sqrt(self.variance(ddof)))
+
+    def skewness(self) -> float:
+        n = self.n
+        if n < 3:
+            return float("nan")
+        m2 = 0.0 if abs(self.m2) < _FPERR else self.m2
+        m3 = 0.0 if abs(self.m3) < _FPERR else self.m3
+        if m2 == 0:
+            return 0.0
+        return float((n * (n - 1) ** 0.5 / (n - 2)) * (m3 / m2 ** 1.5))
+
+    def kurtosis(self) -> float:
+        n = self.n
+        if n < 4:
+            return float("nan")
+        adj = 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+        num = n * (n + 1) * (n - 1) * self.m4
+        den = (n - 2) * (n - 3) * self.m2 ** 2
+        num = 0.0 if abs(num) < _FPERR else num
+        den = 0.0 if abs(den) < _FPERR else den
+        if den == 0:
+            return 0.0
+        return float(num / den - adj)
+
+
+def _lerp(a: float, b: float, t: float) -> float:
+    diff = b - a
+    out = a + diff * t if t < 0.5 else b - diff * (1.0 - t)
+    return float(a if a == b else out)
+
+
+def sorted_quantiles(xs: np.ndarray, qs: Sequence[float]) -> List[float]:
+    n = xs.size
+    out = []
+    for q in qs:
+        h = (n - 1) * q
+        lo = int(np.floor(h))
+        hi = min(lo + 1, n - 1)
+        out.append(_lerp(float(xs[lo]), float(xs[hi]), h - lo))
+    return out
+
+
+def sorted_modes(xs: np.ndarray) -> np.ndarray:
+    starts = np.flatnonzero(np.concatenate(([True], xs[1:] != xs[:-1])))
+    runs = np.diff(np.append(starts, xs.size))
+    return xs[starts[runs == runs.max()]]
+
+
+def fd_bins(n: int, q25: float, q75: float, lo: float, hi: float) -> int:
+    iqr = q75 - q25
+    if iqr == 0 or not np.isfinite(iqr):
+        return int(np.ceil(np.sqrt(n)))
+    width = 2 * iqr * (n ** (-1 / 3))
+    if width <= 0:
+        return 10
+    return max(int(np.ceil((hi - lo) / width)), 1)
+
+
+def sorted_histogram(xs: np.ndarray, bins: int) -> Tuple[List[float], List[int]]:
+    lo, hi = float(xs[0]), float(xs[-1])
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    edges = np.linspace(lo, hi, bins + 1)
+    cuts = np.searchsorted(xs, edges[1:-1], side="left")
+    counts = np.diff(np.concatenate(([0], cuts, [xs.size])))
+    return edges.tolist(), counts.tolist()
+
+
+def outlier_ranges(q25: float, q75: float, m: Moments) -> Dict[str, Dict[str, float]]:
+    iqr = q75 - q25
+    sigma = m.std(ddof=0)
+    lb_z, ub_z = (m.mean, m.mean) if sigma == 0 else (m.mean - ZSCORE_THRESHOLD * sigma, m.mean + ZSCORE_THRESHOLD * sigma)
+    return {
+        "iqr": {"lower": float(q25 - IQR_FACTOR * iqr), "upper": float(q75 + IQR_FACTOR * iqr)},
+        "zscore": {"lower": float(lb_z), "upper": float(ub_z)},
+    }
+
+
+def empty_numeric_summary(missing_pct: float) -> Dict:
+    return {
+        "mean": None,
+        "median": None,
+        "mode": [],
+        "std": None,
+        "variance": None,
+        "skewness": None,
+        "kurtosis": None,
+        "quantiles": {"q25": None, "q50": None, "q75": None},
+        "missing_pct": missing_pct,
+        "histogram": {"edges": [], "counts": []},
+        "outlier_ranges": {"iqr": {"lower": None, "upper": None}, "zscore": {"lower": None, "upper": None}},
+    }
+
+
+def numeric_summary(x: np.ndarray, integer: bool = False) -> Dict:
+    m = Moments.from_array(x)
+    xs = np.sort(x)
+    q25, q50, q75 = sorted_quantiles(xs, (0.25, 0.5, 0.75))
+    modes = sorted_modes(xs)
+    finite = xs[np.isfinite(xs)]
+    if finite.size:
+        f25, f75 = sorted_quantiles(finite, (0.25, 0.75))
+        bins = fd_bins(finite.size, f25, f75, float(finite[0]), float(finite[-1]))
+        edges, counts = sorted_histogram(finite, bins)
+    else:
+        edges, counts = [], []
+    return {
+        "mean": float(m.mean),
+        "median": q50,
+        "mode": [int(v) for v in modes] if integer else modes.tolist(),
+        "std": m.std(ddof=1),
+        "variance": m.variance(ddof=1),
+        "skewness": m.skewness(),
+        "kurtosis": m.kurtosis(),
+        "quantiles": {"q25": q25, "q50": q50, "q75": q75},
+        "histogram": {"edges": edges, "counts": counts},
+        "outlier_ranges": outlier_ranges(q25, q75, m),
+    }
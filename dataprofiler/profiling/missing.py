@@ -1,29 +1,43 @@
 from typing import Dict, List, Tuple
-from collections import Counter
+import numpy as np
 import pandas as pd
 
+from dataprofiler.config import MISSING_TOP_PATTERNS
 
-def compute_missing(df: pd.DataFrame) -> Dict:
+
+def _pattern_counts(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rows = mask[mask.any(axis=1)]
+    if rows.shape[0] == 0:
+        return np.empty((0, mask.shape[1]), dtype=bool), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    packed = np.ascontiguousarray(np.packbits(rows, axis=1))
+    keys = packed.view(np.dtype((np.void, packed.shape[1]))).ravel()
+    _, first, counts = np.unique(keys, return_index=True, return_counts=True)
+    return rows[first], counts, first
+
+
+def compute_missing(df: pd.DataFrame, top_n: int = MISSING_TOP_PATTERNS) -> Dict:
+    cols = list(df.columns)
+    mask = df.isna().to_numpy(dtype=bool)
+    n = mask.shape[0]
+    miss_counts = mask.sum(axis=0)
     per_column = {}
-    for col in df.columns:
-        miss = int(df[col].isna().sum())
+    for j, col in enumerate(cols):
+        miss = int(miss_counts[j])
         per_column[col] = {
             "missing_count": miss,
-            "missing_pct": float(df[col].isna().mean() * 100.0),
+            "missing_pct": float(miss / n * 100.0) if n else float("nan"),
         }
-    total_missing_pct = float(df.isna().mean().mean() * 100.0)
+    total_missing_pct = float(mask.mean(axis=0).mean() * 100.0) if mask.size else float("nan")
     patterns: List[Tuple[List[str], int]] = []
-    cols = list(df.columns)
-    mask = df[cols].isna()
-    combos = Counter()
-    for i in range(len(df)):
-        missing_cols = [c for c in cols if mask.at[i, c]]
-        if missing_cols:
-            combos[frozenset(missing_cols)] += 1
-    for combo, count in combos.most_common(5):
-        patterns.append((sorted(list(combo)), int(count)))
+    shares: List[float] = []
+    combos, counts, first = _pattern_counts(mask)
+    order = np.lexsort((first, -counts))[:top_n]
+    for i in order:
+        patterns.append((sorted(cols[j] for j in np.flatnonzero(combos[i])), int(counts[i])))
+        shares.append(float(counts[i] / n * 100.0))
     return {
         "per_column": per_column,
         "overall_missing_pct": total_missing_pct,
         "patterns": patterns,
-    }
\ No newline at end of file
+        "pattern_shares": shares,
+    }
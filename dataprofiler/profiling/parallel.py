@@ -0,0 +1,143 @@
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Collection, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+from dataprofiler.model import StageTiming
+from dataprofiler.utils import resolve_n_jobs
+from dataprofiler.utils.timer import active_recorder, record_stages, stage
+from .statistics import compute_numeric
+from .missing import compute_missing
+from .duplicates import compute_duplicates
+from .categories import compute_categorical
+from .correlations import compute_correlations
+from .datetime_profile import compute_datetime
+
+
+_COLUMN_TASKS = {
+    "numeric": compute_numeric,
+    "categorical": compute_categorical,
+    "datetime": compute_datetime,
+}
+_FRAME_TASKS = {
+    "missing": compute_missing,
+    "duplicates": compute_duplicates,
+    "correlations": compute_correlations,
+}
+
+_worker_frame: Optional[pd.DataFrame] = None
+_worker_buffers: List[shared_memory.SharedMemory] = []
+
+
+def _share(arr: np.ndarray, owned: List[shared_memory.SharedMemory]) -> Tuple[str, str, Tuple[int, ...]]:
+    arr = np.ascontiguousarray(arr)
+    shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    owned.append(shm)
+    np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+    return shm.name, arr.dtype.str, arr.shape
+
+
+def _attach(ref: Tuple[str, str, Tuple[int, ...]]) -> np.ndarray:
+    name, dtype, shape = ref
+    shm = shared_memory.SharedMemory(name=name)
+    _worker_buffers.append(shm)
+    return np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def _describe_column(s: pd.Series, owned: List[shared_memory.SharedMemory]) -> Tuple[str, Any]:
+    dtype = s.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return "categorical", (_share(s.cat.codes.to_numpy(), owned), s.cat.categories, dtype.ordered)
+    if isinstance(s.array, (pd.arrays.IntegerArray, pd.arrays.FloatingArray, pd.arrays.BooleanArray)):
+        return "masked", (_share(s.array._data, owned), _share(s.array._mask, owned), type(s.array))
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufM":
+        return "numpy", _share(s.to_numpy(), owned)
+    return "pickled", s.array
+
+
+def _rebuild_column(kind: str, desc: Any) -> Any:
+    if kind == "categorical":
+        codes, categories, ordered = desc
+        return pd.Categorical.from_codes(_attach(codes), categories=categories, ordered=ordered)
+    if kind == "masked":
+        data, mask, array_type = desc
+        return array_type(_attach(data), _attach(mask))
+    if kind == "numpy":
+        return _attach(desc)
+    return desc
+
+
+def share_frame(df: pd.DataFrame) -> Tuple[Dict[str, Any], List[shared_memory.SharedMemory]]:
+    owned: List[shared_memory.SharedMemory] = []
+    columns = [(col, _describe_column(df.iloc[:, i], owned)) for i, col in enumerate(df.columns)]
+    return {"index": df.index, "columns": columns}, owned
+
+
+def _init_worker(desc: Dict[str, Any], trace_memory: bool = False) -> None:
+    global _worker_frame
+    if trace_memory:
+        tracemalloc.start()
+    data = {i: _rebuild_column(kind, d) for i, (_, (kind, d)) in enumerate(desc["columns"])}
+    frame = pd.DataFrame(data, index=desc["index"], copy=False)
+    frame.columns = [col for col, _ in desc["columns"]]
+    _worker_frame = frame
+
+
+def _compute(section: str, column: Any) -> Any:
+    df = _worker_frame
+    if section in _FRAME_TASKS:
+        return _FRAME_TASKS[section](df)
+    return _COLUMN_TASKS[section](df[[column]])
+
+
+def _run_task(section: str, column: Any, timed: bool = False) -> Tuple[str, Any, Any, List[StageTiming]]:
+    if not timed:
+        return section, column, _compute(section, column), []
+    # Workers record into their own recorder; the parent re-nests the result.
+    with record_stages() as recorder:
+        with stage(section, column=None if column is None else str(column), rows=len(_worker_frame)):
+            result = _compute(section, column)
+    return section, column, result, recorder.timings()
+
+
+def plan_tasks(df: pd.DataFrame, sections: Optional[Collection[str]] = None) -> List[Tuple[str, Any]]:
+    tasks: List[Tuple[str, Any]] = [(section, None) for section in ("correlations", "duplicates", "missing")]
+    tasks += [("numeric", c) for c in df.select_dtypes(include=["number"]).columns]
+    tasks += [("categorical", c) for c in df.select_dtypes(include=["object", "category", "bool"]).columns]
+    tasks += [("datetime", c) for c in df.select_dtypes(include=["datetime", "datetimetz", "datetime64[ns]"]).columns]
+    if sections is not None:
+        tasks = [t for t in tasks if t[0] in sections]
+    return tasks
+
+
+def run_sections(df: pd.DataFrame, n_jobs: int, sections: Optional[Collection[str]] = None) -> Dict[str, Any]:
+    tasks = plan_tasks(df, sections)
+    recorder = active_recorder()
+    desc, owned = share_frame(df)
+    done: Dict[Tuple[str, Any], Any] = {}
+    try:
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker, initargs=(desc, tracemalloc.is_tracing())) as pool:
+            futures = [pool.submit(_run_task, section, column, recorder is not None) for section, column in tasks]
+            for fut in futures:
+                section, column, result, timings = fut.result()
+                done[(section, column)] = result
+                for timing in timings:
+                    if recorder.prefix():
+                        timing.stage = f"{recorder.prefix()}.{timing.stage}"
+                    recorder.add(timing)
+    finally:
+        for shm in owned:
+            shm.close()
+            shm.unlink()
+    out: Dict[str, Any] = {section: done[(section, None)] for section in _FRAME_TASKS if (section, None) in done}
+    for section in _COLUMN_TASKS:
+        if sections is not None and section not in sections:
+            continue
+        merged: Dict[str, Dict] = {}
+        for sec, column in tasks:
+            if sec == section:
+                merged.update(done[(sec, column)])
+        out[section] = merged
+    return out
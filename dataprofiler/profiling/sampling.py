@@ -0,0 +1,321 @@
+import math
+from dataclasses import replace
+from statistics import NormalDist
+from typing import Any, Dict, Hashable, Optional, Union
+import numpy as np
+import pandas as pd
+
+from dataprofiler.config import CORR_BLOCK_ELEMENTS, SAMPLE_CONFIDENCE
+from dataprofiler.model import CorrelationMatrix, CorrelationPairs, Correlations, ProfileResult, SamplingSummary
+from .statistics import compute_numeric
+from .categories import compute_categorical
+from .correlations import compute_correlations
+from .datetime_profile import compute_datetime
+from .state import FrameCounts
+
+
+def resolve_sample_size(sample: Union[int, float], rows: int) -> int:
+    if sample <= 0:
+        raise ValueError("sample must be a positive row count or a fraction in (0, 1]")
+    if isinstance(sample, float) and sample <= 1.0:
+        return max(1, int(round(sample * rows)))
+    return int(sample)
+
+
+def _allocate(counts: np.ndarray, n: int) -> np.ndarray:
+    # Proportional allocation by largest remainder, at least one row per
+    # stratum whenever the budget allows it.
+    total = counts.sum()
+    if total <= n:
+        return counts.copy()
+    exact = counts * (n / total)
+    alloc = np.floor(exact).astype(np.int64)
+    if n >= np.count_nonzero(counts):
+        alloc = np.maximum(alloc, (counts > 0).astype(np.int64))
+    short = n - alloc.sum()
+    if short > 0:
+        order = np.argsort(-(exact - alloc), kind="stable")
+        alloc[order[:short]] += 1
+    elif short < 0:
+        order = np.argsort(exact - alloc, kind="stable")
+        for i in order:
+            if short == 0:
+                break
+            if alloc[i] > 1:
+                alloc[i] -= 1
+                short += 1
+    return np.minimum(alloc, counts)
+
+
+def _bottom_k(keys: np.ndarray, codes: np.ndarray, quota: np.ndarray) -> np.ndarray:
+    # Rows holding the ``quota[code]`` smallest keys of each stratum.
+    order = np.lexsort((keys, codes))
+    sorted_codes = codes[order]
+    starts = np.searchsorted(sorted_codes, sorted_codes, side="left")
+    rank = np.arange(order.size) - starts
+    return np.sort(order[rank < quota[sorted_codes]])
+
+
+def draw_sample(
+    df: pd.DataFrame, sample: Union[int, float], stratify: Optional[str] = None, seed: Optional[int] = 0
+) -> pd.DataFrame:
+    n = resolve_sample_size(sample, len(df))
+    if n >= len(df):
+        return df
+    keys = np.random.default_rng(seed).random(len(df))
+    if stratify is None:
+        return df.iloc[np.sort(np.argpartition(keys, n - 1)[:n])]
+    codes, _ = pd.factorize(df[stratify], use_na_sentinel=False)
+    quota = _allocate(np.bincount(codes), n)
+    return df.iloc[_bottom_k(keys, codes, quota)]
+
+
+class BottomKSampler:
+    """Mergeable uniform or stratified sample: every row draws a uniform key
+    and the smallest keys are kept (per stratum when stratified). A fraction
+    keeps every key below it instead, since the row count is not known up
+    front; stratified, each stratum keeps a few standard deviations more
+    than its share plus its smallest key, so ``sample`` can still allocate
+    per stratum. States merged from parallel workers need distinct seeds."""
+
+    def __init__(self, sample: Union[int, float], stratify: Optional[str] = None, seed: Optional[int] = 0):
+        if sample <= 0:
+            raise ValueError("sample must be a positive row count or a fraction in (0, 1]")
+        self.fraction = float(sample) if isinstance(sample, float) and sample <= 1.0 else None
+        self.size = None if self.fraction is not None else int(sample)
+        self.stratify = stratify
+        self._rng = np.random.default_rng(seed)
+        self.kept: Optional[pd.DataFrame] = None
+        self.keys = np.empty(0, dtype=np.float64)
+        self.strata: Dict[Hashable, int] = {}
+
+    def _within_fraction(self, labels: pd.Series, keys: np.ndarray) -> np.ndarray:
+        # Per stratum, keys under f + 3 sd of the share seen so far, and the
+        # smallest key. Strata only grow, so whatever a later cut needs is kept.
+        codes, uniques = pd.factorize(labels, use_na_sentinel=False)
+        seen = np.maximum([self.strata.get(u, 0) for u in uniques], np.bincount(codes, minlength=len(uniques)))
+        f = self.fraction
+        limit = np.minimum(1.0, f + 3.0 * np.sqrt(f * (1.0 - f) / np.maximum(seen, 1)))
+        keep = keys < limit[codes]
+        keep[_bottom_k(keys, codes, np.ones(len(uniques), dtype=np.int64))] = True
+        return keep
+
+    def _reduce(self, frame: pd.DataFrame, keys: np.ndarray) -> None:
+        if self.fraction is not None:
+            # Threshold sampling: everything that passed the filter stays.
+            if self.stratify is not None:
+                keep = self._within_fraction(frame[self.stratify], keys)
+                frame, keys = frame[keep], keys[keep]
+        elif self.stratify is None:
+            if keys.size > self.size:
+                keep = np.sort(np.argpartition(keys, self.size - 1)[: self.size])
+                frame, keys = frame.iloc[keep], keys[keep]
+        else:
+            codes, _ = pd.factorize(frame[self.stratify], use_na_sentinel=False)
+            quota = np.full(codes.max() + 1 if codes.size else 0, self.size, dtype=np.int64)
+            keep = _bottom_k(keys, codes, quota)
+            frame, keys = frame.iloc[keep], keys[keep]
+        self.kept, self.keys = frame.reset_index(drop=True), keys
+
+    def _absorb(self, frame: pd.DataFrame, keys: np.ndarray) -> None:
+        if self.kept is not None:
+            frame = pd.concat([self.kept, frame], ignore_index=True)
+            keys = np.concatenate([self.keys, keys])
+        self._reduce(frame, keys)
+
+    def update(self, df: pd.DataFrame) -> "BottomKSampler":
+        keys = self._rng.random(len(df))
+        if self.stratify is not None:
+            for label, count in df[self.stratify].value_counts(dropna=False, sort=False).items():
+                self.strata[label] = self.strata.get(label, 0) + int(count)
+        if self.fraction is not None:
+            below = keys < self.fraction if self.stratify is None else self._within_fraction(df[self.stratify], keys)
+            df, keys = df[below], keys[below]
+        elif self.stratify is None and self.keys.size >= self.size:
+            # Rows above the current k-th key can never enter the sample.
+            below = keys < self.keys.max()
+            df, keys = df[below], keys[below]
+        if len(df):
+            self._absorb(df, keys)
+        return self
+
+    def merge(self, other: "BottomKSampler") -> "BottomKSampler":
+        for label, count in other.strata.items():
+            self.strata[label] = self.strata.get(label, 0) + count
+        if other.kept is not None:
+            self._absorb(other.kept, other.keys)
+        return self
+
+    def sample(self) -> pd.DataFrame:
+        if self.kept is None:
+            return pd.DataFrame()
+        if self.stratify is None:
+            return self.kept
+        codes, labels = pd.factorize(self.kept[self.stratify], use_na_sentinel=False)
+        totals = np.array([self.strata.get(label, 0) for label in labels], dtype=np.int64)
+        size = self.size if self.fraction is None else resolve_sample_size(self.fraction, int(sum(self.strata.values())))
+        quota = np.minimum(_allocate(totals, size), np.bincount(codes, minlength=len(labels)))
+        return self.kept.iloc[_bottom_k(self.keys, codes, quota)]
+
+
+def _z(confidence: float) -> float:
+    return NormalDist().inv_cdf(0.5 + confidence / 2.0)
+
+
+def _fpc(n: int, population: int) -> float:
+    return math.sqrt(max(0.0, (population - n) / (population - 1))) if population > 1 else 0.0
+
+
+def numeric_intervals(s: pd.Series, population: int, confidence: float) -> Dict[str, list]:
+    x = np.sort(s.dropna().to_numpy(dtype=np.float64))
+    n = x.size
+    if n < 2:
+        return {}
+    z, fpc = _z(confidence), _fpc(n, population)
+    mean, sd = float(x.mean()), float(x.std(ddof=1))
+    half = z * sd / math.sqrt(n) * fpc
+    out = {"mean": [mean - half, mean + half]}
+    # Distribution-free intervals from binomial bounds on order statistics.
+    for name, q in (("q25", 0.25), ("median", 0.5), ("q75", 0.75)):
+        spread = z * math.sqrt(n * q * (1.0 - q)) * fpc
+        lo = min(max(int(math.floor(n * q - spread)), 0), n - 1)
+        hi = min(max(int(math.ceil(n * q + spread)), 0), n - 1)
+        out[name] = [float(x[lo]), float(x[hi])]
+    excess = float(pd.Series(x).kurt()) if n > 3 else 0.0
+    se_sd = sd * math.sqrt(max(excess + 2.0, 0.0) / (4.0 * n)) * fpc
+    out["std"] = [max(sd - z * se_sd, 0.0), sd + z * se_sd]
+    return out
+
+
+def share_intervals(counts: Dict[str, int], n: int, population: int, confidence: float) -> Dict[str, list]:
+    # Wilson score intervals, in percent of non-missing values.
+    if n == 0:
+        return {}
+    z, fpc = _z(confidence), _fpc(n, population)
+    z2 = z * z
+    out = {}
+    for key, count in counts.items():
+        p = count / n
+        centre = (p + z2 / (2 * n)) / (1 + z2 / n)
+        half = z * math.sqrt(p * (1 - p) / n + z2 / (4 * n * n)) / (1 + z2 / n) * fpc
+        out[key] = [max(centre - half, 0.0) * 100.0, min(centre + half, 1.0) * 100.0]
+    return out
+
+
+def _pair_counts(present: np.ndarray, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    # Rows where both columns of each kept pair are present, a slab of pairs at a time.
+    step = max(1, CORR_BLOCK_ELEMENTS // max(len(present), 1))
+    out = np.empty(left.size)
+    for i in range(0, left.size, step):
+        out[i:i + step] = (present[:, left[i:i + step]] * present[:, right[i:i + step]]).sum(axis=0)
+    return out
+
+
+def correlation_intervals(
+    matrix: Union[CorrelationMatrix, CorrelationPairs], sample: pd.DataFrame, population: int, confidence: float,
+    spread: float = 1.0,
+) -> Dict[str, Union[CorrelationMatrix, CorrelationPairs]]:
+    # Fisher z-transform; ``spread`` is 1.06 for Spearman (Fieller et al.).
+    cols = matrix.columns
+    if not cols:
+        return {}
+    present = sample[cols].notna().to_numpy(dtype=np.float64)
+    if isinstance(matrix, CorrelationPairs):
+        pairs = _pair_counts(present, matrix.left, matrix.right)
+    else:
+        pairs = present.T @ present
+    ok = pairs > 3
+    n = np.where(ok, pairs, 4.0)
+    centre = np.arctanh(np.clip(matrix.values, -0.999999, 0.999999))
+    fpc = np.sqrt(np.maximum(0.0, (population - n) / (population - 1))) if population > 1 else 0.0
+    half = _z(confidence) * np.sqrt(spread / (n - 3)) * fpc
+    lower = np.where(ok, np.tanh(centre - half), -1.0)
+    upper = np.where(ok, np.tanh(centre + half), 1.0)
+    return {"lower": replace(matrix, values=lower), "upper": replace(matrix, values=upper)}
+
+
+def annotate_sample(
+    sections: Dict[str, Any], sample: pd.DataFrame, population: int, missing_pct: Dict[str, float], confidence: float
+) -> None:
+    for col, stats in sections["numeric"].items():
+        stats["missing_pct"] = missing_pct[col]
+        stats["sample_size"] = int(sample[col].notna().sum())
+        stats["confidence_intervals"] = numeric_intervals(sample[col], population, confidence)
+    for col, stats in sections["categorical"].items():
+        n = int(sample[col].notna().sum())
+        top = {k: stats["frequencies"].get(k, 0) for k in stats.get("top_values", [])}
+        stats["missing_pct"] = missing_pct[col]
+        stats["sample_size"] = n
+        stats["confidence_intervals"] = {"top_value_pct": share_intervals(top, n, population, confidence)}
+    corr = sections["correlations"]
+    corr["intervals"] = {
+        "pearson_matrix": correlation_intervals(corr["pearson_matrix"], sample, population, confidence),
+        "spearman_matrix": correlation_intervals(corr["spearman_matrix"], sample, population, confidence, 1.06),
+    }
+
+
+def sampling_summary(sample: pd.DataFrame, population: int, confidence: float, stratify: Optional[str]) -> SamplingSummary:
+    return SamplingSummary(
+        method="stratified" if stratify else "uniform",
+        sample_rows=int(len(sample)),
+        population_rows=int(population),
+        confidence=float(confidence),
+        stratify=stratify,
+    )
+
+
+class SampledProfileState(FrameCounts):
+    """Exact counts over every chunk plus a bottom-k sample for the
+    statistics that are estimated."""
+
+    def __init__(
+        self,
+        sample: Union[int, float],
+        stratify: Optional[str] = None,
+        seed: Optional[int] = 0,
+        confidence: float = SAMPLE_CONFIDENCE,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.sampler = BottomKSampler(sample, stratify, seed)
+        self.confidence = confidence
+
+    def update(self, df: pd.DataFrame) -> "SampledProfileState":
+        super().update(df)
+        self.sampler.update(df)
+        return self
+
+    def merge(self, other: "SampledProfileState") -> "SampledProfileState":
+        fresh = not (self.columns and other.columns)
+        super().merge(other)
+        if not fresh:
+            self.sampler.merge(other.sampler)
+        return self
+
+    def finalize(self) -> ProfileResult:
+        sample = self.sampler.sample()
+        sections = {
+            "numeric": compute_numeric(sample),
+            "categorical": compute_categorical(sample),
+            "datetime": compute_datetime(sample),
+            "correlations": compute_correlations(sample),
+        }
+        annotate_sample(sections, sample, self.rows, self.missing_pct(), self.confidence)
+        for stats in sections["datetime"].values():
+            stats["sample_size"] = int(len(sample))
+        corr = sections["correlations"]
+        return ProfileResult(
+            dataset_stats=self.dataset_stats(),
+            numeric_columns=sections["numeric"],
+            categorical_columns=sections["categorical"],
+            datetime_columns=sections["datetime"],
+            correlations=Correlations(
+                pearson_matrix=corr["pearson_matrix"],
+                spearman_matrix=corr["spearman_matrix"],
+                cramer_v_matrix=corr["cramer_v_matrix"],
+                intervals=corr["intervals"],
+            ),
+            duplicates=self.duplicates(),
+            overall_missingness=self.overall_missingness(),
+            sampling=sampling_summary(sample, self.rows, self.confidence, self.sampler.stratify),
+        )
@@ -0,0 +1,192 @@
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+
+class KLLSketch:
+    """Mergeable quantile sketch (Karnin, Lang, Liberty 2016).
+
+    With the default k=200 the normalized rank error of any quantile or
+    histogram boundary is about 1.7% with 99% probability, independent of
+    the number of values seen. Memory is O(k log(n / k)).
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = 0):
+        self.k = int(k)
+        self.n = 0
+        self.levels: List[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(int(np.ceil(self.k * (2.0 / 3.0) ** depth)), 2)
+
+    def _compress(self) -> None:
+        while True:
+            level = next((i for i, buf in enumerate(self.levels) if buf.size > self._capacity(i)), None)
+            if level is None:
+                return
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0, dtype=np.float64))
+            buf = np.sort(self.levels[level])
+            keep = buf[:buf.size % 2]
+            pairs = buf[buf.size % 2:]
+            promoted = pairs[int(self._rng.integers(2))::2]
+            self.levels[level] = keep
+            self.levels[level + 1] = np.concatenate((self.levels[level + 1], promoted))
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=np.float64)
+        if values.size == 0:
+            return
+        self.levels[0] = np.concatenate((self.levels[0], values))
+        self.n += int(values.size)
+        self._compress()
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype=np.float64))
+        for i, buf in enumerate(other.levels):
+            self.levels[i] = np.concatenate((self.levels[i], buf))
+        self.n += other.n
+        self._compress()
+        return self
+
+    def _weighted(self) -> Tuple[np.ndarray, np.ndarray]:
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(buf.size, 2 ** i, dtype=np.float64) for i, buf in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        return items[order], np.cumsum(weights[order])
+
+    def quantiles(self, qs: List[float]) -> List[Optional[float]]:
+        if self.n == 0:
+            return [None for _ in qs]
+        items, cum = self._weighted()
+        total = cum[-1]
+        idx = np.searchsorted(cum, np.asarray(qs, dtype=np.float64) * total, side="left")
+        return [float(items[min(i, items.size - 1)]) for i in idx]
+
+    def median_abs_deviation(self, center: Optional[float] = None) -> Optional[float]:
+        # Weighted median of |item - center| over the retained items; same
+        # rank guarantee as the median itself.
+        if self.n == 0:
+            return None
+        if center is None:
+            center = self.quantiles([0.5])[0]
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(buf.size, 2 ** i, dtype=np.float64) for i, buf in enumerate(self.levels)])
+        dev = np.abs(items - center)
+        order = np.argsort(dev, kind="stable")
+        cum = np.cumsum(weights[order])
+        return float(dev[order][min(int(np.searchsorted(cum, 0.5 * cum[-1], side="left")), dev.size - 1)])
+
+    def ranks(self, points: np.ndarray) -> np.ndarray:
+        if self.n == 0:
+            return np.zeros(len(points))
+        items, cum = self._weighted()
+        pos = np.searchsorted(items, points, side="left")
+        ranks = np.where(pos > 0, cum[np.maximum(pos - 1, 0)], 0.0)
+        return ranks * (self.n / cum[-1])
+
+
+class HyperLogLog:
+    """Mergeable distinct-count sketch (Flajolet et al. 2007).
+
+    Standard error is 1.04 / sqrt(2 ** precision), about 0.81% at the
+    default precision of 14, using 2 ** precision one-byte registers.
+    """
+
+    def __init__(self, precision: int = 14):
+        self.p = int(precision)
+        self.m = 1 << self.p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    def update_hashes(self, hashes: np.ndarray) -> None:
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if hashes.size == 0:
+            return
+        idx = (hashes >> np.uint64(64 - self.p)).astype(np.int64)
+        rest = hashes << np.uint64(self.p)
+        nz = rest != 0
+        exp = np.zeros(rest.size, dtype=np.int64)
+        exp[nz] = np.floor(np.log2(rest[nz].astype(np.float64))).astype(np.int64)
+        over = nz & ((np.uint64(1) << exp.astype(np.uint64)) > rest)
+        exp[over] -= 1
+        rho = np.where(nz, 64 - exp, 64 - self.p + 1).astype(np.uint8)
+        np.maximum.at(self.registers, idx, rho)
+
+    def update(self, values: Any) -> None:
+        self.update_hashes(pd.util.hash_array(np.asarray(values, dtype=object)))
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> float:
+        m = float(self.m)
+        alpha = 0.7213 / (1.0 + 1.079 / m)
+        raw = alpha * m * m / float(np.sum(np.power(2.0, -self.registers.astype(np.float64))))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            return m * float(np.log(m / zeros))
+        return raw
+
+
+class HeavyHitters:
+    """Mergeable Misra-Gries frequency summary (Agarwal et al. 2012).
+
+    Keeps at most ``capacity`` counters. Counts are exact while fewer
+    than ``capacity`` distinct keys have been seen; afterwards each count
+    underestimates the true frequency by at most ``error`` (<= n / (capacity + 1)).
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.capacity = int(capacity)
+        self.counts: Dict[Hashable, int] = {}
+        self.n = 0
+        self.error = 0
+
+    def _prune(self) -> None:
+        if len(self.counts) <= self.capacity:
+            return
+        cut = sorted(self.counts.values(), reverse=True)[self.capacity]
+        self.counts = {k: c - cut for k, c in self.counts.items() if c > cut}
+        self.error += cut
+
+    def _add(self, counts: Dict[Hashable, int]) -> None:
+        for key, c in counts.items():
+            self.counts[key] = self.counts.get(key, 0) + int(c)
+        self._prune()
+
+    def update_counts(self, counts: Dict[Hashable, int]) -> None:
+        self.n += int(sum(counts.values()))
+        self._add(counts)
+
+    def update_arrays(self, keys: np.ndarray, counts: np.ndarray) -> None:
+        # Prune the incoming batch to ``capacity`` counters before the
+        # dict merge; a pruned exact count is itself a valid summary.
+        counts = np.asarray(counts, dtype=np.int64)
+        self.n += int(counts.sum())
+        if counts.size > self.capacity:
+            cut = int(np.partition(counts, counts.size - self.capacity - 1)[counts.size - self.capacity - 1])
+            keep = counts > cut
+            keys, counts = keys[keep], counts[keep] - cut
+            self.error += cut
+        self._add(dict(zip(keys.tolist(), counts.tolist())))
+
+    def update(self, values: pd.Series) -> None:
+        self.update_counts(values.value_counts(dropna=True, sort=False).to_dict())
+
+    def merge(self, other: "HeavyHitters") -> "HeavyHitters":
+        self.n += other.n
+        self.error += other.error
+        self._add(other.counts)
+        return self
+
+    @property
+    def exact(self) -> bool:
+        return self.error == 0
+
+    def most_common(self, limit: Optional[int] = None) -> List[Tuple[Hashable, int]]:
+        items = sorted(self.counts.items(), key=lambda kv: -kv[1])
+        return items if limit is None else items[:limit]
@@ -0,0 +1,414 @@
+import copy
+from typing import Any, Dict, Iterable, List, Optional, Union
+import numpy as np
+import pandas as pd
+
+from dataprofiler.utils import detect_column_types, memory_usage_bytes, entropy_from_counts
+from dataprofiler.utils.timer import stage
+from dataprofiler.model import DatasetStats, CorrelationMatrix, CorrelationPairs, Correlations, DuplicatesSummary, OverallMissingness, ProfileResult
+from .correlations import matrix_pairs, pearson_from_moments
+from .kernels import Moments, fd_bins, outlier_ranges, empty_numeric_summary
+from .sketches import KLLSketch, HyperLogLog, HeavyHitters
+from .duplicates import row_hashes
+from .missing import _pattern_counts
+from dataprofiler.config import CORR_DENSE_MAX_COLUMNS, MISSING_TOP_PATTERNS
+
+
+def _pct(part: int, total: int) -> float:
+    return float(part / total * 100.0) if total else float("nan")
+
+
+class NumericState:
+    def __init__(self, integer: bool = False, k: int = 200, mode_capacity: int = 64):
+        self.integer = integer
+        self.rows = 0
+        self.moments = Moments()
+        self.sketch = KLLSketch(k)
+        self.modes = HeavyHitters(mode_capacity)
+
+    def update(self, s: pd.Series) -> None:
+        vals = s.to_numpy(dtype=np.float64, na_value=np.nan)
+        x = vals[~np.isnan(vals)]
+        self.rows += int(vals.size)
+        self.moments = self.moments.merge(Moments.from_array(x))
+        self.sketch.update(x)
+        keys, counts = np.unique(x, return_counts=True)
+        self.modes.update_arrays(keys, counts)
+
+    def merge(self, other: "NumericState") -> "NumericState":
+        self.rows += other.rows
+        self.moments = self.moments.merge(other.moments)
+        self.sketch.merge(other.sketch)
+        self.modes.merge(other.modes)
+        return self
+
+    def _histogram(self, bins: int) -> Dict[str, List]:
+        lo, hi = self.moments.min, self.moments.max
+        if not (np.isfinite(lo) and np.isfinite(hi)):
+            return {"edges": [], "counts": []}
+        if lo == hi:
+            lo, hi = lo - 0.5, hi + 0.5
+        edges = np.linspace(lo, hi, bins + 1)
+        ranks = np.concatenate(([0.0], self.sketch.ranks(edges[1:-1]), [float(self.moments.n)]))
+        counts = np.maximum(np.diff(np.round(ranks)), 0).astype(np.int64)
+        return {"edges": edges.tolist(), "counts": counts.tolist()}
+
+    def _mode(self) -> List:
+        common = self.modes.most_common()
+        if not common or common[0][1] <= self.modes.error:
+            return []
+        top = common[0][1]
+        vals = sorted(v for v, c in common if c == top)
+        return [int(v) for v in vals] if self.integer else vals
+
+    def finalize(self) -> Dict[str, Any]:
+        m = self.moments
+        missing_pct = _pct(self.rows - m.n, self.rows)
+        if m.n == 0:
+            return empty_numeric_summary(missing_pct)
+        q25, q50, q75 = self.sketch.quantiles([0.25, 0.5, 0.75])
+        return {
+            "mean": float(m.mean),
+            "median": q50,
+            "mode": self._mode(),
+            "std": m.std(ddof=1),
+            "variance": m.variance(ddof=1),
+            "skewness": m.skewness(),
+            "kurtosis": m.kurtosis(),
+            "quantiles": {"q25": q25, "q50": q50, "q75": q75},
+            "missing_pct": missing_pct,
+            "histogram": self._histogram(fd_bins(m.n, q25, q75, m.min, m.max)),
+            "outlier_ranges": outlier_ranges(q25, q75, m),
+        }
+
+
+class CategoricalState:
+    def __init__(self, capacity: int = 1024, precision: int = 14):
+        self.rows = 0
+        self.missing = 0
+        self.freq = HeavyHitters(capacity)
+        self.hll = HyperLogLog(precision)
+
+    def update(self, s: pd.Series) -> None:
+        vc = s.value_counts(dropna=True, sort=False)
+        vc.index = vc.index.astype(str)
+        if not vc.index.is_unique:
+            vc = vc.groupby(level=0).sum()
+        keys = vc.index.to_numpy(dtype=object)
+        self.rows += int(len(s))
+        self.missing += int(s.isna().sum())
+        self.freq.update_arrays(keys, vc.to_numpy())
+        self.hll.update(keys)
+
+    def merge(self, other: "CategoricalState") -> "CategoricalState":
+        self.rows += other.rows
+        self.missing += other.missing
+        self.freq.merge(other.freq)
+        self.hll.merge(other.hll)
+        return self
+
+    def finalize(self) -> Dict[str, Any]:
+        common = self.freq.most_common()
+        frequencies = {k: int(v) for k, v in common}
+        if self.freq.exact:
+            cardinality = len(frequencies)
+            entropy = float(entropy_from_counts(frequencies))
+        else:
+            cardinality = max(int(round(self.hll.estimate())), len(frequencies))
+            rest = self.freq.n - sum(frequencies.values())
+            tail = cardinality - len(frequencies)
+            spread = rest if tail > 0 and rest > 0 else 0
+            counts = np.fromiter(frequencies.values(), dtype=np.float64, count=len(frequencies))
+            total = counts.sum() + spread
+            p = counts[counts > 0] / total if total else counts[:0]
+            entropy = float(-(p * np.log(p)).sum())
+            if spread:
+                # The unseen remainder spread evenly over ``tail`` values, in closed form.
+                entropy -= float(spread / total * np.log(spread / (tail * total)))
+        return {
+            "cardinality": cardinality,
+            "top_values": [k for k, _ in common[:10]],
+            "frequencies": frequencies,
+            "entropy": entropy,
+            "missing_pct": _pct(self.missing, self.rows),
+        }
+
+
+class DatetimeState:
+    def __init__(self):
+        self.rows = 0
+        self.missing = 0
+        self.min: Optional[pd.Timestamp] = None
+        self.max: Optional[pd.Timestamp] = None
+        self.weekdays = np.zeros(7, dtype=np.int64)
+
+    def _bounds(self, lo: Optional[pd.Timestamp], hi: Optional[pd.Timestamp]) -> None:
+        if lo is not None and (self.min is None or lo < self.min):
+            self.min = lo
+        if hi is not None and (self.max is None or hi > self.max):
+            self.max = hi
+
+    def update(self, s: pd.Series) -> None:
+        present = s.dropna()
+        self.rows += int(len(s))
+        self.missing += int(len(s) - len(present))
+        if not present.empty:
+            self._bounds(present.min(), present.max())
+            self.weekdays += np.bincount(present.dt.weekday.to_numpy(), minlength=7)
+
+    def merge(self, other: "DatetimeState") -> "DatetimeState":
+        self.rows += other.rows
+        self.missing += other.missing
+        self._bounds(other.min, other.max)
+        self.weekdays += other.weekdays
+        return self
+
+    def finalize(self) -> Dict[str, Any]:
+        order = sorted((d for d in range(7) if self.weekdays[d]), key=lambda d: -self.weekdays[d])
+        empty = self.min is None
+        return {
+            "min": None if empty else str(self.min),
+            "max": None if empty else str(self.max),
+            "earliest": None if empty else str(self.min),
+            "latest": None if empty else str(self.max),
+            # Gaps are measured against the median interval of the fully sorted column.
+            "gaps": [],
+            "weekday_distribution": {int(d): int(self.weekdays[d]) for d in order},
+            "missing_pct": _pct(self.missing, self.rows),
+        }
+
+
+class PearsonState:
+    def __init__(self, columns: List[str]):
+        self.columns = list(columns)
+        k = len(self.columns)
+        self.shift: Optional[np.ndarray] = None
+        self.n = np.zeros((k, k))
+        self.sx = np.zeros((k, k))
+        self.sxx = np.zeros((k, k))
+        self.sxy = np.zeros((k, k))
+
+    def update(self, df: pd.DataFrame) -> None:
+        if not self.columns:
+            return
+        x = np.column_stack([df[c].to_numpy(dtype=np.float64, na_value=np.nan) for c in self.columns])
+        # Non-finite values count as missing, as in compute_correlations.
+        present = np.isfinite(x)
+        if self.shift is None:
+            self.shift = np.where(present, x, 0.0).sum(axis=0) / np.maximum(present.sum(axis=0), 1)
+        x0 = np.where(present, x - self.shift, 0.0)
+        p = present.astype(np.float64)
+        self.n += p.T @ p
+        self.sx += x0.T @ p
+        self.sxx += (x0 * x0).T @ p
+        self.sxy += x0.T @ x0
+
+    def merge(self, other: "PearsonState") -> "PearsonState":
+        if other.shift is None:
+            return self
+        if self.shift is None:
+            self.shift, self.n, self.sx, self.sxx, self.sxy = other.shift, other.n, other.sx, other.sxx, other.sxy
+            return self
+        d = other.shift - self.shift
+        dx, dy = d[:, None], d[None, :]
+        sx_o, sy_o = other.sx, other.sx.T
+        self.sxy += other.sxy + dy * sx_o + dx * sy_o + dx * dy * other.n
+        self.sxx += other.sxx + 2 * dx * sx_o + dx * dx * other.n
+        self.sx += sx_o + dx * other.n
+        self.n += other.n
+        return self
+
+    def finalize(self) -> Union[CorrelationMatrix, CorrelationPairs]:
+        if not self.columns:
+            return CorrelationMatrix.empty()
+        matrix = CorrelationMatrix(self.columns, pearson_from_moments(self.n, self.sx, self.sxx, self.sxy))
+        # The sums are k x k regardless; wide results are still cut to pairs.
+        return matrix_pairs(matrix) if len(self.columns) > CORR_DENSE_MAX_COLUMNS else matrix
+
+
+class FrameCounts:
+    """Exact, cheap whole-data counters shared by the streaming states."""
+
+    def __init__(self, frequency_capacity: int = 1024, hll_precision: int = 14, exact_row_limit: int = 2_000_000):
+        self.frequency_capacity = frequency_capacity
+        self.hll_precision = hll_precision
+        self.exact_row_limit = exact_row_limit
+        self.rows = 0
+        self.memory_usage = 0
+        self.columns: List[str] = []
+        self.column_types: Dict[str, str] = {}
+        self.missing = np.zeros(0, dtype=np.int64)
+        self.patterns = HeavyHitters(frequency_capacity)
+        self.row_hll = HyperLogLog(hll_precision)
+        self.row_digests: Optional[List[np.ndarray]] = []
+        self._compacted = 0
+
+    def _init_columns(self, df: pd.DataFrame) -> None:
+        self.columns = list(df.columns)
+        self.column_types = detect_column_types(df)
+        self.missing = np.zeros(len(self.columns), dtype=np.int64)
+
+    def update(self, df: pd.DataFrame) -> "FrameCounts":
+        if not self.columns:
+            self._init_columns(df)
+        elif list(df.columns) != self.columns:
+            raise ValueError("Chunk columns do not match the profile state")
+        self.rows += int(len(df))
+        self.memory_usage += memory_usage_bytes(df)
+        mask = df.isna().to_numpy(dtype=bool)
+        self.missing += mask.sum(axis=0)
+        combos, counts, _ = _pattern_counts(mask)
+        self.patterns.update_counts({np.packbits(c).tobytes(): int(n) for c, n in zip(combos, counts)})
+        digests = row_hashes(df)
+        self.row_hll.update_hashes(digests)
+        self._track_rows([digests])
+        return self
+
+    def _track_rows(self, digests: List[np.ndarray]) -> None:
+        if self.row_digests is None:
+            return
+        self.row_digests.extend(digests)
+        # Deduplicate only once the pending digests outgrow the last
+        # compacted set, so the amortised cost stays linear.
+        pending = sum(d.size for d in self.row_digests)
+        if pending > max(2 * self._compacted, 1 << 16):
+            self._compact_rows()
+
+    def _compact_rows(self) -> None:
+        if self.row_digests is None:
+            return
+        merged = np.unique(np.concatenate(self.row_digests)) if self.row_digests else np.empty(0, dtype=np.uint64)
+        if merged.size > self.exact_row_limit:
+            self.row_digests = None
+        else:
+            self.row_digests = [merged]
+            self._compacted = merged.size
+
+    def merge(self, other: "FrameCounts") -> "FrameCounts":
+        if not other.columns:
+            return self
+        if not self.columns:
+            self.__dict__.update(copy.deepcopy(other.__dict__))
+            return self
+        if other.columns != self.columns:
+            raise ValueError("Cannot merge profile states with different columns")
+        self.rows += other.rows
+        self.memory_usage += other.memory_usage
+        self.missing += other.missing
+        self.patterns.merge(other.patterns)
+        self.row_hll.merge(other.row_hll)
+        if other.row_digests is None:
+            self.row_digests = None
+        else:
+            self._track_rows(other.row_digests)
+        return self
+
+    def dataset_stats(self) -> DatasetStats:
+        return DatasetStats(
+            rows=self.rows,
+            columns=len(self.columns),
+            memory_usage=self.memory_usage,
+            column_types=dict(self.column_types),
+        )
+
+    def missing_pct(self) -> Dict[str, float]:
+        return {c: _pct(int(m), self.rows) for c, m in zip(self.columns, self.missing)}
+
+    def duplicates(self) -> DuplicatesSummary:
+        self._compact_rows()
+        distinct = self.row_digests[0].size if self.row_digests else self.row_hll.estimate()
+        dup_rows = int(max(0, round(self.rows - distinct)))
+        return DuplicatesSummary(
+            duplicate_rows_count=dup_rows,
+            duplicate_rows_percentage=float(dup_rows / self.rows * 100.0) if self.rows else 0.0,
+            duplicate_columns=[],
+        )
+
+    def overall_missingness(self, top_n: int = MISSING_TOP_PATTERNS) -> OverallMissingness:
+        patterns = []
+        for key, count in self.patterns.most_common(top_n):
+            bits = np.unpackbits(np.frombuffer(key, dtype=np.uint8))[:len(self.columns)]
+            cols = sorted(self.columns[j] for j in np.flatnonzero(bits))
+            patterns.append({"columns": cols, "count": int(count), "share": _pct(count, self.rows)})
+        return OverallMissingness(
+            total_missing_pct=_pct(int(self.missing.sum()), self.rows * len(self.columns)),
+            patterns=patterns,
+        )
+
+
+class ProfileState(FrameCounts):
+    """Mergeable per-chunk state behind ``--streaming``. Quantiles and
+    histograms come from KLL sketches (about 1.7% rank error with 99%
+    probability at k=200); moments, missingness, datetime bounds, weekday
+    counts and Pearson are exact. Spearman, Cramér's V, duplicate columns
+    and datetime gaps need the full data and are left empty."""
+
+    def __init__(
+        self,
+        quantile_k: int = 200,
+        frequency_capacity: int = 1024,
+        hll_precision: int = 14,
+        exact_row_limit: int = 2_000_000,
+    ):
+        super().__init__(frequency_capacity, hll_precision, exact_row_limit)
+        self.quantile_k = quantile_k
+        self.numeric: Dict[str, NumericState] = {}
+        self.categorical: Dict[str, CategoricalState] = {}
+        self.datetime: Dict[str, DatetimeState] = {}
+        self.pearson: Optional[PearsonState] = None
+
+    def _init_columns(self, df: pd.DataFrame) -> None:
+        super()._init_columns(df)
+        for col in df.select_dtypes(include=["number"]).columns:
+            self.numeric[col] = NumericState(pd.api.types.is_integer_dtype(df[col].dtype), k=self.quantile_k)
+        for col in df.select_dtypes(include=["object", "category", "bool"]).columns:
+            self.categorical[col] = CategoricalState(self.frequency_capacity, self.hll_precision)
+        for col in df.select_dtypes(include=["datetime", "datetimetz", "datetime64[ns]"]).columns:
+            self.datetime[col] = DatetimeState()
+        self.pearson = PearsonState(list(self.numeric))
+
+    def update(self, df: pd.DataFrame) -> "ProfileState":
+        n = len(df)
+        with stage("counts", rows=n):
+            super().update(df)
+        for group in ("numeric", "categorical", "datetime"):
+            for col, state in getattr(self, group).items():
+                with stage(group, column=col, rows=n):
+                    state.update(df[col])
+        with stage("pearson", rows=n):
+            self.pearson.update(df)
+        return self
+
+    def merge(self, other: "ProfileState") -> "ProfileState":
+        fresh = not (self.columns and other.columns)
+        super().merge(other)
+        if fresh:
+            return self
+        for group in ("numeric", "categorical", "datetime"):
+            mine = getattr(self, group)
+            for col, state in getattr(other, group).items():
+                mine[col].merge(state)
+        self.pearson.merge(other.pearson)
+        return self
+
+    def finalize(self, top_patterns: int = MISSING_TOP_PATTERNS) -> ProfileResult:
+        return ProfileResult(
+            dataset_stats=self.dataset_stats(),
+            numeric_columns={c: s.finalize() for c, s in self.numeric.items()},
+            categorical_columns={c: s.finalize() for c, s in self.categorical.items()},
+            datetime_columns={c: s.finalize() for c, s in self.datetime.items()},
+            correlations=Correlations(
+                pearson_matrix=self.pearson.finalize() if self.pearson else CorrelationMatrix.empty(),
+                spearman_matrix=CorrelationMatrix.empty(),
+                cramer_v_matrix=CorrelationMatrix.empty(),
+            ),
+            duplicates=self.duplicates(),
+            overall_missingness=self.overall_missingness(top_patterns),
+        )
+
+
+def profile_frames(frames: Iterable[pd.DataFrame], **kwargs) -> ProfileResult:
+    state = ProfileState(**kwargs)
+    for frame in frames:
+        state.update(frame)
+    return state.finalize()
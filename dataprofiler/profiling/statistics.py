@@ -1,55 +1,21 @@
 from typing import Dict
+import numpy as np
 import pandas as pd
-from dataprofiler.utils import series_mode, histogram_for_series, iqr_bounds, zscore_bounds
+from .kernels import numeric_summary, empty_numeric_summary
 
 
 def compute_numeric(df: pd.DataFrame) -> Dict[str, Dict]:
     out: Dict[str, Dict] = {}
     num_cols = df.select_dtypes(include=["number"]).columns
     for col in num_cols:
-        s = df[col].dropna()
-        if s.empty:
-            out[col] = {
-                "mean": None,
-                "median": None,
-                "mode": [],
-                "std": None,
-                "variance": None,
-                "skewness": None,
-                "kurtosis": None,
-                "quantiles": {"q25": None, "q50": None, "q75": None},
-                "missing_pct": float(df[col].isna().mean() * 100.0),
-                "histogram": {"edges": [], "counts": []},
-                "outlier_ranges": {"iqr": {"lower": None, "upper": None}, "zscore": {"lower": None, "upper": None}},
-            }
+        vals = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        present = ~np.isnan(vals)
+        missing_pct = float((~present).mean() * 100.0) if vals.size else float("nan")
+        x = vals[present]
+        if x.size == 0:
+            out[col] = empty_numeric_summary(missing_pct)
             continue
-        mean = float(s.mean())
-        median = float(s.median())
-        mode_vals = series_mode(s)
-        std = float(s.std(ddof=1))
-        var = float(s.var(ddof=1))
-        skew = float(s.skew())
-        kurt = float(s.kurt())
-        q25 = float(s.quantile(0.25))
-        q50 = float(s.quantile(0.5))
-        q75 = float(s.quantile(0.75))
-        edges, counts = histogram_for_series(df[col])
-        lb_iqr, ub_iqr = iqr_bounds(df[col])
-        lb_z, ub_z = zscore_bounds(df[col])
-        out[col] = {
-            "mean": mean,
-            "median": median,
-            "mode": mode_vals,
-            "std": std,
-            "variance": var,
-            "skewness": skew,
-            "kurtosis": kurt,
-            "quantiles": {"q25": q25, "q50": q50, "q75": q75},
-            "missing_pct": float(df[col].isna().mean() * 100.0),
-            "histogram": {"edges": edges, "counts": counts},
-            "outlier_ranges": {
-                "iqr": {"lower": float(lb_iqr), "upper": float(ub_iqr)},
-                "zscore": {"lower": float(lb_z), "upper": float(ub_z)},
-            },
-        }
-    return out
\ No newline at end of file
+        stats = numeric_summary(x, integer=pd.api.types.is_integer_dtype(df[col].dtype))
+        stats["missing_pct"] = missing_pct
+        out[col] = {k: stats[k] for k in ("mean", "median", "mode", "std", "variance", "skewness", "kurtosis", "quantiles", "missing_pct", "histogram", "outlier_ranges")}
+    return out
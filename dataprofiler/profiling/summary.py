@@ -1,51 +1,140 @@
-from typing import Dict
+from typing import Collection, Dict, Optional, Union
 import pandas as pd
 
 from dataprofiler.utils import detect_column_types, memory_usage_bytes
-from dataprofiler.model import DatasetStats, Correlations, DuplicatesSummary, OverallMissingness, ProfileResult
+from dataprofiler.utils.timer import active_recorder, stage
+from dataprofiler.anomalies.engine import bounds_from_stats, outlier_masks
+from dataprofiler.model import AnomalySummary, DatasetStats, Correlations, DuplicatesSummary, OverallMissingness, ProfileResult
 from .statistics import compute_numeric
 from .missing import compute_missing
 from .duplicates import compute_duplicates
 from .categories import compute_categorical
 from .correlations import compute_correlations
 from .datetime_profile import compute_datetime
+from dataprofiler.config import SAMPLE_CONFIDENCE
+from .parallel import plan_tasks, resolve_n_jobs, run_sections
+from .sampling import annotate_sample, draw_sample, sampling_summary
 
+_SECTIONS = {
+    "numeric": compute_numeric,
+    "categorical": compute_categorical,
+    "datetime": compute_datetime,
+    "missing": compute_missing,
+    "duplicates": compute_duplicates,
+    "correlations": compute_correlations,
+}
+# Statistics estimated from the sample in sampling mode; the rest stay exact.
+_SAMPLED_SECTIONS = ("numeric", "categorical", "correlations")
 
-def combine_into_profile_result(df: pd.DataFrame) -> ProfileResult:
-    ct = detect_column_types(df)
-    ds = DatasetStats(
-        rows=int(len(df)),
-        columns=int(df.shape[1]),
-        memory_usage=memory_usage_bytes(df),
-        column_types=ct,
+
+def _run_sections_serial(df: pd.DataFrame, sections: Optional[Collection[str]] = None) -> Dict:
+    if active_recorder() is None:
+        return {name: fn(df) for name, fn in _SECTIONS.items() if sections is None or name in sections}
+    # Split per column, as the parallel path does, so slow columns show up.
+    out: Dict = {name: {} for name in _SECTIONS if sections is None or name in sections}
+    for section, column in plan_tasks(df, sections):
+        if column is None:
+            with stage(section, rows=len(df)):
+                out[section] = _SECTIONS[section](df)
+        else:
+            with stage(section, column=str(column), rows=len(df)):
+                out[section].update(_SECTIONS[section](df[[column]]))
+    return out
+
+
+def _run(df: pd.DataFrame, workers: int, sections: Optional[Collection[str]] = None) -> Dict:
+    return run_sections(df, workers, sections) if workers > 1 else _run_sections_serial(df, sections)
+
+
+def summarize_anomalies(df: pd.DataFrame, numeric: Dict[str, Dict]) -> AnomalySummary:
+    # Reuses the bounds compute_numeric already derived (from the sample in
+    # sampling mode); the counts are over every row.
+    cols = [c for c in numeric if c in df.columns]
+    res = outlier_masks(df, cols, bounds_from_stats(numeric, cols))
+    methods = [m for m in res if m not in ("columns", "rows")]
+    return AnomalySummary(
+        counts={m: {str(c): int(v) for c, v in zip(cols, res[m]["counts"])} for m in methods},
+        rows_flagged={m: res[m]["rows_flagged"] for m in methods},
     )
-    numeric_stats = compute_numeric(df)
-    categorical_stats = compute_categorical(df)
-    datetime_stats = compute_datetime(df)
-    missing_stats = compute_missing(df)
-    dup_stats = compute_duplicates(df)
-    correlations = compute_correlations(df)
+
+
+def combine_into_profile_result(
+    df: pd.DataFrame,
+    n_jobs: Optional[int] = None,
+    sample: Optional[Union[int, float]] = None,
+    stratify: Optional[str] = None,
+    confidence: float = SAMPLE_CONFIDENCE,
+    seed: Optional[int] = 0,
+) -> ProfileResult:
+    with stage("dataset_stats", rows=len(df)):
+        ds = DatasetStats(
+            rows=int(len(df)),
+            columns=int(df.shape[1]),
+            memory_usage=memory_usage_bytes(df),
+            column_types=detect_column_types(df),
+        )
+    workers = resolve_n_jobs(n_jobs)
+    sampled = None
+    if sample is None:
+        sections = _run(df, workers)
+    else:
+        if stratify is not None and stratify not in df.columns:
+            raise KeyError(f"Stratification column not found: {stratify}")
+        with stage("draw_sample", rows=len(df)):
+            sampled = draw_sample(df, sample, stratify, seed)
+        sections = _run(df, workers, [s for s in _SECTIONS if s not in _SAMPLED_SECTIONS])
+        with stage("sampled", rows=len(sampled)):
+            sections.update(_run(sampled, workers, _SAMPLED_SECTIONS))
+        missing_pct = {c: v["missing_pct"] for c, v in sections["missing"]["per_column"].items()}
+        with stage("intervals", rows=len(sampled)):
+            annotate_sample(sections, sampled, len(df), missing_pct, confidence)
+    missing_stats = sections["missing"]
+    dup_stats = sections["duplicates"]
+    correlations = sections["correlations"]
     corr = Correlations(
-        pearson_matrix=correlations.get("pearson_matrix", {}),
-        spearman_matrix=correlations.get("spearman_matrix", {}),
-        cramer_v_matrix=correlations.get("cramer_v_matrix", {}),
+        pearson_matrix=correlations["pearson_matrix"],
+        spearman_matrix=correlations["spearman_matrix"],
+        cramer_v_matrix=correlations["cramer_v_matrix"],
+        intervals=correlations.get("intervals", {}),
     )
     dups = DuplicatesSummary(
         duplicate_rows_count=dup_stats["duplicate_rows_count"],
         duplicate_rows_percentage=dup_stats["duplicate_rows_percentage"],
         duplicate_columns=dup_stats["duplicate_columns"],
     )
-    overall = OverallMissingness(total_missing_pct=missing_stats["overall_missing_pct"]) 
+    patterns = [
+        {"columns": cols, "count": count, "share": share}
+        for (cols, count), share in zip(missing_stats["patterns"], missing_stats["pattern_shares"])
+    ]
+    overall = OverallMissingness(total_missing_pct=missing_stats["overall_missing_pct"], patterns=patterns)
+    with stage("anomalies", rows=len(df)):
+        anomalies = summarize_anomalies(df, sections["numeric"])
     return ProfileResult(
         dataset_stats=ds,
-        numeric_columns=numeric_stats,
-        categorical_columns=categorical_stats,
-        datetime_columns=datetime_stats,
+        numeric_columns=sections["numeric"],
+        categorical_columns=sections["categorical"],
+        datetime_columns=sections["datetime"],
         correlations=corr,
         duplicates=dups,
         overall_missingness=overall,
+        sampling=sampling_summary(sampled, len(df), confidence, stratify) if sampled is not None else None,
+        anomalies=anomalies,
     )
 
 
-def profile_data(df: pd.DataFrame) -> ProfileResult:
-    return combine_into_profile_result(df)
\ No newline at end of file
+def profile_data(
+    df: pd.DataFrame,
+    n_jobs: Optional[int] = None,
+    sample: Optional[Union[int, float]] = None,
+    stratify: Optional[str] = None,
+    confidence: float = SAMPLE_CONFIDENCE,
+    seed: Optional[int] = 0,
+) -> ProfileResult:
+    recorder = active_recorder()
+    with stage("profile", rows=len(df)):
+        result = combine_into_profile_result(
+            df, n_jobs=n_jobs, sample=sample, stratify=stratify, confidence=confidence, seed=seed
+        )
+    if recorder is not None:
+        result.timings = recorder.timings()
+    return result
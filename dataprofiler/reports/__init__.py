@@ -1,4 +1,15 @@
-from .builder import build_report
-from .exporter import export_html, export_json, export_pdf
+from dataprofiler._lazy import lazy_exports
 
-__all__ = ["build_report", "export_html", "export_json", "export_pdf"]
\ No newline at end of file
+_EXPORTS = {
+    "build_report": ".builder",
+    "iter_report": ".builder",
+    "write_report": ".builder",
+    "export_html": ".exporter",
+    "export_json": ".exporter",
+    "export_msgpack": ".exporter",
+    "export_parquet": ".exporter",
+    "export_pdf": ".exporter",
+    "format_timings": ".timings",
+}
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,7 +1,20 @@
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Optional, TextIO, Tuple, Union
 
-from .charts import histogram_html, correlation_heatmap_html
+from dataprofiler.config import (
+    REPORT_HEATMAP_BLOCK,
+    REPORT_HEATMAP_MAX_COLUMNS,
+    REPORT_MAX_FREQUENCIES,
+    REPORT_PARALLEL_MIN_COLUMNS,
+    REPORT_TOP_PAIRS,
+)
+from dataprofiler.model import CorrelationPairs
+from dataprofiler.utils import resolve_n_jobs
+from dataprofiler.utils.timer import stage
+from .charts import histogram_html, correlation_heatmap_tiles, strongest_pairs_html
 
 
 def _load_template() -> str:
@@ -25,84 +38,135 @@ def _summary_section(profile) -> str:
         ("Columns", ds.columns),
         ("Memory Usage (bytes)", ds.memory_usage),
     ]
+    sm = getattr(profile, "sampling", None)
+    if sm is not None:
+        rows.append(("Sample Rows", f"{sm.sample_rows} ({sm.method}, {sm.confidence:.0%} intervals)"))
+    an = getattr(profile, "anomalies", None)
+    if an is not None:
+        rows.append(("Outlier Rows (IQR)", an.rows_flagged.get("iqr")))
+        rows.append(("Outlier Rows (z-score)", an.rows_flagged.get("zscore")))
     table = "<table><tr><th>Metric</th><th>Value</th></tr>" + "".join(
         f"<tr><td>{k}</td><td>{v}</td></tr>" for k, v in rows
-    ) + "</table"
+    ) + "</table>"
     types_table = "<table><tr><th>Column</th><th>Type</th></tr>" + "".join(
         f"<tr><td>{c}</td><td>{t}</td></tr>" for c, t in ds.column_types.items()
     ) + "</table>"
     return "<div class=\"card\"><div class=\"section-title\">Dataset</div>" + table + types_table + "</div>"
 
 
-def _numeric_section(profile) -> str:
-    items = []
-    for col, stats in profile.numeric_columns.items():
-        rows = [
-            ("Mean", stats.get("mean")),
-            ("Median", stats.get("median")),
-            ("Mode", ", ".join(map(str, stats.get("mode", [])))),
-            ("Std", stats.get("std")),
-            ("Variance", stats.get("variance")),
-            ("Skewness", stats.get("skewness")),
-            ("Kurtosis", stats.get("kurtosis")),
-            ("Q25", stats.get("quantiles", {}).get("q25")),
-            ("Q50", stats.get("quantiles", {}).get("q50")),
-            ("Q75", stats.get("quantiles", {}).get("q75")),
-            ("Missing %", stats.get("missing_pct")),
-        ]
-        table = "<table><tr><th>Metric</th><th>Value</th></tr>" + "".join(
-            f"<tr><td>{k}</td><td>{v}</td></tr>" for k, v in rows
-        ) + "</table>"
-        hist = stats.get("histogram", {})
-        edges = hist.get("edges", [])
-        counts = hist.get("counts", [])
-        hhtml = histogram_html(col, edges, counts)
-        items.append("<div class=\"card\"><div class=\"subhdr\">" + col + "</div>" + table + hhtml + "</div>")
-    return "<div class=\"section-title\">Numeric Columns</div><div class=\"grid\">" + "".join(items) + "</div>"
-
-
-def _categorical_section(profile) -> str:
-    items = []
-    for col, stats in profile.categorical_columns.items():
-        rows = [
-            ("Cardinality", stats.get("cardinality")),
-            ("Entropy", stats.get("entropy")),
-            ("Missing %", stats.get("missing_pct")),
-        ]
-        table = "<table><tr><th>Metric</th><th>Value</th></tr>" + "".join(
-            f"<tr><td>{k}</td><td>{v}</td></tr>" for k, v in rows
-        ) + "</table>"
-        freq = stats.get("frequencies", {})
-        ftable = "<table><tr><th>Value</th><th>Count</th></tr>" + "".join(
-            f"<tr><td>{k}</td><td>{v}</td></tr>" for k, v in list(freq.items())[:20]
-        ) + "</table>"
-        items.append("<div class=\"card\"><div class=\"subhdr\">" + col + "</div>" + table + ftable + "</div>")
-    return "<div class=\"section-title\">Categorical Columns</div><div class=\"grid\">" + "".join(items) + "</div>"
-
-
-def _datetime_section(profile) -> str:
-    items = []
-    for col, stats in profile.datetime_columns.items():
-        rows = [
-            ("Earliest", stats.get("earliest")),
-            ("Latest", stats.get("latest")),
-            ("Missing %", stats.get("missing_pct")),
-        ]
-        table = "<table><tr><th>Metric</th><th>Value</th></tr>" + "".join(
-            f"<tr><td>{k}</td><td>{v}</td></tr>" for k, v in rows
-        ) + "</table>"
-        wd = stats.get("weekday_distribution", {})
-        wtable = "<table><tr><th>Weekday</th><th>Count</th></tr>" + "".join(
-            f"<tr><td>{k}</td><td>{v}</td></tr>" for k, v in wd.items()
-        ) + "</table>"
-        items.append("<div class=\"card\"><div class=\"subhdr\">" + col + "</div>" + table + wtable + "</div>")
-    return "<div class=\"section-title\">Datetime Columns</div><div class=\"grid\">" + "".join(items) + "</div>"
-
-
-def _correlations_section(profile) -> str:
-    pm = profile.correlations.pearson_matrix
-    heat = correlation_heatmap_html(pm)
-    return "<div class=\"section-title\">Correlations (Pearson)</div>" + heat
+def _metric_table(rows) -> str:
+    return "<table><tr><th>Metric</th><th>Value</th></tr>" + "".join(
+        f"<tr><td>{k}</td><td>{v}</td></tr>" for k, v in rows
+    ) + "</table>"
+
+
+def _numeric_card(col: str, stats: Dict[str, Any]) -> str:
+    rows = [
+        ("Mean", stats.get("mean")),
+        ("Median", stats.get("median")),
+        ("Mode", ", ".join(map(str, stats.get("mode", [])))),
+        ("Std", stats.get("std")),
+        ("Variance", stats.get("variance")),
+        ("Skewness", stats.get("skewness")),
+        ("Kurtosis", stats.get("kurtosis")),
+        ("Q25", stats.get("quantiles", {}).get("q25")),
+        ("Q50", stats.get("quantiles", {}).get("q50")),
+        ("Q75", stats.get("quantiles", {}).get("q75")),
+        ("Missing %", stats.get("missing_pct")),
+    ]
+    for name, (lo, hi) in stats.get("confidence_intervals", {}).items():
+        rows.append((f"{name.capitalize()} CI", f"[{lo:.6g}, {hi:.6g}]"))
+    hist = stats.get("histogram", {})
+    hhtml = histogram_html(col, hist.get("edges", []), hist.get("counts", []))
+    return "<div class=\"card\"><div class=\"subhdr\">" + col + "</div>" + _metric_table(rows) + hhtml + "</div>"
+
+
+def _categorical_card(col: str, stats: Dict[str, Any], hidden: int = 0) -> str:
+    rows = [
+        ("Cardinality", stats.get("cardinality")),
+        ("Entropy", stats.get("entropy")),
+        ("Missing %", stats.get("missing_pct")),
+    ]
+    freq = stats.get("frequencies", {})
+    more = f"<tr><td colspan=\"2\">&hellip; {hidden} more values</td></tr>" if hidden else ""
+    ftable = "<table><tr><th>Value</th><th>Count</th></tr>" + "".join(
+        f"<tr><td>{k}</td><td>{v}</td></tr>" for k, v in freq.items()
+    ) + more + "</table>"
+    return "<div class=\"card\"><div class=\"subhdr\">" + col + "</div>" + _metric_table(rows) + ftable + "</div>"
+
+
+def _datetime_card(col: str, stats: Dict[str, Any]) -> str:
+    rows = [
+        ("Earliest", stats.get("earliest")),
+        ("Latest", stats.get("latest")),
+        ("Missing %", stats.get("missing_pct")),
+    ]
+    wd = stats.get("weekday_distribution", {})
+    wtable = "<table><tr><th>Weekday</th><th>Count</th></tr>" + "".join(
+        f"<tr><td>{k}</td><td>{v}</td></tr>" for k, v in wd.items()
+    ) + "</table>"
+    return "<div class=\"card\"><div class=\"subhdr\">" + col + "</div>" + _metric_table(rows) + wtable + "</div>"
+
+
+def _render_card(kind: str, col: str, stats: Dict[str, Any], hidden: int) -> str:
+    if kind == "numeric":
+        return _numeric_card(col, stats)
+    if kind == "categorical":
+        return _categorical_card(col, stats, hidden)
+    return _datetime_card(col, stats)
+
+
+def _card_args(kind: str, columns: Dict[str, Dict[str, Any]], max_frequencies: int) -> Iterator[Tuple]:
+    for col, stats in columns.items():
+        hidden = 0
+        if kind == "categorical":
+            freq = stats.get("frequencies", {})
+            if len(freq) > max_frequencies:
+                # Only the rows that will be shown travel to the renderer.
+                hidden = len(freq) - max_frequencies
+                stats = dict(stats, frequencies=dict(islice(freq.items(), max_frequencies)))
+        yield kind, col, stats, hidden
+
+
+def _render_cards(args: Iterator[Tuple], pool: Optional[Executor], window: int) -> Iterator[str]:
+    if pool is None:
+        for a in args:
+            yield _render_card(*a)
+        return
+    # A bounded window of in-flight cards keeps output ordered and memory flat.
+    pending: deque = deque()
+    for a in args:
+        pending.append(pool.submit(_render_card, *a))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _column_section(title: str, kind: str, columns, max_frequencies: int, pool, window: int) -> Iterator[str]:
+    yield f"<div class=\"section-title\">{title}</div><div class=\"grid\">"
+    yield from _render_cards(_card_args(kind, columns, max_frequencies), pool, window)
+    yield "</div>"
+
+
+def _correlations_section(
+    profile,
+    block: int = REPORT_HEATMAP_BLOCK,
+    max_columns: Optional[int] = REPORT_HEATMAP_MAX_COLUMNS,
+    top_pairs: int = REPORT_TOP_PAIRS,
+) -> Iterator[str]:
+    matrix = profile.correlations.pearson_matrix
+    yield "<div class=\"section-title\">Correlations (Pearson)</div>"
+    if isinstance(matrix, CorrelationPairs):
+        # Only the strongest pairs were kept, so there is no heatmap to draw.
+        kept = f"top {matrix.top_k} per column" if matrix.top_k is not None else f"|r| &ge; {matrix.threshold:g}"
+        yield f"<div class=\"heatmap-note\">Strongest pairs among {len(matrix)} columns ({kept}).</div>"
+        yield strongest_pairs_html(matrix, top_pairs)
+        return
+    if len(matrix) > 2:
+        yield "<div class=\"heatmap-note\">Strongest pairs</div>"
+        yield strongest_pairs_html(matrix, top_pairs)
+    yield from correlation_heatmap_tiles(matrix, block, max_columns)
 
 
 def _duplicates_section(profile) -> str:
@@ -127,18 +191,54 @@ def _missing_section(profile) -> str:
     return "<div class=\"section-title\">Missingness</div>" + card
 
 
-def build_report(profile, output_dir: str = None, title: str = "Data Profile") -> str:
-    tpl = _load_template()
-    content = []
-    content.append(_summary_section(profile))
-    content.append(_missing_section(profile))
-    content.append(_numeric_section(profile))
-    content.append(_categorical_section(profile))
-    content.append(_datetime_section(profile))
-    content.append(_correlations_section(profile))
-    html = tpl.replace("{{title}}", title).replace("{{content}}", "".join(content))
+def iter_report(
+    profile,
+    title: str = "Data Profile",
+    max_frequencies: int = REPORT_MAX_FREQUENCIES,
+    heatmap_block: int = REPORT_HEATMAP_BLOCK,
+    heatmap_max_columns: Optional[int] = REPORT_HEATMAP_MAX_COLUMNS,
+    n_jobs: Optional[int] = None,
+) -> Iterator[str]:
+    """Yields the report as HTML fragments in document order."""
+    head, tail = _load_template().replace("{{title}}", title).split("{{content}}", 1)
+    yield head
+    yield _summary_section(profile)
+    yield _missing_section(profile)
+    wide = len(profile.numeric_columns) + len(profile.categorical_columns) + len(profile.datetime_columns)
+    workers = resolve_n_jobs(n_jobs) if wide >= REPORT_PARALLEL_MIN_COLUMNS else 1
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        window = 4 * workers
+        yield from _column_section("Numeric Columns", "numeric", profile.numeric_columns, max_frequencies, pool, window)
+        yield from _column_section("Categorical Columns", "categorical", profile.categorical_columns, max_frequencies, pool, window)
+        yield from _column_section("Datetime Columns", "datetime", profile.datetime_columns, max_frequencies, pool, window)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    yield from _correlations_section(profile, heatmap_block, heatmap_max_columns)
+    yield tail
+
+
+def write_report(profile, out: Union[str, TextIO], title: str = "Data Profile", **kwargs) -> Optional[str]:
+    """Streams the report to a path or an open text handle."""
+    if not isinstance(out, str):
+        with stage("report"):
+            for fragment in iter_report(profile, title, **kwargs):
+                out.write(fragment)
+        return None
+    path = Path(out)
+    _ensure_assets(path.parent)
+    with stage("report"), path.open("w", encoding="utf-8") as f:
+        for fragment in iter_report(profile, title, **kwargs):
+            f.write(fragment)
+    return str(path)
+
+
+def build_report(profile, output_dir: str = None, title: str = "Data Profile", **kwargs) -> str:
+    with stage("report"):
+        html = "".join(iter_report(profile, title, **kwargs))
     if output_dir:
         out_dir = Path(output_dir)
         _ensure_assets(out_dir)
         (out_dir / "report.html").write_text(html, encoding="utf-8")
-    return html
\ No newline at end of file
+    return html
@@ -1,4 +1,7 @@
-from typing import Dict, List
+from typing import Iterator, List, Mapping, Optional, Tuple, Union
+import numpy as np
+
+from dataprofiler.model import CorrelationMatrix, CorrelationPairs
 
 
 def histogram_html(col: str, edges: List[float], counts: List[int]) -> str:
@@ -14,23 +17,85 @@ def histogram_html(col: str, edges: List[float], counts: List[int]) -> str:
     return f"<div class=\"histogram\"><div class=\"hist-title\">{col}</div>{inner}</div>"
 
 
-def correlation_heatmap_html(matrix: Dict[str, Dict[str, float]]) -> str:
-    labels = list(matrix.keys())
+def _heat_cell(v: float) -> str:
+    x = max(min(v, 1.0), -1.0)
+    if x >= 0:
+        color = f"rgba(0, 128, 255, {abs(x)})"
+    else:
+        color = f"rgba(255, 64, 64, {abs(x)})"
+    return f"<td style=\"background-color:{color}\">{x:.2f}</td>"
+
+
+def _as_matrix(matrix: Mapping) -> CorrelationMatrix:
+    return matrix if isinstance(matrix, CorrelationMatrix) else CorrelationMatrix.from_dict(matrix)
+
+
+def _heat_table(matrix: CorrelationMatrix, rows: List[str], cols: List[str]) -> str:
+    block = matrix.block(rows, cols).tolist()
+    header = "<tr><th></th>" + "".join(f"<th>{c}</th>" for c in cols) + "</tr>"
+    body = "".join(
+        "<tr>" + f"<th>{r}</th>" + "".join(_heat_cell(float(v)) for v in values) + "</tr>"
+        for r, values in zip(rows, block)
+    )
+    return f"<table class=\"heatmap\">{header}{body}</table>"
+
+
+def strongest_labels(matrix: Mapping, limit: int) -> List[str]:
+    # Columns ranked by their strongest off-diagonal correlation.
+    matrix = _as_matrix(matrix)
+    labels = list(matrix.columns)
+    if len(labels) <= limit:
+        return labels
+    strength = np.abs(np.nan_to_num(matrix.values, nan=0.0))
+    np.fill_diagonal(strength, 0.0)
+    keep = np.sort(np.argsort(-strength.max(axis=1), kind="stable")[:limit])
+    return [labels[i] for i in keep]
+
+
+def correlation_heatmap_tiles(
+    matrix: Mapping, block: int = 50, max_columns: Optional[int] = None
+) -> Iterator[str]:
+    """Yields the heatmap as block x block tables so wide matrices never
+    render as a single string."""
+    matrix = _as_matrix(matrix)
+    labels = list(matrix.columns)
     if not labels:
-        return "<div class=\"heatmap\">No data</div>"
-    header = "<tr><th></th>" + "".join(f"<th>{c}</th>" for c in labels) + "</tr>"
-    rows = []
-    for r in labels:
-        cells = [f"<th>{r}</th>"]
-        for c in labels:
-            v = float(matrix.get(r, {}).get(c, 0.0))
-            x = max(min(v, 1.0), -1.0)
-            if x >= 0:
-                a = int(255 * x)
-                color = f"rgba(0, 128, 255, {abs(x)})"
-            else:
-                color = f"rgba(255, 64, 64, {abs(x)})"
-            cells.append(f"<td style=\"background-color:{color}\">{x:.2f}</td>")
-        rows.append("<tr>" + "".join(cells) + "</tr>")
-    body = "".join(rows)
-    return f"<table class=\"heatmap\">{header}{body}</table>"
\ No newline at end of file
+        yield "<div class=\"heatmap\">No data</div>"
+        return
+    if max_columns is not None and len(labels) > max_columns:
+        labels = strongest_labels(matrix, max_columns)
+        yield f"<div class=\"heatmap-note\">Showing the {len(labels)} most correlated of {len(matrix)} columns.</div>"
+        matrix = matrix.take(labels)
+    if len(labels) <= block:
+        yield _heat_table(matrix, labels, labels)
+        return
+    for i in range(0, len(labels), block):
+        for j in range(0, len(labels), block):
+            rows, cols = labels[i:i + block], labels[j:j + block]
+            yield f"<div class=\"heatmap-tile\">{rows[0]} &ndash; {rows[-1]} &times; {cols[0]} &ndash; {cols[-1]}</div>"
+            yield _heat_table(matrix, rows, cols)
+
+
+def strongest_pairs(matrix: Union[CorrelationMatrix, CorrelationPairs], limit: int) -> List[Tuple[str, str, float]]:
+    if isinstance(matrix, CorrelationPairs):
+        return matrix.strongest(limit)
+    matrix = _as_matrix(matrix)
+    i, j = np.triu_indices(len(matrix), 1)
+    v = matrix.values[i, j]
+    order = np.argsort(-np.abs(v), kind="stable")[:limit]
+    order = order[v[order] != 0]
+    cols = matrix.columns
+    return [(cols[a], cols[b], r) for a, b, r in zip(i[order].tolist(), j[order].tolist(), v[order].tolist())]
+
+
+def strongest_pairs_html(matrix: Union[CorrelationMatrix, CorrelationPairs], limit: int = 50) -> str:
+    pairs = strongest_pairs(matrix, limit)
+    if not pairs:
+        return "<div class=\"heatmap-note\">No correlated pairs.</div>"
+    header = "<tr><th>Column</th><th>Column</th><th>r</th></tr>"
+    body = "".join(f"<tr><td>{a}</td><td>{b}</td>{_heat_cell(float(r))}</tr>" for a, b, r in pairs)
+    return f"<table class=\"pairs\">{header}{body}</table>"
+
+
+def correlation_heatmap_html(matrix: Mapping) -> str:
+    return "".join(correlation_heatmap_tiles(matrix, block=max(len(matrix), 1)))
@@ -1,6 +1,14 @@
 import json
+from datetime import date, datetime
 from pathlib import Path
-from dataclasses import asdict, is_dataclass
+from dataclasses import is_dataclass
+from typing import Any, Dict, Iterator, Optional
+
+from dataprofiler.model import CorrelationMatrix, CorrelationPairs
+from .serialize import shallow_fields, write_json, write_msgpack
+
+_PER_COLUMN_SECTIONS = {"numeric_columns", "categorical_columns", "datetime_columns"}
+_PARQUET_FIELDS = ("section", "column", "metric", "key", "index", "value", "text")
 
 
 def export_html(html: str, path: str) -> str:
@@ -10,17 +18,99 @@ def export_html(html: str, path: str) -> str:
     return str(p)
 
 
-def export_json(profile_result, path: str) -> str:
-    p = Path(path)
-    p.parent.mkdir(parents=True, exist_ok=True)
-    if is_dataclass(profile_result):
-        data = asdict(profile_result)
-    else:
+def export_json(
+    profile_result, path: str, indent: Optional[int] = None, compression: Optional[str] = "infer", arrays: str = "list"
+) -> str:
+    if not is_dataclass(profile_result):
         try:
-            data = profile_result.as_dict()
+            profile_result = profile_result.as_dict()
         except Exception:
-            data = {}
-    p.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+            profile_result = {}
+    return write_json(profile_result, path, indent=indent, compression=compression, arrays=arrays)
+
+
+def export_msgpack(profile_result, path: str, compression: Optional[str] = "infer") -> str:
+    if not is_dataclass(profile_result):
+        profile_result = profile_result.as_dict()
+    return write_msgpack(profile_result, path, compression=compression)
+
+
+def _leaf(value: Any) -> Dict[str, Any]:
+    if value is None:
+        return {"value": None, "text": None}
+    if isinstance(value, (bool, int, float)) or hasattr(value, "dtype"):
+        try:
+            return {"value": float(value), "text": None}
+        except (TypeError, ValueError):
+            pass
+    if isinstance(value, (datetime, date)):
+        return {"value": None, "text": value.isoformat()}
+    if isinstance(value, (list, tuple, dict)):
+        return {"value": None, "text": json.dumps(value, default=str)}
+    return {"value": None, "text": str(value)}
+
+
+def _flatten(
+    node: Any, section: str, column: Optional[str], metric: Optional[str] = None, key: Optional[str] = None, index: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    # Dicts of plain values become ``key`` rows under their metric, lists
+    # of plain values become ``index`` rows; anything deeper extends the
+    # dotted metric name.
+    if isinstance(node, (CorrelationMatrix, CorrelationPairs)):
+        node = node.to_dict()
+    elif is_dataclass(node) and not isinstance(node, type):
+        node = shallow_fields(node)
+    if isinstance(node, dict) and key is None:
+        leafy = all(not isinstance(v, (dict, CorrelationMatrix, CorrelationPairs)) for v in node.values())
+        for k, v in node.items():
+            if leafy and metric is not None:
+                yield from _flatten(v, section, column, metric, str(k), index)
+            else:
+                yield from _flatten(v, section, column, str(k) if metric is None else f"{metric}.{k}", key, index)
+    elif isinstance(node, (list, tuple)) and index is None:
+        for i, v in enumerate(node):
+            yield from _flatten(v, section, column, metric, key, i)
+    else:
+        yield {"section": section, "column": column, "metric": metric, "key": key, "index": index, **_leaf(node)}
+
+
+def profile_rows(profile_result) -> Iterator[Dict[str, Any]]:
+    data = shallow_fields(profile_result) if is_dataclass(profile_result) else profile_result.as_dict()
+    for section, node in data.items():
+        if section in _PER_COLUMN_SECTIONS:
+            for column, stats in node.items():
+                yield from _flatten(stats, section, str(column))
+        elif section == "correlations":
+            for matrix, rows in shallow_fields(node).items():
+                for column, values in rows.items():
+                    yield from _flatten(values, section, str(column), matrix)
+        else:
+            yield from _flatten(node, section, None)
+
+
+def export_parquet(profile_result, path: str) -> str:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except Exception as e:
+        raise ImportError("pyarrow is required for Parquet export. Install with `pip install pyarrow`.") from e
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    columns: Dict[str, list] = {name: [] for name in _PARQUET_FIELDS}
+    for row in profile_rows(profile_result):
+        for name in _PARQUET_FIELDS:
+            columns[name].append(row[name])
+    schema = pa.schema([
+        ("section", pa.string()),
+        ("column", pa.string()),
+        ("metric", pa.string()),
+        ("key", pa.string()),
+        ("index", pa.int32()),
+        ("value", pa.float64()),
+        ("text", pa.string()),
+    ])
+    table = pa.Table.from_pydict(columns, schema=schema)
+    pq.write_table(table, str(p), compression="zstd")
     return str(p)
 
 
@@ -0,0 +1,215 @@
+import base64
+import gzip
+import json
+from contextlib import contextmanager
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime, time, timedelta
+from functools import partial
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Optional
+import numpy as np
+import pandas as pd
+
+_COMPRESSION_SUFFIXES = {".gz": "gzip", ".gzip": "gzip", ".zst": "zstd", ".zstd": "zstd"}
+# Mappings are streamed entry by entry down to this depth (e.g.
+# correlations -> pearson_matrix -> values), below it values are encoded whole
+# except 2-D arrays, which go out a row at a time.
+_STREAM_DEPTH = 3
+
+
+def shallow_fields(obj: Any) -> Dict[str, Any]:
+    # Unlike dataclasses.asdict, nothing below the top level is copied.
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
+def _mapping(obj: Any) -> Optional[Dict[Any, Any]]:
+    if isinstance(obj, dict):
+        return obj
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return shallow_fields(obj)
+    return None
+
+
+def _scalar(o: Any) -> Any:
+    if o is pd.NaT or o is None:
+        return None
+    if isinstance(o, np.datetime64):
+        return None if np.isnat(o) else pd.Timestamp(o).isoformat()
+    if isinstance(o, np.timedelta64):
+        return None if np.isnat(o) else pd.Timedelta(o).isoformat()
+    if isinstance(o, np.generic):
+        return o.item()
+    if isinstance(o, (datetime, date, time)):
+        return o.isoformat()
+    if isinstance(o, timedelta):
+        return pd.Timedelta(o).isoformat()
+    return o
+
+
+def _default(binary: bool, arrays: str) -> Callable[[Any], Any]:
+    def default(o: Any) -> Any:
+        mapping = _mapping(o)
+        if mapping is not None:
+            return mapping
+        if isinstance(o, np.ndarray):
+            if binary:
+                return {"dtype": o.dtype.str, "shape": list(o.shape), "data": np.ascontiguousarray(o).tobytes()}
+            if arrays == "base64" and o.dtype.kind in "biuf":
+                data = base64.b64encode(np.ascontiguousarray(o).tobytes()).decode("ascii")
+                return {"__ndarray__": data, "dtype": o.dtype.str, "shape": list(o.shape)}
+            return [_scalar(v) for v in o.tolist()] if o.dtype.kind in "mMO" else o.tolist()
+        if isinstance(o, (pd.Series, pd.Index)):
+            return default(o.to_numpy())
+        if isinstance(o, (set, frozenset)):
+            return sorted(o, key=str)
+        value = _scalar(o)
+        if value is not o:
+            return value
+        return str(o)
+    return default
+
+
+def _key(k: Any) -> Any:
+    k = _scalar(k)
+    return k if isinstance(k, (str, int, float, bool)) or k is None else str(k)
+
+
+def _plain_keys(mapping: Dict[Any, Any]) -> Dict[Any, Any]:
+    # The json encoder rejects NumPy and Timestamp keys outright.
+    if all(type(k) is str for k in mapping):
+        return mapping
+    return {_key(k): v for k, v in mapping.items()}
+
+
+def _json_key(k: Any) -> str:
+    # Same spelling json.dumps gives non-string keys.
+    if isinstance(k, str):
+        return k
+    if k is True or k is False or k is None:
+        return json.dumps(k)
+    return str(k)
+
+
+def iter_json(obj: Any, indent: Optional[int] = None, arrays: str = "list") -> Iterator[str]:
+    """Encodes ``obj`` as JSON fragments; the concatenation is the document."""
+    encode = partial(
+        json.dumps,
+        default=_default(False, arrays),
+        ensure_ascii=False,
+        indent=indent,
+        separators=(",", ":") if indent is None else None,
+    )
+
+    def dumps(value: Any) -> str:
+        try:
+            return encode(value)
+        except TypeError:
+            # Only mappings with NumPy/Timestamp keys end up here.
+            return encode(_as_tree(value))
+
+    if indent is not None:
+        yield dumps(obj)
+        return
+    yield from _stream_json(obj, dumps, _STREAM_DEPTH, arrays == "list")
+
+
+def _stream_json(obj: Any, dumps: Callable[[Any], str], depth: int, split_arrays: bool = True) -> Iterator[str]:
+    if split_arrays and isinstance(obj, np.ndarray) and obj.ndim == 2 and obj.dtype.kind in "biuf":
+        yield "["
+        for i, row in enumerate(obj):
+            yield ("," if i else "") + dumps(row)
+        yield "]"
+        return
+    mapping = _mapping(obj) if depth > 0 else None
+    if not mapping:
+        yield dumps(obj)
+        return
+    yield "{"
+    for i, (k, v) in enumerate(_plain_keys(mapping).items()):
+        yield ("," if i else "") + json.dumps(_json_key(k), ensure_ascii=False) + ":"
+        yield from _stream_json(v, dumps, depth - 1, split_arrays)
+    yield "}"
+
+
+def _as_tree(obj: Any) -> Any:
+    mapping = _mapping(obj)
+    if mapping is not None:
+        return {k: _as_tree(v) for k, v in _plain_keys(mapping).items()}
+    if isinstance(obj, (list, tuple)):
+        return [_as_tree(v) for v in obj]
+    return obj
+
+
+def _require_zstd():
+    try:
+        import zstandard
+    except Exception as e:
+        raise ImportError("zstandard is required for .zst output. Install with `pip install zstandard`.") from e
+    return zstandard
+
+
+def _require_msgpack():
+    try:
+        import msgpack
+    except Exception as e:
+        raise ImportError("msgpack is required for MessagePack export. Install with `pip install msgpack`.") from e
+    return msgpack
+
+
+def resolve_compression(path: str, compression: Optional[str] = "infer") -> Optional[str]:
+    if compression == "infer":
+        return _COMPRESSION_SUFFIXES.get(Path(path).suffix.lower())
+    if compression not in (None, "gzip", "zstd"):
+        raise ValueError(f"Unsupported compression: {compression}")
+    return compression
+
+
+@contextmanager
+def open_output(path: str, compression: Optional[str] = "infer") -> Iterator[BinaryIO]:
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    codec = resolve_compression(path, compression)
+    if codec == "gzip":
+        with gzip.open(p, "wb", compresslevel=6) as f:
+            yield f
+    elif codec == "zstd":
+        zstandard = _require_zstd()
+        with open(p, "wb") as raw, zstandard.ZstdCompressor(level=3).stream_writer(raw, closefd=False) as f:
+            yield f
+    else:
+        with open(p, "wb") as f:
+            yield f
+
+
+def write_json(obj: Any, path: str, indent: Optional[int] = None, compression: Optional[str] = "infer", arrays: str = "list") -> str:
+    with open_output(path, compression) as f:
+        buf = []
+        size = 0
+        for fragment in iter_json(obj, indent, arrays):
+            buf.append(fragment)
+            size += len(fragment)
+            if size >= 1 << 20:
+                f.write("".join(buf).encode("utf-8"))
+                buf, size = [], 0
+        f.write("".join(buf).encode("utf-8"))
+    return str(path)
+
+
+def _pack_stream(obj: Any, packer, write: Callable[[bytes], Any], depth: int) -> None:
+    mapping = _mapping(obj)
+    if mapping is None or depth == 0:
+        write(packer.pack(obj))
+        return
+    mapping = _plain_keys(mapping)
+    write(packer.pack_map_header(len(mapping)))
+    for k, v in mapping.items():
+        write(packer.pack(k))
+        _pack_stream(v, packer, write, depth - 1)
+
+
+def write_msgpack(obj: Any, path: str, compression: Optional[str] = "infer") -> str:
+    msgpack = _require_msgpack()
+    packer = msgpack.Packer(default=_default(True, "list"), use_bin_type=True, datetime=False)
+    with open_output(path, compression) as f:
+        _pack_stream(obj, packer, f.write, _STREAM_DEPTH)
+    return str(path)
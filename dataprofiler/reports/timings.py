@@ -0,0 +1,32 @@
+from typing import List, Optional
+
+from dataprofiler.model import StageTiming
+
+
+def _mib(n: Optional[int]) -> str:
+    return "-" if n is None else f"{n / (1 << 20):.1f}"
+
+
+def format_timings(timings: List[StageTiming], columns: bool = True) -> str:
+    """Plain-text stage table, in the order the stages first ran."""
+    rows = [t for t in timings if columns or t.column is None]
+    header = ("stage", "column", "calls", "wall s", "cpu s", "rows/s", "rss +MiB", "traced MiB")
+    body = [
+        (
+            t.stage,
+            t.column or "",
+            str(t.calls),
+            f"{t.wall_s:.3f}",
+            f"{t.cpu_s:.3f}",
+            "-" if t.rows_per_s is None else f"{t.rows_per_s:,.0f}",
+            _mib(t.peak_rss_delta),
+            _mib(t.traced_peak_delta),
+        )
+        for t in rows
+    ]
+    widths = [max(len(r[i]) for r in [header] + body) for i in range(len(header))]
+    lines = ["  ".join(h.ljust(w) for h, w in zip(header, widths))]
+    lines.append("  ".join("-" * w for w in widths))
+    for r in body:
+        lines.append("  ".join(v.ljust(w) if i < 2 else v.rjust(w) for i, (v, w) in enumerate(zip(r, widths))))
+    return "\n".join(lines)
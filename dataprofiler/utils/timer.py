@@ -1,4 +1,24 @@
+import sys
 import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from dataprofiler.model import StageTiming
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_bytes() -> Optional[int]:
+    if resource is None:
+        return None
+    peak = int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
 
 
 class Timer:
@@ -6,17 +26,150 @@ class Timer:
         self.name = name
         self.start = None
         self.end = None
+        self.cpu_start = None
+        self.cpu_end = None
+        self.rss_start = None
+        self.rss_end = None
+        self.traced_base = None
+        self.traced_peak = None
+        self.rows = None
 
     def __enter__(self):
+        self.rss_start = peak_rss_bytes()
+        if tracemalloc.is_tracing():
+            self.traced_base = tracemalloc.get_traced_memory()[0]
+            self.traced_peak = self.traced_base
+            tracemalloc.reset_peak()
+        self.cpu_start = time.process_time()
         self.start = time.perf_counter()
         return self
 
     def __exit__(self, exc_type, exc, tb):
         self.end = time.perf_counter()
+        self.cpu_end = time.process_time()
+        if self.traced_base is not None and tracemalloc.is_tracing():
+            self.traced_peak = max(self.traced_peak, tracemalloc.get_traced_memory()[1])
+        self.rss_end = peak_rss_bytes()
         return False
 
+    def note_peak(self, peak: int) -> None:
+        # Nested timers reset the tracemalloc peak, so they hand theirs up.
+        if self.traced_peak is not None:
+            self.traced_peak = max(self.traced_peak, peak)
+
     def elapsed(self) -> float:
         if self.start is None:
             return 0.0
         end = self.end if self.end is not None else time.perf_counter()
-        return float(end - self.start)
\ No newline at end of file
+        return float(end - self.start)
+
+    def cpu(self) -> float:
+        if self.cpu_start is None:
+            return 0.0
+        end = self.cpu_end if self.cpu_end is not None else time.process_time()
+        return float(end - self.cpu_start)
+
+    def rss_delta(self) -> Optional[int]:
+        if self.rss_start is None or self.rss_end is None:
+            return None
+        return self.rss_end - self.rss_start
+
+    def traced_delta(self) -> Optional[int]:
+        if self.traced_base is None:
+            return None
+        return self.traced_peak - self.traced_base
+
+
+class StageRecorder:
+    """Aggregates timings per (stage, column); stage names nest with dots."""
+
+    def __init__(self, logger=None):
+        self.logger = logger
+        self._stack: List[Tuple[str, Timer]] = []
+        self._records: Dict[Tuple[str, Optional[str]], StageTiming] = {}
+
+    def prefix(self) -> str:
+        return ".".join(name for name, _ in self._stack)
+
+    @contextmanager
+    def stage(self, name: str, column: Optional[str] = None, rows: Optional[int] = None) -> Iterator[Timer]:
+        full = f"{self.prefix()}.{name}" if self._stack else name
+        if self._stack and tracemalloc.is_tracing():
+            self._stack[-1][1].note_peak(tracemalloc.get_traced_memory()[1])
+        timer = Timer(full)
+        timer.rows = rows
+        self._stack.append((name, timer))
+        try:
+            with timer:
+                yield timer
+        finally:
+            self._stack.pop()
+            if self._stack and timer.traced_peak is not None:
+                self._stack[-1][1].note_peak(timer.traced_peak)
+            self.add(StageTiming(
+                stage=full,
+                column=column,
+                wall_s=timer.elapsed(),
+                cpu_s=timer.cpu(),
+                rows=timer.rows,
+                peak_rss_delta=timer.rss_delta(),
+                peak_rss=timer.rss_end,
+                traced_peak_delta=timer.traced_delta(),
+            ))
+
+    def add(self, record: StageTiming) -> None:
+        key = (record.stage, record.column)
+        prev = self._records.get(key)
+        if prev is None:
+            self._records[key] = record
+        else:
+            prev.calls += record.calls
+            prev.wall_s += record.wall_s
+            prev.cpu_s += record.cpu_s
+            if record.rows is not None:
+                prev.rows = (prev.rows or 0) + record.rows
+            for attr in ("peak_rss_delta", "peak_rss", "traced_peak_delta"):
+                new = getattr(record, attr)
+                if new is not None:
+                    setattr(prev, attr, max(getattr(prev, attr) or 0, new))
+            record = prev
+        record.rows_per_s = record.rows / record.wall_s if record.rows and record.wall_s > 0 else None
+        if self.logger is not None and record.column is None and prev is None:
+            self.logger.info(f"{record.stage}: {record.wall_s:.3f}s wall, {record.cpu_s:.3f}s cpu")
+
+    def timings(self) -> List[StageTiming]:
+        return list(self._records.values())
+
+
+_active: ContextVar[Optional[StageRecorder]] = ContextVar("dataprofiler_stage_recorder", default=None)
+
+
+def active_recorder() -> Optional[StageRecorder]:
+    return _active.get()
+
+
+@contextmanager
+def record_stages(trace_memory: bool = False, logger=None) -> Iterator[StageRecorder]:
+    # tracemalloc slows allocation-heavy code noticeably, so it is opt-in.
+    recorder = StageRecorder(logger)
+    token = _active.set(recorder)
+    started = trace_memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        yield recorder
+    finally:
+        if started:
+            tracemalloc.stop()
+        _active.reset(token)
+
+
+@contextmanager
+def stage(name: str, column: Optional[str] = None, rows: Optional[int] = None) -> Iterator[Optional[Timer]]:
+    """Times a block when a recorder is active; free otherwise."""
+    recorder = _active.get()
+    if recorder is None:
+        yield None
+        return
+    with recorder.stage(name, column, rows) as timer:
+        yield timer